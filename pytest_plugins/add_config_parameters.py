@@ -25,9 +25,12 @@ def pytest_configure(config: Config) -> None:
         return
 
     config.config_path = config.getoption("--config-path")
+    # the autouse fixture is registered only with the option, so it adds no per-class setup when disabled
+    config.pluginmanager.register(AddConfigParameters(), name="add_config_parameters_fixtures")
 
 
-@pytest.fixture(scope="class", autouse=True)
-def add_param_to_class(request: Function) -> None:
-    if getattr(request.config, "_config", None) and getattr(request, "cls", None):
-        request.cls.config = open_json(Path(request.config.config_path))
+class AddConfigParameters:
+    @pytest.fixture(scope="class", autouse=True)
+    def add_param_to_class(self, request: Function) -> None:
+        if getattr(request.config, "_config", None) and getattr(request, "cls", None):
+            request.cls.config = open_json(Path(request.config.config_path))
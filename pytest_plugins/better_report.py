@@ -2,37 +2,62 @@ import json
 import platform
 import sys
 import time
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
+from dataclasses import fields
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 import pytest
 from _pytest.config import Config, Parser
-from _pytest.fixtures import FixtureRequest
 from _pytest.main import Session
 from _pytest.python import Function
 from custom_python_logger import get_logger
-from python_base_toolkit.utils.data_serialization import default_serialize
 
-from pytest_plugins.const import LOGGER_NAME
-from pytest_plugins.models import ExecutionData, ExecutionStatus, TestData
+from pytest_plugins.const import (
+    AGGREGATES_FILENAME,
+    CHECKPOINT_FILENAME,
+    CHECKPOINT_JOURNAL_FILENAME,
+    EXECUTION_RESULTS_FILENAME,
+    FIXTURE_RESULTS_FILENAME,
+    HTML_REPORT_FILENAME,
+    LOGGER_NAME,
+    NDJSON_TEST_RESULTS_FILENAME,
+    TEST_RESULTS_FILENAME,
+)
+from pytest_plugins.models import ExecutionData, ExecutionStatus, ShardPlan, TestData
 from pytest_plugins.models.environment_data import EnvironmentData
-from pytest_plugins.utils.create_report import generate_md_report
-from pytest_plugins.utils.helper import save_as_json, save_as_markdown
+from pytest_plugins.utils.aggregates import ResultAggregates
+from pytest_plugins.utils.checkpoint import Checkpointer
+from pytest_plugins.utils.compression import COMPRESSIONS
+from pytest_plugins.utils.create_report import iter_md_report
+from pytest_plugins.utils.fixture_timings import FIXTURE_TIMINGS_WORKEROUTPUT_KEY, FixtureTimings
+from pytest_plugins.utils.helper import (
+    dataclass_to_dict,
+    save_as_html,
+    save_as_json,
+    save_as_markdown,
+    serialize_data,
+)
+from pytest_plugins.utils.history_store import HISTORY_STORE_FILENAME, HistoryStore
+from pytest_plugins.utils.html_report import iter_html_report
+from pytest_plugins.utils.ndjson import NdjsonWriter
 from pytest_plugins.utils.pytest_helper import (
-    get_pytest_test_name,
-    get_test_full_name,
-    get_test_full_path,
-    get_test_name_without_parameters,
+    build_test_identity,
+    get_test_identity,
+    get_xdist_worker_id,
+    is_xdist_controller,
     log_test_results,
+    unregister_plugin,
 )
-
-EXECUTION_RESULTS_FILENAME = "execution_results.json"
-TEST_RESULTS_FILENAME = "test_results.json"
+from pytest_plugins.utils.serializer import JSON_STYLES, SERIALIZER_BACKENDS, get_serializer
+from pytest_plugins.utils.sharding import SHARD_PLAN_WORKEROUTPUT_KEY
 
 execution_results = {}
 test_results = {}
+streamed_test_statuses = {}  # final status of tests already streamed out of "test_results" (ndjson format)
+streamed_run_indexes = {}  # run_index of the tests streamed out, kept when a test is rerun (ndjson format)
+test_extra_parameters = {}  # --add-parameters fields per test, kept apart from the slotted TestData
 
 logger = get_logger(f"{LOGGER_NAME}.better_report")
 
@@ -55,6 +80,21 @@ def pytest_addoption(parser: Parser) -> None:
     parser.addoption(
         "--md-report", action="store_true", default=False, help="Generate a markdown report of the test results"
     )
+    parser.addoption(
+        "--html-report",
+        action="store_true",
+        default=False,
+        help=f'Generate "{HTML_REPORT_FILENAME}", a single-file HTML report of the test results '
+        "(filter by status / file / marker, sort by duration)",
+    )
+    parser.addoption(
+        "--md-report-max-rows",
+        type=int,
+        action="store",
+        default=None,
+        help="Limit the tests table of the markdown report to N rows: the failures first, then the slowest tests "
+        "(default: every test, in run order)",
+    )
     parser.addoption("--repo-name", action="store", default=None, help="Git Repository Name")
     parser.addoption("--pr-number", action="store", default=None, help="Pull Request Number")
     parser.addoption("--mr-number", action="store", default=None, help="Merge Request Number")
@@ -90,6 +130,72 @@ def pytest_addoption(parser: Parser) -> None:
         default=False,
         help="Print the pytest result for each test after its execution",
     )
+    parser.addoption(
+        "--better-report-format",
+        action="store",
+        choices=("json", "ndjson"),
+        default="json",
+        help='Test results format: "json" keeps all results in memory until the session ends, '
+        '"ndjson" appends one compact record per test to "test_results.ndjson" as soon as it finishes '
+        '(the "test_results.json" file is still produced from it at the end of the session)',
+    )
+    parser.addoption(
+        "--better-report-json-style",
+        action="store",
+        choices=JSON_STYLES,
+        default="pretty",
+        help='Layout of the result files: "pretty" (indented) or "compact" (no whitespace, smaller and faster to write)',
+    )
+    parser.addoption(
+        "--better-report-serializer",
+        action="store",
+        choices=SERIALIZER_BACKENDS,
+        default="json",
+        help='JSON backend used to write the result files: "json" (default) the stdlib, "orjson" (faster, its pretty '
+        'layout is indented by 2 spaces instead of 4) or "auto" which uses orjson when it is installed',
+    )
+    parser.addoption(
+        "--better-report-compression",
+        action="store",
+        choices=tuple(COMPRESSIONS),
+        default=None,
+        help=f'Compress the "{TEST_RESULTS_FILENAME}" file (e.g. "{TEST_RESULTS_FILENAME}.gz"), '
+        '"better_report_compare" and the scripts detect the compression from the file magic bytes. Only the test '
+        f'results are compressed: "{EXECUTION_RESULTS_FILENAME}", "{AGGREGATES_FILENAME}" and '
+        f'"{FIXTURE_RESULTS_FILENAME}" stay plain JSON',
+    )
+    parser.addoption(
+        "--checkpoint-every-tests",
+        type=int,
+        action="store",
+        default=None,
+        help=f'Save a crash-safe "{CHECKPOINT_FILENAME}" of the report state, then append the tests finished since '
+        f'the last checkpoint to "{CHECKPOINT_JOURNAL_FILENAME}" every N finished tests (rebuild the report of an '
+        'interrupted run with "better_report_recover")',
+    )
+    parser.addoption(
+        "--checkpoint-every-seconds",
+        type=float,
+        action="store",
+        default=None,
+        help=f'Append the tests finished since the last checkpoint to "{CHECKPOINT_JOURNAL_FILENAME}" at most every '
+        "T seconds (checked whenever a test finishes)",
+    )
+    parser.addoption(
+        "--fixture-timings",
+        action="store_true",
+        default=False,
+        help=f'Record the setup / teardown time, scope and cache hits of every fixture into "{FIXTURE_RESULTS_FILENAME}" '
+        "(and a slowest fixtures table in the markdown report)",
+    )
+    parser.addoption(
+        "--better-report-history",
+        action="store_true",
+        default=False,
+        help=f'Keep the per-test history of the runs in "{HISTORY_STORE_FILENAME}" under the output dir (EWMA of the '
+        "duration and its variance, the last statuses and the run count), updated at the end of every session "
+        '(read by "--order-by-history" and "--shard-history")',
+    )
     parser.addoption(
         "--log-collected-tests",
         action="store_true",
@@ -101,6 +207,8 @@ def pytest_addoption(parser: Parser) -> None:
 @pytest.hookimpl(tryfirst=True)
 def pytest_configure(config: Config) -> None:
     if not config.getoption("--better-report"):
+        if not config.getoption("--log-collected-tests"):
+            unregister_plugin(config=config, plugin=sys.modules[__name__])
         return
 
     if config.option.output_dir:
@@ -108,6 +216,52 @@ def pytest_configure(config: Config) -> None:
     else:
         config.option.output_dir = Path("results_output")
 
+    if config.getoption("--fixture-timings"):
+        config.pluginmanager.register(FixtureTimings(), name="better_report_fixture_timings")
+
+    if get_xdist_worker_id(config=config):
+        return  # xdist workers ship their results to the controller, which writes all the files
+
+    if is_xdist_controller(config=config):
+        config.pluginmanager.register(XdistControllerReport(config=config), name="better_report_xdist_controller")
+        config.option.output_dir.mkdir(parents=True, exist_ok=True)  # the controller writes the files as tests end
+
+    try:
+        config._better_report_serializer = get_serializer(  # pylint: disable=W0212
+            backend=config.getoption("--better-report-serializer"),
+            pretty=config.getoption("--better-report-json-style") == "pretty",
+            default=serialize_report_data,
+            # the "--add-parameters" fields are merged into the records by serialize_report_data
+            native_dataclasses=not config.getoption("--add-parameters"),
+        )
+    except ModuleNotFoundError as e:
+        raise pytest.UsageError(f"--better-report-serializer: {e}") from e
+
+    if (max_rows := config.getoption("--md-report-max-rows")) is not None and max_rows < 1:
+        raise pytest.UsageError(f"--md-report-max-rows: expected a positive number of rows, got {max_rows}")
+
+    config._better_report_aggregates = ResultAggregates()  # pylint: disable=W0212
+
+    if config.getoption("--better-report-format") == "ndjson":
+        config._better_report_ndjson_writer = NdjsonWriter(  # pylint: disable=W0212
+            path=config.option.output_dir / NDJSON_TEST_RESULTS_FILENAME,
+            default=serialize_report_data,
+            serializer=config._better_report_serializer,  # pylint: disable=W0212
+        )
+
+    every_tests = config.getoption("--checkpoint-every-tests")
+    every_seconds = config.getoption("--checkpoint-every-seconds")
+    if every_tests or every_seconds:
+        config._better_report_checkpointer = Checkpointer(  # pylint: disable=W0212
+            path=config.option.output_dir / CHECKPOINT_FILENAME,
+            journal_path=config.option.output_dir / CHECKPOINT_JOURNAL_FILENAME,
+            every_tests=every_tests,
+            every_seconds=every_seconds,
+            serializer=config._better_report_serializer,  # pylint: disable=W0212
+            # in ndjson format the finished tests are already on disk, only the pending ones are checkpointed
+            state=lambda: {"execution_results": execution_results, "test_results": test_results},
+        )
+
 
 def pytest_sessionstart(session: Session) -> None:
     if not session.config.option.better_report:
@@ -144,16 +298,24 @@ def pytest_sessionstart(session: Session) -> None:
             "raw_args": session.config.invocation_params.args,
         }
 
+    checkpointer = getattr(session.config, "_better_report_checkpointer", None)
+    if checkpointer and is_xdist_controller(config=session.config):
+        _save_base_checkpoint(config=session.config)  # the controller collects no tests: its base is the empty run
+
     logger.debug("Better report: Test session started")
 
 
-def pytest_collection_modifyitems(config: Config, items: list[Function]) -> None:
-    if not config.getoption("--log-collected-tests"):
-        return
+@pytest.hookimpl(hookwrapper=True)
+def pytest_collection_modifyitems(config: Config, items: list[Function]) -> Generator[None, Any, None]:
+    yield
 
+    # every plugin has reordered, deselected and renamed (--verbose-param-ids) the items by now: the identities are
+    # built once here, so the tests never compute them while they run
+    log_collected_tests = config.getoption("--log-collected-tests")
     for item in items:
-        test_full_name = get_test_full_name(item=item)
-        logger.debug(f"Collected test: {test_full_name}")
+        identity = build_test_identity(item=item)
+        if log_collected_tests:
+            logger.debug(f"Collected test: {identity.test_full_name}")
 
 
 @pytest.hookimpl(tryfirst=True)
@@ -161,39 +323,140 @@ def pytest_report_collectionfinish(config: Config, items: list[Function]) -> Non
     if not config.option.better_report:
         return
 
-    for item in items:
-        test_name = get_test_name_without_parameters(item=item)
-        test_full_name = get_test_full_name(item=item)
-        test_results[test_full_name] = TestData(
-            class_test_name=item.cls.__name__ if item.cls else None,
-            test_name=test_name,
-            pytest_test_name=get_pytest_test_name(item=item),
-            test_full_name=test_full_name,
-            test_full_path=get_test_full_path(item=item),
-            test_file_name=item.fspath.basename,
-            test_parameters=item.callspec.params if getattr(item, "callspec", None) else None,
-            test_markers=[marker.name for marker in item.iter_markers() if not marker.args],
-            test_status=ExecutionStatus.COLLECTED,
-            test_start_time=None,
-            run_index=len(test_results) + 1,
-        )
-        if getattr(item, "callspec", None) and config.getoption("--add-parameters"):
-            test_results[test_full_name].__dict__.update(**item.callspec.params)
+    for run_index, item in enumerate(items, start=1):
+        test_results[get_test_identity(item=item).test_full_name] = _build_test_data(item=item, run_index=run_index)
+    execution_results["execution_info"].test_list = list(test_results.keys())
+    execution_results["execution_info"].shard_plan = getattr(config, "_shard_plan", None)
+    if getattr(config, "_better_report_checkpointer", None):
+        _save_base_checkpoint(config=config)
     logger.debug(
-        f"Tests to be executed: \n{json.dumps(list(test_results.keys()), indent=4, default=default_serialize)}"
+        f"Tests to be executed: \n{json.dumps(list(test_results.keys()), indent=4, default=serialize_report_data)}"
     )
     time.sleep(0.3)  # Sleep to ensure the debug log is printed before the tests start
 
 
-@pytest.fixture(scope="session", autouse=True)
-def session_setup_teardown(request: FixtureRequest) -> Generator[None, Any, None]:
-    yield
-
-    if not request.config.option.better_report:
-        return
-
+def _save_base_checkpoint(config: Config) -> None:
+    config._better_report_checkpointer.save()  # pylint: disable=W0212
+    if writer := getattr(config, "_better_report_ndjson_writer", None):
+        # the ndjson file is the journal of the finished tests: it starts with the base, so a recovery never merges
+        # the records a previous run left in the output dir
+        writer.open()
+
+
+def serialize_report_data(obj: object) -> object:
+    if isinstance(obj, TestData):
+        return dataclass_to_dict(obj) | test_extra_parameters.get(obj.test_full_name, {})
+    return serialize_data(obj)
+
+
+def _build_test_data(item: Function, run_index: int) -> TestData:
+    identity = get_test_identity(item=item)
+    # strings shared by many tests (file, class, parametrized test, markers) are interned to be stored once
+    test_data = TestData(
+        worker_id=get_xdist_worker_id(config=item.config),
+        class_test_name=sys.intern(item.cls.__name__) if item.cls else None,
+        test_name=sys.intern(identity.test_name),
+        pytest_test_name=identity.pytest_test_name,
+        test_full_name=identity.test_full_name,
+        test_full_path=identity.test_full_path,
+        test_file_name=sys.intern(item.fspath.basename),
+        test_parameters=item.callspec.params if getattr(item, "callspec", None) else None,
+        test_markers=[sys.intern(marker.name) for marker in item.iter_markers() if not marker.args],
+        test_status=ExecutionStatus.COLLECTED,
+        test_start_time=None,
+        run_index=run_index,
+    )
+    if getattr(item, "callspec", None) and item.config.getoption("--add-parameters"):
+        test_extra_parameters[test_data.test_full_name] = item.callspec.params
+    return test_data
+
+
+def _on_test_finished(config: Config, test_full_name: str) -> None:
+    if aggregates := getattr(config, "_better_report_aggregates", None):
+        aggregates.add(test_data=test_results[test_full_name])  # per-file / per-class totals, kept up to date
+
+    checkpointer = getattr(config, "_better_report_checkpointer", None)
+    if writer := getattr(config, "_better_report_ndjson_writer", None):
+        # Append the finished test to the ndjson file and drop it from memory
+        test_item = test_results.pop(test_full_name)
+        writer.write(key=test_full_name, record=test_item)
+        streamed_test_statuses[test_full_name] = test_item.test_status
+        streamed_run_indexes[test_full_name] = test_item.run_index
+        test_extra_parameters.pop(test_full_name, None)
+        if checkpointer:
+            checkpointer.tick()  # the ndjson file is the journal of the finished tests
+    elif checkpointer:
+        checkpointer.tick(record=test_results[test_full_name])  # journaled at the next checkpoint
+
+
+def _test_data_from_record(record: dict) -> TestData:
+    """Rebuild a TestData from its serialized record (as shipped by an xdist worker)."""
+    known_fields = {f.name for f in fields(TestData)}
+    test_data = TestData(**{k: v for k, v in record.items() if k in known_fields})
+    test_data.test_status = ExecutionStatus(test_data.test_status)
+    test_data.test_file_name = sys.intern(test_data.test_file_name)
+    test_data.test_name = sys.intern(test_data.test_name)
+    if extra_parameters := {k: v for k, v in record.items() if k not in known_fields}:  # --add-parameters
+        test_extra_parameters[test_data.test_full_name] = extra_parameters
+    return test_data
+
+
+class XdistControllerReport:
+    """Collects the test results shipped by the xdist workers into the controller's report."""
+
+    def __init__(self, config: Config) -> None:
+        self.config = config
+        self.worker_ids: set[str] = set()
+        self.test_intervals: list[tuple[float, float]] = []  # (start, end) timestamps, for the real concurrency
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        if not (record := getattr(report, "better_report_test_data", None)):
+            return
+
+        test_item = _test_data_from_record(record=record)
+        test_item.run_index = len(test_results) + len(streamed_test_statuses) + 1
+        test_results[test_item.test_full_name] = test_item
+        self.worker_ids.add(test_item.worker_id)
+        if test_item.test_start_time and test_item.test_end_time:
+            self.test_intervals.append(
+                (
+                    datetime.fromisoformat(test_item.test_start_time).timestamp(),
+                    datetime.fromisoformat(test_item.test_end_time).timestamp(),
+                )
+            )
+        _on_test_finished(config=self.config, test_full_name=test_item.test_full_name)
+
+    @pytest.hookimpl
+    def pytest_testnodedown(self, node: Any, error: Any) -> None:  # pylint: disable=W0613
+        fixture_timings = self.config.pluginmanager.get_plugin("better_report_fixture_timings")
+        if fixture_timings and (data := getattr(node, "workeroutput", {}).get(FIXTURE_TIMINGS_WORKEROUTPUT_KEY)):
+            fixture_timings.merge(data=data)
+        if data := getattr(node, "workeroutput", {}).get(SHARD_PLAN_WORKEROUTPUT_KEY):
+            execution_results["execution_info"].shard_plan = ShardPlan(**data)  # the same plan on every worker
+
+    def update_execution_info(self, exec_info: ExecutionData) -> None:
+        exec_info.test_list = list(test_results.keys()) + [n for n in streamed_test_statuses if n not in test_results]
+        exec_info.worker_count = len(self.worker_ids)
+        exec_info.peak_concurrency = get_peak_concurrency(intervals=self.test_intervals)
+        if exec_info.execution_duration_sec:
+            busy_time = sum(end - start for start, end in self.test_intervals)
+            exec_info.average_concurrency = round(busy_time / exec_info.execution_duration_sec, 2)
+
+
+def get_peak_concurrency(intervals: list[tuple[float, float]]) -> int:
+    """Maximum number of tests that were running at the same moment."""
+    events = sorted([(start, 1) for start, _ in intervals] + [(end, -1) for _, end in intervals])
+    running = peak = 0
+    for _, delta in events:  # at equal timestamps an end (-1) sorts before a start (+1)
+        running += delta
+        peak = max(peak, running)
+    return peak
+
+
+def _save_report(config: Config) -> None:
     if not (exec_info := execution_results.get("execution_info")):
-        logger.error("Execution info missing at session teardown")
+        logger.error("Execution info missing at session finish")
         return
 
     # update execution end time
@@ -215,50 +478,91 @@ def session_setup_teardown(request: FixtureRequest) -> Generator[None, Any, None
         ExecutionStatus.SKIPPED,
         ExecutionStatus.XFAIL,
         ExecutionStatus.FAILED_SKIPPED,
+        ExecutionStatus.CACHED_PASS,
     ]
-    if not request.config.getoption("--pytest-xfail-strict"):
+    if not config.getoption("--pytest-xfail-strict"):
         _test_pass_status_list.append(ExecutionStatus.XPASS)
     # logger.debug(f"Test pass status list: {_test_pass_status_list}")
+    test_statuses = [t.test_status for t in test_results.values()] + list(streamed_test_statuses.values())
     exec_info.execution_status = (
         ExecutionStatus.PASSED
-        if all(t.test_status in _test_pass_status_list for t in test_results.values())
+        if all(status in _test_pass_status_list for status in test_statuses)
         else ExecutionStatus.FAILED
     )
     # for t in test_results.values():
     #     if t.test_status not in _test_pass_status_list:
     #         logger.debug(f"Non-passing test found: {t.test_full_name} with status {t.test_status}")
 
-    exec_info.test_list = list(test_results.keys())
+    if xdist_controller := config.pluginmanager.get_plugin("better_report_xdist_controller"):
+        xdist_controller.update_execution_info(exec_info=exec_info)
 
-    output_dir = request.config.option.output_dir
+    if exec_info.shard_plan:
+        exec_info.shard_plan.actual_duration_sec = round(
+            config._better_report_aggregates.get_total_duration_sec(), 4  # pylint: disable=W0212
+        )
+
+    output_dir = config.option.output_dir
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    save_as_json(path=output_dir / EXECUTION_RESULTS_FILENAME, data=execution_results, default=default_serialize)
-    save_as_json(path=output_dir / TEST_RESULTS_FILENAME, data=test_results, default=default_serialize)
+    serializer = config._better_report_serializer  # pylint: disable=W0212
+    save_as_json(path=output_dir / EXECUTION_RESULTS_FILENAME, data=execution_results, serializer=serializer)
+    compression = config.getoption("--better-report-compression")
+    if writer := getattr(config, "_better_report_ndjson_writer", None):
+        test_results_path = writer.finalize_to_json(
+            path=output_dir / TEST_RESULTS_FILENAME,
+            pending=test_results,
+            compression=compression,
+            order=execution_results["execution_info"].test_list,  # the collection order, like the json format
+        )
+    else:
+        test_results_path = save_as_json(
+            path=output_dir / TEST_RESULTS_FILENAME, data=test_results, serializer=serializer, compression=compression
+        )
+    if fixture_timings := config.pluginmanager.get_plugin("better_report_fixture_timings"):
+        save_as_json(
+            path=output_dir / FIXTURE_RESULTS_FILENAME,
+            data=fixture_timings.get_fixture_results(),
+            serializer=serializer,
+        )
+    save_as_json(
+        path=output_dir / AGGREGATES_FILENAME,
+        data=config._better_report_aggregates.to_dict(),  # pylint: disable=W0212
+        serializer=serializer,
+    )
+    if config.getoption("--better-report-history"):
+        with HistoryStore(path=output_dir / HISTORY_STORE_FILENAME) as history_store:
+            # the finished tests are already indexed by the aggregates, no rescan of the results
+            results = config._better_report_aggregates.get_results()  # pylint: disable=W0212
+            history_store.update((path, status, duration) for path, (status, duration) in results.items())
+    if checkpointer := getattr(config, "_better_report_checkpointer", None):
+        checkpointer.discard()  # the final result files supersede the last checkpoint
     logger.info(f"Better report: Execution results saved to {output_dir / EXECUTION_RESULTS_FILENAME}")
-    logger.info(f"Better report: Test results saved to {output_dir / TEST_RESULTS_FILENAME}'")
+    logger.info(f"Better report: Test results saved to {test_results_path}")
 
 
 @pytest.hookimpl(hookwrapper=True, tryfirst=True)
 def pytest_runtest_makereport(item: Function, call: Any) -> Generator[None, Any, None]:  # pylint: disable=R1260, R0912
     if not item.config.option.better_report:
-        logger.debug("Better report plugin is not enabled, skipping session start processing")
         yield
         return
 
-    test_full_name = get_test_full_name(item=item)
+    test_full_name = get_test_identity(item=item).test_full_name
     test_item = test_results.get(test_full_name)
 
-    if call.when == "setup":
-        test_full_name = get_test_full_name(item=item)
-        test_results[test_full_name].test_start_time = datetime.now(UTC).isoformat()
-
     if call.excinfo and call.excinfo.typename == ExecutionStatus.SKIPPED.value.title():
         test_item.test_status = ExecutionStatus.SKIPPED
 
     outcome = yield
     report = outcome.get_result()
 
+    if report.when == "teardown" and get_xdist_worker_id(config=item.config) and test_item:
+        # the test is complete, ship it to the xdist controller with the teardown report
+        report.better_report_test_data = json.loads(
+            json.dumps(test_results.pop(test_full_name), default=serialize_report_data)
+        )
+        test_extra_parameters.pop(test_full_name, None)
+        return
+
     if report.when != "call" or not item.config.option.better_report:
         return
 
@@ -301,39 +605,111 @@ def pytest_runtest_makereport(item: Function, call: Any) -> Generator[None, Any,
         test_item.exception_message = None
 
 
-def pytest_runtest_teardown(item: Function) -> None:
+def _elapsed_sec(start_ns: int) -> float:
+    return (time.perf_counter_ns() - start_ns) / 1e9
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item: Function) -> Generator[None, Any, None]:
     if not item.config.option.better_report:
+        yield
         return
 
-    test_full_name = get_test_full_name(item=item)
-    if not (test_item := test_results[test_full_name]):
+    test_full_name = get_test_identity(item=item).test_full_name
+    if not (test_item := test_results.get(test_full_name)):  # already streamed out (e.g. rerun in ndjson format)
+        run_index = streamed_run_indexes.get(test_full_name)
+        test_item = test_results[test_full_name] = _build_test_data(item=item, run_index=run_index)
+    test_item.test_start_time = datetime.now(UTC).isoformat()
+
+    start_ns = time.perf_counter_ns()
+    yield
+    test_item.setup_duration_sec = _elapsed_sec(start_ns=start_ns)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: Function) -> Generator[None, Any, None]:
+    if not item.config.option.better_report:
+        yield
+        return
+
+    start_ns = time.perf_counter_ns()
+    yield
+    if test_item := test_results.get(get_test_identity(item=item).test_full_name):
+        test_item.call_duration_sec = _elapsed_sec(start_ns=start_ns)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item: Function) -> Generator[None, Any, None]:
+    if not item.config.option.better_report:
+        yield
+        return
+
+    start_ns = time.perf_counter_ns()
+    yield
+    teardown_duration_sec = _elapsed_sec(start_ns=start_ns)
+
+    test_full_name = get_test_identity(item=item).test_full_name
+    if not (test_item := test_results.get(test_full_name)):
         logger.warning(f"Test {test_full_name} missing in test_results during teardown")
         return
 
+    # durations are measured with the monotonic perf counter, the start / end times are wall-clock timestamps only
+    test_item.teardown_duration_sec = teardown_duration_sec
     test_item.test_end_time = datetime.now(UTC).isoformat()
-    if test_item.test_start_time:  # Add test duration only if start time is set
-        try:
-            start_obj = datetime.fromisoformat(test_item.test_start_time)
-            end_obj = datetime.fromisoformat(test_item.test_end_time)
-            test_item.test_duration_sec = (end_obj - start_obj).total_seconds()
-        except Exception as e:
-            logger.error(f"Error computing test duration for {test_full_name}: {e}")
+    phase_durations = (test_item.setup_duration_sec, test_item.call_duration_sec, test_item.teardown_duration_sec)
+    test_item.test_duration_sec = sum(duration for duration in phase_durations if duration is not None)
 
     if item.config.getoption("--result-each-test"):
         log_test_results(item=item, test_results=test_results)
 
+    if not get_xdist_worker_id(config=item.config):
+        _on_test_finished(config=item.config, test_full_name=test_full_name)
+
+
+def _iter_report(config: Config) -> Iterable[TestData | dict]:
+    if writer := getattr(config, "_better_report_ndjson_writer", None):
+        # the streamed records, one line at a time, in the collection order
+        return writer.iter_records(pending=test_results, order=execution_results["execution_info"].test_list)
+    return test_results.values()
+
+
+def _html_report_title(session: Session) -> str:
+    if repo_name := session.config.getoption("--repo-name"):
+        return f"Test Report - {repo_name}"
+    return "Test Report"
+
 
 def pytest_sessionfinish(session: Session) -> None:
     if session.config.getoption("--collect-only") or not session.config.option.better_report:
         return
 
+    if not get_xdist_worker_id(config=session.config):
+        _save_report(config=session.config)
+
     exit_status_code = session.session.exitstatus
     logger.info(f"Test session finished with exit status: {exit_status_code}")
     if exit_status_code != 0:
-        failed_tests = [v for v in test_results.values() if v.test_status == ExecutionStatus.FAILED]
-        logger.debug(f"Failed tests: {json.dumps(failed_tests, indent=4, default=default_serialize)}")
+        failed_tests = [v for v in test_results.values() if v.test_status == ExecutionStatus.FAILED] + [
+            name for name, status in streamed_test_statuses.items() if status == ExecutionStatus.FAILED
+        ]
+        logger.debug(f"Failed tests: {json.dumps(failed_tests, indent=4, default=serialize_report_data)}")
+
+    if get_xdist_worker_id(config=session.config):
+        return
 
+    output_dir = session.config.option.output_dir
     if session.config.getoption("--md-report"):
-        output_dir = session.config.option.output_dir
-        res_md = generate_md_report(report=json.loads(json.dumps(test_results, default=default_serialize)))
-        save_as_markdown(path=Path(output_dir / "test_report.md"), data=res_md)
+        fixture_results = None
+        if fixture_timings := session.config.pluginmanager.get_plugin("better_report_fixture_timings"):
+            fixture_results = {k: dataclass_to_dict(v) for k, v in fixture_timings.get_fixture_results().items()}
+        res_md = iter_md_report(
+            report=_iter_report(config=session.config),
+            fixture_results=fixture_results,
+            max_rows=session.config.getoption("--md-report-max-rows"),
+            aggregates=session.config._better_report_aggregates,  # pylint: disable=W0212
+        )
+        save_as_markdown(path=Path(output_dir / "test_report.md"), data=res_md)  # streamed, never joined in memory
+
+    if session.config.getoption("--html-report"):
+        res_html = iter_html_report(report=_iter_report(config=session.config), title=_html_report_title(session))
+        save_as_html(path=Path(output_dir / HTML_REPORT_FILENAME), data=res_html)  # streamed like the markdown
@@ -1,99 +1,580 @@
 """
-CLI tool to compare two better-report JSON log files.
+CLI tool to compare two better-report JSON log files (plain or gzip / lzma / bz2 compressed).
 
 Checks if all pytest_test_name entries are equal, lists missing tests from each file,
 and for matching tests compares their test_status and lists all diffs.
 
+Duration mode (--duration-threshold-pct / --duration-threshold-sec) also lists the common tests that got slower,
+the largest regressions first.
+
+The result is printed as text, or as json / ndjson / markdown (--output-format) for a CI bot to post it as is;
+it is rendered in full and written at once, to stdout or to --output.
+
+Directory mode (--dir-a / --dir-b) pairs the test results files of two directory trees (e.g. one results_output
+per shard) by their relative directory, compares all the pairs in a worker pool and reports one aggregated summary.
+
+N-way mode (--files / --runs-dir) builds a test-by-run status matrix of many runs and lists the flaky tests:
+their status flips between consecutive runs, failure rate and the runs where the status changed.
+
 Usage:
-    python better_report_compare.py -a <file_a.json> -b <file_b.json> [--fail-on-diff]
+    python better_report_compare.py -a <file_a.json> -b <file_b.json> [--fail-on-diff] [--timings]
+    python better_report_compare.py -a <file_a.json> -b <file_b.json> --duration-threshold-pct 50 \
+        --duration-threshold-sec 1 [--top-regressions 20] [--fail-on-diff]
+    python better_report_compare.py -a <file_a.json> -b <file_b.json> --output-format json|ndjson|markdown \
+        [--output <path>]
+    python better_report_compare.py --dir-a <results tree A> --dir-b <results tree B> [--fail-on-diff] \
+        [--output-format ...]
+    python better_report_compare.py --files <run_1.json> <run_2.json> ... [--fail-on-diff]
+    python better_report_compare.py --runs-dir <dir with a results_output per run> [--fail-on-diff]
 """
 
+import heapq
 import json
+import math
 import os
 import sys
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import get_context
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
+import numpy as np
 from python_base_command import BaseCommand, CommandError, CommandParser
 
+from pytest_plugins.const import TEST_RESULTS_FILENAME
+from pytest_plugins.utils.compression import COMPRESSIONS, compressed_path, open_for_read
+from pytest_plugins.utils.json_stream import iter_json_object_items
+from pytest_plugins.utils.status_matrix import (
+    FlakinessResult,
+    build_status_matrix,
+    comparable_status,
+    encode_statuses,
+    get_flakiness,
+)
+
 PASS_SYMBOL = "✓"
 FAIL_SYMBOL = "✗"
 DIFF_SYMBOL = "≠"
 
 SEP = "─" * 100
 
+PROCESS_POOL_MIN_BYTES = 32 * 2**20  # from this file size the reports are loaded in worker processes
+MAX_LOADING_THREADS = 8
+DEFAULT_TOP_REGRESSIONS = 20
+
+
+@dataclass(slots=True)
+class DurationRegression:
+    test_name: str
+    duration_a: float
+    duration_b: float
+
+    @property
+    def increase_sec(self) -> float:
+        return self.duration_b - self.duration_a
+
+    @property
+    def increase_pct(self) -> float:
+        return self.increase_sec / self.duration_a * 100 if self.duration_a else math.inf
+
+
+@dataclass(slots=True)
+class ComparisonResult:
+    file_a: Path
+    file_b: Path
+    total_a: int
+    total_b: int
+    common_count: int
+    only_in_a: list[str]
+    only_in_b: list[str]
+    status_diffs: list[tuple[str, str, str]]
+    test_file_name: str | None = None
+    duration_regressions_count: int | None = None  # None when the durations were not compared
+    duration_regressions: list[DurationRegression] = field(default_factory=list)
+    threshold_pct: float | None = None
+    threshold_sec: float | None = None
+
+    @property
+    def identical(self) -> bool:
+        return not (self.only_in_a or self.only_in_b or self.status_diffs or self.duration_regressions_count)
+
+
+def _format_thresholds(threshold_pct: float | None, threshold_sec: float | None) -> str:
+    return " and ".join(
+        threshold
+        for threshold in (
+            f"+{threshold_pct:g}%" if threshold_pct is not None else None,
+            f"+{threshold_sec:g}s" if threshold_sec is not None else None,
+        )
+        if threshold
+    )
+
 
-def _log_missing(missing: list[str], source: str, target: str) -> None:
+def _text_missing(lines: list[str], missing: list[str], source: str, target: str) -> None:
     if missing:
-        print(f"\n{FAIL_SYMBOL}  Tests in {source} but MISSING from {target}  ({len(missing)})")
-        for name in missing:
-            print(f"     - {name}")
+        lines.append(f"\n{FAIL_SYMBOL}  Tests in {source} but MISSING from {target}  ({len(missing)})")
+        lines.extend(f"     - {name}" for name in missing)
     else:
-        print(f"\n{PASS_SYMBOL}  No tests missing from {target}")
+        lines.append(f"\n{PASS_SYMBOL}  No tests missing from {target}")
 
 
-def _log_status_diffs(status_diffs: list[tuple[str, str, str]]) -> None:
+def _text_status_diffs(lines: list[str], status_diffs: list[tuple[str, str, str]]) -> None:
     if status_diffs:
         col_w = max(len(name) for name, _, _ in status_diffs)
-        print(f"\n{DIFF_SYMBOL}  Status differences in common tests  ({len(status_diffs)})")
-        print(f"     {'TEST NAME':<{col_w}}  {'STATUS IN A':<12}  STATUS IN B")
-        print("     " + "-" * (col_w + 28))
-        for name, s_a, s_b in status_diffs:
-            print(f"     {name:<{col_w}}  {s_a:<12}  {s_b}")
+        lines.append(f"\n{DIFF_SYMBOL}  Status differences in common tests  ({len(status_diffs)})")
+        lines.append(f"     {'TEST NAME':<{col_w}}  {'STATUS IN A':<12}  STATUS IN B")
+        lines.append("     " + "-" * (col_w + 28))
+        lines.extend(f"     {name:<{col_w}}  {s_a:<12}  {s_b}" for name, s_a, s_b in status_diffs)
     else:
-        print(f"\n{PASS_SYMBOL}  All common tests have identical statuses")
+        lines.append(f"\n{PASS_SYMBOL}  All common tests have identical statuses")
 
 
-def _log_summary(
-    file_a: Path,
-    file_b: Path,
-    total_a: int,
-    total_b: int,
-    common_count: int,
-    only_in_a: list[str],
-    only_in_b: list[str],
-    status_diffs: list[tuple[str, str, str]],
-    test_file_name: str | None = None,
+def _text_duration_regressions(lines: list[str], result: ComparisonResult) -> None:
+    thresholds = _format_thresholds(threshold_pct=result.threshold_pct, threshold_sec=result.threshold_sec)
+    if not result.duration_regressions_count:
+        lines.append(f"\n{PASS_SYMBOL}  No duration regressions (threshold: {thresholds})")
+        return
+
+    regressions = result.duration_regressions
+    col_w = max(len(regression.test_name) for regression in regressions)
+    lines.append(
+        f"\n{FAIL_SYMBOL}  Duration regressions (threshold: {thresholds})  ({result.duration_regressions_count}, "
+        f"top {len(regressions)} slowest)"
+    )
+    lines.append(
+        f"     {'TEST NAME':<{col_w}}  {'DURATION A':>10}  {'DURATION B':>10}  {'INCREASE':>10}  {'INCREASE %':>10}"
+    )
+    lines.append("     " + "-" * (col_w + 50))
+    lines.extend(
+        f"     {regression.test_name:<{col_w}}  {regression.duration_a:>9.2f}s  {regression.duration_b:>9.2f}s  "
+        f"{regression.increase_sec:>+9.2f}s  {regression.increase_pct:>+9.0f}%"
+        for regression in regressions
+    )
+
+
+def render_text(result: ComparisonResult) -> str:
+    lines = [
+        f"\n{SEP}",
+        "  BETTER-REPORT COMPARISON",
+        SEP,
+        f"  File A : {result.file_a}",
+        f"  File B : {result.file_b}",
+    ]
+    if result.test_file_name:
+        lines.append(f"  Filter : test_file_name = {result.test_file_name}")
+    lines.append(f"  Tests  : {result.total_a} in A  |  {result.total_b} in B  |  {result.common_count} in common")
+    lines.append(SEP)
+
+    _text_missing(lines, result.only_in_a, source="A", target="B")
+    _text_missing(lines, result.only_in_b, source="B", target="A")
+    _text_status_diffs(lines, result.status_diffs)
+    if result.duration_regressions_count is not None:
+        _text_duration_regressions(lines, result)
+
+    lines.append(f"\n{SEP}")
+    lines.append("  RESULT: REPORTS ARE IDENTICAL" if result.identical else "  RESULT: DIFFERENCES FOUND")
+    lines.append(f"{SEP}\n")
+    return "\n".join(lines) + "\n"
+
+
+def _regression_to_dict(regression: DurationRegression) -> dict:
+    increase_pct = regression.increase_pct
+    return {
+        "test_name": regression.test_name,
+        "duration_a": regression.duration_a,
+        "duration_b": regression.duration_b,
+        "increase_sec": round(regression.increase_sec, 6),
+        "increase_pct": round(increase_pct, 2) if math.isfinite(increase_pct) else None,  # None: was 0s in A
+    }
+
+
+def _summary_to_dict(result: ComparisonResult) -> dict:
+    return {
+        "file_a": str(result.file_a),
+        "file_b": str(result.file_b),
+        "test_file_name": result.test_file_name,
+        "total_a": result.total_a,
+        "total_b": result.total_b,
+        "common_count": result.common_count,
+        "missing_in_a_count": len(result.only_in_b),
+        "missing_in_b_count": len(result.only_in_a),
+        "status_diffs_count": len(result.status_diffs),
+        "duration_regressions_count": result.duration_regressions_count,
+        "duration_threshold_pct": result.threshold_pct,
+        "duration_threshold_sec": result.threshold_sec,
+        "identical": result.identical,
+    }
+
+
+def _comparison_to_dict(result: ComparisonResult) -> dict:
+    return _summary_to_dict(result) | {
+        "missing_in_a": result.only_in_b,
+        "missing_in_b": result.only_in_a,
+        "status_diffs": [
+            {"test_name": name, "status_a": s_a, "status_b": s_b} for name, s_a, s_b in result.status_diffs
+        ],
+        "duration_regressions": [_regression_to_dict(regression) for regression in result.duration_regressions],
+    }
+
+
+def render_json(result: ComparisonResult) -> str:
+    return json.dumps(_comparison_to_dict(result), indent=4) + "\n"
+
+
+def _difference_records(result: ComparisonResult) -> Iterator[dict]:
+    yield from ({"type": "missing_in_a", "test_name": name} for name in result.only_in_b)
+    yield from ({"type": "missing_in_b", "test_name": name} for name in result.only_in_a)
+    yield from (
+        {"type": "status_diff", "test_name": name, "status_a": s_a, "status_b": s_b}
+        for name, s_a, s_b in result.status_diffs
+    )
+    yield from (
+        {"type": "duration_regression"} | _regression_to_dict(regression) for regression in result.duration_regressions
+    )
+
+
+def render_ndjson(result: ComparisonResult) -> str:
+    """One record per line, each with a "type": the summary first, then every difference."""
+    records = [{"type": "summary"} | _summary_to_dict(result), *_difference_records(result)]
+    return "".join(f"{json.dumps(record)}\n" for record in records)
+
+
+def _md_code(name: str) -> str:
+    return f"`{name}`".replace("|", "\\|")  # a "|" in a parametrized test id would split the table cell
+
+
+def _md_tests_list(lines: list[str], title: str, names: list[str]) -> None:
+    lines.append(f"\n### {FAIL_SYMBOL} {title} ({len(names)})\n")
+    lines.extend(f"- {_md_code(name)}" for name in names)
+
+
+def render_markdown(result: ComparisonResult) -> str:
+    """GitHub flavored markdown, e.g. for a pull request comment."""
+    lines = [
+        "## Better-Report Comparison\n",
+        f"**Result:** {'✅ reports are identical' if result.identical else '❌ differences found'}\n",
+        "| | A | B | Common |",
+        "|---|---|---|---|",
+        f"| **File** | `{result.file_a}` | `{result.file_b}` | |",
+        f"| **Tests** | {result.total_a} | {result.total_b} | {result.common_count} |",
+    ]
+    if result.test_file_name:
+        lines.append(f"\nFilter: `test_file_name = {result.test_file_name}`")
+
+    if result.only_in_a:
+        _md_tests_list(lines, title="Tests in A but missing from B", names=result.only_in_a)
+    if result.only_in_b:
+        _md_tests_list(lines, title="Tests in B but missing from A", names=result.only_in_b)
+    if result.status_diffs:
+        lines.append(f"\n### {DIFF_SYMBOL} Status differences in common tests ({len(result.status_diffs)})\n")
+        lines.append("| Test Name | Status in A | Status in B |")
+        lines.append("|---|---|---|")
+        lines.extend(f"| {_md_code(name)} | {s_a} | {s_b} |" for name, s_a, s_b in result.status_diffs)
+    if result.duration_regressions_count:
+        thresholds = _format_thresholds(threshold_pct=result.threshold_pct, threshold_sec=result.threshold_sec)
+        lines.append(
+            f"\n### {FAIL_SYMBOL} Duration regressions (threshold: {thresholds}) "
+            f"({result.duration_regressions_count}, top {len(result.duration_regressions)} slowest)\n"
+        )
+        lines.append("| Test Name | Duration A | Duration B | Increase | Increase % |")
+        lines.append("|---|---|---|---|---|")
+        lines.extend(
+            f"| {_md_code(regression.test_name)} | {regression.duration_a:.2f}s | {regression.duration_b:.2f}s | "
+            f"{regression.increase_sec:+.2f}s | {regression.increase_pct:+.0f}% |"
+            for regression in result.duration_regressions
+        )
+    return "\n".join(lines) + "\n"
+
+
+OUTPUT_RENDERERS: dict[str, Callable[[ComparisonResult], str]] = {
+    "text": render_text,
+    "json": render_json,
+    "ndjson": render_ndjson,
+    "markdown": render_markdown,
+}
+OUTPUT_FORMATS = tuple(OUTPUT_RENDERERS)
+
+
+@dataclass(slots=True)
+class TreeComparisonResult:
+    dir_a: Path
+    dir_b: Path
+    results: dict[str, ComparisonResult]  # relative directory of the report (e.g. the shard) -> its comparison
+    only_in_dir_a: list[str]
+    only_in_dir_b: list[str]
+
+    @property
+    def differing(self) -> list[str]:
+        return [path for path, result in self.results.items() if not result.identical]
+
+    @property
+    def identical(self) -> bool:
+        return not (self.only_in_dir_a or self.only_in_dir_b or self.differing)
+
+
+def _tree_totals(result: TreeComparisonResult) -> dict:
+    results = result.results.values()
+    return {
+        "pairs_count": len(result.results),
+        "differing_pairs_count": len(result.differing),
+        "reports_only_in_dir_a": result.only_in_dir_a,
+        "reports_only_in_dir_b": result.only_in_dir_b,
+        "missing_in_a_count": sum(len(pair.only_in_b) for pair in results),
+        "missing_in_b_count": sum(len(pair.only_in_a) for pair in results),
+        "status_diffs_count": sum(len(pair.status_diffs) for pair in results),
+        "duration_regressions_count": sum(pair.duration_regressions_count or 0 for pair in results),
+        "identical": result.identical,
+    }
+
+
+def render_tree_text(result: TreeComparisonResult) -> str:
+    totals = _tree_totals(result)
+    lines = [
+        f"\n{SEP}",
+        "  BETTER-REPORT DIRECTORY COMPARISON",
+        SEP,
+        f"  Dir A   : {result.dir_a}",
+        f"  Dir B   : {result.dir_b}",
+        f"  Reports : {totals['pairs_count']} paired  |  {len(result.only_in_dir_a)} only in A  |  "
+        f"{len(result.only_in_dir_b)} only in B",
+        SEP,
+    ]
+    _text_missing(lines, result.only_in_dir_a, source="dir A", target="dir B")
+    _text_missing(lines, result.only_in_dir_b, source="dir B", target="dir A")
+
+    if result.results:
+        col_w = max(len("REPORT"), *(len(path) for path in result.results))
+        lines.append(f"\n{DIFF_SYMBOL}  Paired reports  ({len(result.differing)} of {len(result.results)} differ)")
+        lines.append(
+            f"     {'REPORT':<{col_w}}  {'TESTS A':>8}  {'TESTS B':>8}  {'MISSING A':>9}  {'MISSING B':>9}  "
+            f"{'STATUS':>7}  {'SLOWER':>7}  RESULT"
+        )
+        lines.append("     " + "-" * (col_w + 75))
+        for path, pair in result.results.items():
+            lines.append(
+                f"     {path:<{col_w}}  {pair.total_a:>8}  {pair.total_b:>8}  {len(pair.only_in_b):>9}  "
+                f"{len(pair.only_in_a):>9}  {len(pair.status_diffs):>7}  {pair.duration_regressions_count or 0:>7}  "
+                f"{PASS_SYMBOL if pair.identical else FAIL_SYMBOL}"
+            )
+
+    lines.append(f"\n{SEP}")
+    lines.append(
+        f"  TOTAL  : {totals['missing_in_a_count']} missing in A  |  {totals['missing_in_b_count']} missing in B  |  "
+        f"{totals['status_diffs_count']} status diffs  |  {totals['duration_regressions_count']} duration regressions"
+    )
+    lines.append("  RESULT: DIRECTORIES ARE IDENTICAL" if result.identical else "  RESULT: DIFFERENCES FOUND")
+    lines.append(f"{SEP}\n")
+    return "\n".join(lines) + "\n"
+
+
+def render_tree_json(result: TreeComparisonResult) -> str:
+    data = {"dir_a": str(result.dir_a), "dir_b": str(result.dir_b)} | _tree_totals(result)
+    data["pairs"] = [{"report": path} | _comparison_to_dict(pair) for path, pair in result.results.items()]
+    return json.dumps(data, indent=4) + "\n"
+
+
+def render_tree_ndjson(result: TreeComparisonResult) -> str:
+    """The totals first, then per paired report its summary and differences, each tagged with the report."""
+    records = [{"type": "summary", "dir_a": str(result.dir_a), "dir_b": str(result.dir_b)} | _tree_totals(result)]
+    for path, pair in result.results.items():
+        records.append({"type": "pair", "report": path} | _summary_to_dict(pair))
+        records.extend({"report": path} | record for record in _difference_records(pair))
+    return "".join(f"{json.dumps(record)}\n" for record in records)
+
+
+def render_tree_markdown(result: TreeComparisonResult) -> str:
+    totals = _tree_totals(result)
+    lines = [
+        "## Better-Report Directory Comparison\n",
+        f"**Result:** {'✅ directories are identical' if result.identical else '❌ differences found'}\n",
+        f"Dir A: `{result.dir_a}`  \nDir B: `{result.dir_b}`\n",
+        f"{totals['pairs_count']} paired reports, {totals['differing_pairs_count']} differ: "
+        f"{totals['missing_in_a_count']} missing in A, {totals['missing_in_b_count']} missing in B, "
+        f"{totals['status_diffs_count']} status diffs, {totals['duration_regressions_count']} duration regressions",
+    ]
+    if result.only_in_dir_a:
+        _md_tests_list(lines, title="Reports in dir A but missing from dir B", names=result.only_in_dir_a)
+    if result.only_in_dir_b:
+        _md_tests_list(lines, title="Reports in dir B but missing from dir A", names=result.only_in_dir_b)
+    if result.results:
+        lines.append("\n| Report | Tests A | Tests B | Missing in A | Missing in B | Status Diffs | Slower | Result |")
+        lines.append("|---|---|---|---|---|---|---|---|")
+        lines.extend(
+            f"| {_md_code(path)} | {pair.total_a} | {pair.total_b} | {len(pair.only_in_b)} | {len(pair.only_in_a)} | "
+            f"{len(pair.status_diffs)} | {pair.duration_regressions_count or 0} | {'✅' if pair.identical else '❌'} |"
+            for path, pair in result.results.items()
+        )
+    return "\n".join(lines) + "\n"
+
+
+TREE_OUTPUT_RENDERERS: dict[str, Callable[[TreeComparisonResult], str]] = {
+    "text": render_tree_text,
+    "json": render_tree_json,
+    "ndjson": render_tree_ndjson,
+    "markdown": render_tree_markdown,
+}
+
+
+def write_comparison(
+    result: ComparisonResult | TreeComparisonResult, output_format: str = "text", output: Path | None = None
 ) -> None:
-    print(f"\n{SEP}")
-    print("  BETTER-REPORT COMPARISON")
-    print(SEP)
-    print(f"  File A : {file_a}")
-    print(f"  File B : {file_b}")
-    if test_file_name:
-        print(f"  Filter : test_file_name = {test_file_name}")
-    print(f"  Tests  : {total_a} in A  |  {total_b} in B  |  {common_count} in common")
-    print(SEP)
+    """Render the whole result first and write it in one go, to the output file or to stdout."""
+    renderers = TREE_OUTPUT_RENDERERS if isinstance(result, TreeComparisonResult) else OUTPUT_RENDERERS
+    rendered = renderers[output_format](result)
+    if output is None:
+        sys.stdout.write(rendered)
+        sys.stdout.flush()
+        return
 
-    _log_missing(only_in_a, source="A", target="B")
-    _log_missing(only_in_b, source="B", target="A")
-    _log_status_diffs(status_diffs)
+    if not output.parent.exists():
+        output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(rendered, encoding="utf-8")
 
-    print(f"\n{SEP}")
-    if only_in_a or only_in_b or status_diffs:
-        print("  RESULT: DIFFERENCES FOUND")
-    else:
-        print("  RESULT: REPORTS ARE IDENTICAL")
-    print(f"{SEP}\n")
+
+def _intern(value: str | None) -> str | None:
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 def load_report(path: Path, test_file_name: str | None = None) -> dict[str, dict]:
-    with open(path) as f:
-        raw = json.load(f)
+    """
+    Index the report by pytest_test_name, streaming its entries: only the fields the comparison needs are kept,
+    and the test_file_name filter is applied before an entry is stored.
+    """
     indexed: dict[str, dict] = {}
-    for entry in raw.values():
-        if test_file_name and entry.get("test_file_name") != test_file_name:
-            continue
-        pytest_name = entry.get("pytest_test_name")
-        if pytest_name:
-            indexed[pytest_name] = entry
+    with open_for_read(path) as f:  # plain or compressed (gzip / lzma / bz2)
+        for _, entry in iter_json_object_items(f):
+            if test_file_name and entry.get("test_file_name") != test_file_name:
+                continue
+            pytest_name = entry.get("pytest_test_name")
+            if pytest_name:
+                indexed[pytest_name] = {
+                    "pytest_test_name": pytest_name,
+                    "test_status": _intern(entry.get("test_status")),
+                    "test_file_name": _intern(entry.get("test_file_name")),
+                    "test_duration_sec": entry.get("test_duration_sec"),
+                }
     return indexed
 
 
-def compare_reports(file_a: Path, file_b: Path, test_file_name: str | None = None) -> bool:
-    report_a = load_report(file_a, test_file_name)
-    report_b = load_report(file_b, test_file_name)
+def _report_executor(paths: list[Path]) -> Executor:
+    """
+    Worker processes when a file is big enough for the JSON decoding to be worth taking out of the GIL (and there
+    is more than one CPU), threads (overlapping the file I/O and decompression) otherwise.
+    """
+    workers = min(len(paths), os.cpu_count() or 1)
+    if workers > 1 and any(path.stat().st_size >= PROCESS_POOL_MIN_BYTES for path in paths):
+        return ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))  # spawn: same on every OS
+    return ThreadPoolExecutor(max_workers=min(len(paths), MAX_LOADING_THREADS))
+
+
+def load_reports(paths: list[Path], test_file_name: str | None = None) -> list[dict[str, dict]]:
+    """Load and index the reports concurrently."""
+    if len(paths) == 1:
+        return [load_report(paths[0], test_file_name)]
+
+    with _report_executor(paths) as executor:
+        return list(executor.map(load_report, paths, [test_file_name] * len(paths)))
+
+
+def load_status_codes(path: Path, test_file_name: str | None = None) -> tuple[list[str], np.ndarray]:
+    """The test names of a report and their statuses as small integer codes (a column of the status matrix)."""
+    return encode_statuses(load_report(path, test_file_name))
+
+
+def find_run_reports(runs_dir: Path) -> list[Path]:
+    """The test results file (plain or compressed) of every run under the directory, ordered by path."""
+    names = {compressed_path(path=Path(TEST_RESULTS_FILENAME), compression=c).name for c in (None, *COMPRESSIONS)}
+    return sorted(path for path in runs_dir.rglob(f"{TEST_RESULTS_FILENAME}*") if path.name in names)
+
 
+def _log_flakiness(
+    run_labels: list[str], tests_count: int, flakiness: list[FlakinessResult], test_file_name: str | None = None
+) -> None:
+    flaky = [result for result in flakiness if result.flips]
+    print(f"\n{SEP}")
+    print(f"  BETTER-REPORT FLAKINESS ACROSS {len(run_labels)} RUNS")
+    print(SEP)
+    for number, label in enumerate(run_labels, start=1):
+        print(f"  Run #{number:<3}: {label}")
+    if test_file_name:
+        print(f"  Filter  : test_file_name = {test_file_name}")
+    print(f"  Tests   : {tests_count}  |  {len(flaky)} flaky")
+    print(SEP)
+
+    if flaky:
+        col_w = max(len(result.test_name) for result in flaky)
+        print(f"\n{DIFF_SYMBOL}  Tests whose status changed between runs  ({len(flaky)})")
+        print(f"     {'TEST NAME':<{col_w}}  {'FLIPS':>5}  {'FAIL RATE':>9}  STATUS CHANGED IN RUNS")
+        print("     " + "-" * (col_w + 45))
+        for result in flaky:
+            changed_in = ", ".join(f"#{number}" for number in result.changed_in_runs)
+            print(f"     {result.test_name:<{col_w}}  {result.flips:>5}  {result.failure_rate:>9.1%}  {changed_in}")
+    else:
+        print(f"\n{PASS_SYMBOL}  No test changed its status between runs")
+
+    print(f"\n{SEP}")
+    print("  RESULT: FLAKY TESTS FOUND" if flaky else "  RESULT: ALL TESTS ARE STABLE")
+    print(f"{SEP}\n")
+
+
+def _log_timings(timings: dict[str, float], file: TextIO | None = None) -> None:
+    print("  TIMINGS", file=file)
+    for phase, duration in timings.items():
+        print(f"     {phase:<6} {duration:>8.3f}s", file=file)
+    print(f"     {'total':<6} {sum(timings.values()):>8.3f}s", file=file)
+    print(f"{SEP}\n", file=file)
+
+
+def find_duration_regressions(
+    report_a: dict[str, dict],
+    report_b: dict[str, dict],
+    common: list[str],
+    threshold_pct: float | None = None,
+    threshold_sec: float | None = None,
+    top_k: int = DEFAULT_TOP_REGRESSIONS,
+) -> tuple[int, list[DurationRegression]]:
+    """
+    Count the common tests (with the same status in both reports) that got slower than all the given thresholds,
+    and keep the top-K by absolute increase with a K-sized heap instead of sorting them all.
+    """
+    regressions_count = 0
+
+    def _regressions() -> Iterator[DurationRegression]:
+        nonlocal regressions_count
+        for name in common:
+            entry_a, entry_b = report_a[name], report_b[name]
+            duration_a, duration_b = entry_a.get("test_duration_sec"), entry_b.get("test_duration_sec")
+            if duration_a is None or duration_b is None:
+                continue
+            if comparable_status(entry_a.get("test_status")) != comparable_status(entry_b.get("test_status")):
+                continue
+            regression = DurationRegression(test_name=name, duration_a=duration_a, duration_b=duration_b)
+            if regression.increase_sec <= 0:
+                continue
+            if threshold_sec is not None and regression.increase_sec < threshold_sec:
+                continue
+            if threshold_pct is not None and regression.increase_pct < threshold_pct:
+                continue
+            regressions_count += 1
+            yield regression
+
+    top_regressions = heapq.nlargest(top_k, _regressions(), key=lambda regression: regression.increase_sec)
+    return regressions_count, top_regressions
+
+
+def diff_reports(
+    file_a: Path,
+    file_b: Path,
+    report_a: dict[str, dict],
+    report_b: dict[str, dict],
+    test_file_name: str | None = None,
+    duration_threshold_pct: float | None = None,
+    duration_threshold_sec: float | None = None,
+    top_regressions: int = DEFAULT_TOP_REGRESSIONS,
+) -> ComparisonResult:
     names_a = set(report_a.keys())
     names_b = set(report_b.keys())
 
@@ -104,10 +585,9 @@ def compare_reports(file_a: Path, file_b: Path, test_file_name: str | None = Non
     status_diffs = [
         (name, report_a[name]["test_status"], report_b[name]["test_status"])
         for name in common
-        if report_a[name].get("test_status") != report_b[name].get("test_status")
+        if comparable_status(report_a[name].get("test_status")) != comparable_status(report_b[name].get("test_status"))
     ]
-
-    _log_summary(
+    result = ComparisonResult(
         file_a=file_a,
         file_b=file_b,
         total_a=len(names_a),
@@ -117,13 +597,188 @@ def compare_reports(file_a: Path, file_b: Path, test_file_name: str | None = Non
         only_in_b=only_in_b,
         status_diffs=status_diffs,
         test_file_name=test_file_name,
+        threshold_pct=duration_threshold_pct,
+        threshold_sec=duration_threshold_sec,
+    )
+    if duration_threshold_pct is not None or duration_threshold_sec is not None:
+        result.duration_regressions_count, result.duration_regressions = find_duration_regressions(
+            report_a=report_a,
+            report_b=report_b,
+            common=common,
+            threshold_pct=duration_threshold_pct,
+            threshold_sec=duration_threshold_sec,
+            top_k=top_regressions,
+        )
+    return result
+
+
+def compare_report_pair(
+    file_a: Path,
+    file_b: Path,
+    test_file_name: str | None = None,
+    duration_threshold_pct: float | None = None,
+    duration_threshold_sec: float | None = None,
+    top_regressions: int = DEFAULT_TOP_REGRESSIONS,
+) -> ComparisonResult:
+    """Load and diff one pair of reports, a unit of work of the directory comparison worker pool."""
+    return diff_reports(
+        file_a=file_a,
+        file_b=file_b,
+        report_a=load_report(file_a, test_file_name),
+        report_b=load_report(file_b, test_file_name),
+        test_file_name=test_file_name,
+        duration_threshold_pct=duration_threshold_pct,
+        duration_threshold_sec=duration_threshold_sec,
+        top_regressions=top_regressions,
     )
 
-    return not (only_in_a or only_in_b or status_diffs)
+
+def compare_reports(
+    file_a: Path,
+    file_b: Path,
+    test_file_name: str | None = None,
+    timings: bool = False,
+    duration_threshold_pct: float | None = None,
+    duration_threshold_sec: float | None = None,
+    top_regressions: int = DEFAULT_TOP_REGRESSIONS,
+    output_format: str = "text",
+    output: Path | None = None,
+) -> bool:
+    """Compare the tests and statuses, and the durations when a duration threshold is given."""
+    phase_timings: dict[str, float] = {}
+    start = time.perf_counter()
+    report_a, report_b = load_reports([file_a, file_b], test_file_name)
+    phase_timings["load"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = diff_reports(
+        file_a=file_a,
+        file_b=file_b,
+        report_a=report_a,
+        report_b=report_b,
+        test_file_name=test_file_name,
+        duration_threshold_pct=duration_threshold_pct,
+        duration_threshold_sec=duration_threshold_sec,
+        top_regressions=top_regressions,
+    )
+    phase_timings["diff"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    write_comparison(result=result, output_format=output_format, output=output)
+    phase_timings["print"] = time.perf_counter() - start
+
+    if timings:  # kept out of a structured output on stdout
+        _log_timings(phase_timings, file=sys.stdout if output_format == "text" else sys.stderr)
+
+    return result.identical
+
+
+def find_report_pairs(dir_a: Path, dir_b: Path) -> tuple[dict[str, tuple[Path, Path]], list[str], list[str]]:
+    """
+    Pair the test results files of the two directory trees by the directory they are in, relative to the tree root
+    (e.g. "shard_3/results_output"); a plain and a compressed file are paired too.
+    Returns the pairs ordered by that relative directory, and the relative directories found in one tree only.
+    """
+    reports_a = {path.parent.relative_to(dir_a).as_posix(): path for path in find_run_reports(dir_a)}
+    reports_b = {path.parent.relative_to(dir_b).as_posix(): path for path in find_run_reports(dir_b)}
+    pairs = {key: (reports_a[key], reports_b[key]) for key in sorted(reports_a.keys() & reports_b.keys())}
+    return pairs, sorted(reports_a.keys() - reports_b.keys()), sorted(reports_b.keys() - reports_a.keys())
+
+
+def _pairs_executor(pairs_count: int) -> Executor:
+    """Worker processes, one per CPU, to parse the pairs in parallel; threads when there is a single CPU."""
+    workers = min(pairs_count, os.cpu_count() or 1)
+    if workers > 1:
+        return ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+    return ThreadPoolExecutor(max_workers=min(pairs_count, MAX_LOADING_THREADS) or 1)
+
+
+def compare_trees(
+    dir_a: Path,
+    dir_b: Path,
+    test_file_name: str | None = None,
+    timings: bool = False,
+    duration_threshold_pct: float | None = None,
+    duration_threshold_sec: float | None = None,
+    top_regressions: int = DEFAULT_TOP_REGRESSIONS,
+    output_format: str = "text",
+    output: Path | None = None,
+) -> bool:
+    """
+    Compare every pair of test results files of two results directory trees (e.g. one results_output per shard)
+    in a worker pool, in one process instead of one CLI call per pair, and report a single aggregated summary.
+    """
+    phase_timings: dict[str, float] = {}
+    start = time.perf_counter()
+    pairs, only_in_dir_a, only_in_dir_b = find_report_pairs(dir_a=dir_a, dir_b=dir_b)
+    files_a = [file_a for file_a, _ in pairs.values()]
+    files_b = [file_b for _, file_b in pairs.values()]
+    count = len(pairs)
+    with _pairs_executor(count) as executor:
+        results = executor.map(
+            compare_report_pair,
+            files_a,
+            files_b,
+            [test_file_name] * count,
+            [duration_threshold_pct] * count,
+            [duration_threshold_sec] * count,
+            [top_regressions] * count,
+        )
+        result = TreeComparisonResult(
+            dir_a=dir_a,
+            dir_b=dir_b,
+            results=dict(zip(pairs, results, strict=True)),
+            only_in_dir_a=only_in_dir_a,
+            only_in_dir_b=only_in_dir_b,
+        )
+    phase_timings["load"] = time.perf_counter() - start  # loading and diffing overlap in the pool
+
+    start = time.perf_counter()
+    write_comparison(result=result, output_format=output_format, output=output)
+    phase_timings["print"] = time.perf_counter() - start
+
+    if timings:
+        _log_timings(phase_timings, file=sys.stdout if output_format == "text" else sys.stderr)
+
+    return result.identical
+
+
+def compare_runs(
+    paths: list[Path], run_labels: list[str] | None = None, test_file_name: str | None = None, timings: bool = False
+) -> bool:
+    """Build the test-by-run status matrix of many runs in one pass and report the tests whose status flips."""
+    run_labels = run_labels or [str(path) for path in paths]
+    phase_timings: dict[str, float] = {}
+    start = time.perf_counter()
+    with _report_executor(paths) as executor:
+        columns = executor.map(load_status_codes, paths, [test_file_name] * len(paths))
+        matrix = build_status_matrix((label, *column) for label, column in zip(run_labels, columns, strict=True))
+    phase_timings["load"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    flakiness = get_flakiness(matrix)
+    phase_timings["diff"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _log_flakiness(
+        run_labels=matrix.run_labels,
+        tests_count=len(matrix.test_names),
+        flakiness=flakiness,
+        test_file_name=test_file_name,
+    )
+    phase_timings["print"] = time.perf_counter() - start
+
+    if timings:
+        _log_timings(phase_timings)
+
+    return not any(result.flips for result in flakiness)
 
 
 class Command(BaseCommand):
-    help = "Compare two better-report JSON log files for test coverage and status differences."
+    help = (
+        "Compare better-report JSON log files (or directory trees of them) for test coverage and status "
+        "differences, or find flaky tests."
+    )
     version = "1.0.0"
 
     def add_arguments(self, parser: CommandParser) -> None:
@@ -131,21 +786,89 @@ class Command(BaseCommand):
             "-a",
             "--file-a",
             type=Path,
-            required=True,
+            required=False,
+            default=None,
             help="Path to the first better-report JSON file.",
         )
         parser.add_argument(
             "-b",
             "--file-b",
             type=Path,
-            required=True,
+            required=False,
+            default=None,
             help="Path to the second better-report JSON file.",
         )
+        parser.add_argument(
+            "--dir-a",
+            type=Path,
+            default=None,
+            help=f'Directory mode: the first results tree, its "{TEST_RESULTS_FILENAME}" files (e.g. one '
+            "results_output per shard) are paired with --dir-b by their relative directory and compared in a pool.",
+        )
+        parser.add_argument(
+            "--dir-b",
+            type=Path,
+            default=None,
+            help="Directory mode: the second results tree.",
+        )
+        parser.add_argument(
+            "--files",
+            type=Path,
+            nargs="+",
+            default=None,
+            help="N-way mode: the better-report JSON files of many runs, oldest first, to find the flaky tests.",
+        )
+        parser.add_argument(
+            "--runs-dir",
+            type=Path,
+            default=None,
+            help=f'N-way mode: a directory with one "{TEST_RESULTS_FILENAME}" (plain or compressed) per run, '
+            "the runs are ordered by path.",
+        )
         parser.add_argument(
             "--fail-on-diff",
             action="store_true",
             default=False,
-            help="Exit with non-zero code if any differences are found.",
+            help="Exit with non-zero code if any differences (including duration regressions in duration mode, "
+            "flaky tests in N-way mode) are found.",
+        )
+        parser.add_argument(
+            "--duration-threshold-pct",
+            type=float,
+            default=None,
+            help="Duration mode: report the common tests whose duration grew by at least this percentage "
+            "(combined with --duration-threshold-sec, both must be exceeded).",
+        )
+        parser.add_argument(
+            "--duration-threshold-sec",
+            type=float,
+            default=None,
+            help="Duration mode: report the common tests whose duration grew by at least this many seconds.",
+        )
+        parser.add_argument(
+            "--top-regressions",
+            type=int,
+            default=DEFAULT_TOP_REGRESSIONS,
+            help=f"Duration mode: number of the largest duration regressions to list (default {DEFAULT_TOP_REGRESSIONS}).",
+        )
+        parser.add_argument(
+            "--output-format",
+            choices=OUTPUT_FORMATS,
+            default="text",
+            help="Format of the comparison of -a/-b or --dir-a/--dir-b: text (default), or json / ndjson / markdown "
+            "(e.g. for a CI bot posting a pull request comment).",
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=None,
+            help="Write the comparison to this file instead of stdout.",
+        )
+        parser.add_argument(
+            "--timings",
+            action="store_true",
+            default=False,
+            help="Print the time spent loading the reports, diffing them and printing the result.",
         )
         parser.add_argument(
             "--test-file-name",
@@ -156,24 +879,89 @@ class Command(BaseCommand):
         )
 
     def handle(self, **kwargs: Any) -> None:
-        file_a: Path = kwargs["file_a"]
-        file_b: Path = kwargs["file_b"]
+        file_a: Path | None = kwargs.get("file_a")
+        file_b: Path | None = kwargs.get("file_b")
+        dir_a: Path | None = kwargs.get("dir_a")
+        dir_b: Path | None = kwargs.get("dir_b")
+        files: list[Path] | None = kwargs.get("files")
+        runs_dir: Path | None = kwargs.get("runs_dir")
         fail_on_diff: bool = kwargs["fail_on_diff"]
         test_file_name: str | None = kwargs.get("test_file_name")
-
-        for label, path in (("A", file_a), ("B", file_b)):
-            if not path.exists():
-                raise FileNotFoundError(f"File {label} not found: {path}")
-
-        identical = compare_reports(file_a, file_b, test_file_name)
+        timings: bool = kwargs["timings"]
+        duration_threshold_pct: float | None = kwargs.get("duration_threshold_pct")
+        duration_threshold_sec: float | None = kwargs.get("duration_threshold_sec")
+        top_regressions: int = kwargs.get("top_regressions") or DEFAULT_TOP_REGRESSIONS
+        output_format: str = kwargs.get("output_format") or "text"
+        output: Path | None = kwargs.get("output")
+
+        if files or runs_dir:
+            if output_format != "text" or output:
+                raise CommandError("--output-format and --output are not supported in N-way mode.")
+            identical = self._compare_runs(
+                files=files, runs_dir=runs_dir, test_file_name=test_file_name, timings=timings
+            )
+        elif dir_a or dir_b:
+            for label, path in (("--dir-a", dir_a), ("--dir-b", dir_b)):
+                if not (path and path.is_dir()):
+                    raise CommandError(f"Directory {label} not found: {path}")
+
+            identical = compare_trees(
+                dir_a,
+                dir_b,
+                test_file_name,
+                timings=timings,
+                duration_threshold_pct=duration_threshold_pct,
+                duration_threshold_sec=duration_threshold_sec,
+                top_regressions=top_regressions,
+                output_format=output_format,
+                output=output,
+            )
+        else:
+            if not (file_a and file_b):
+                raise CommandError("Either -a/-b, --dir-a/--dir-b, --files or --runs-dir is required.")
+            for label, path in (("A", file_a), ("B", file_b)):
+                if not path.exists():
+                    raise FileNotFoundError(f"File {label} not found: {path}")
+
+            identical = compare_reports(
+                file_a,
+                file_b,
+                test_file_name,
+                timings=timings,
+                duration_threshold_pct=duration_threshold_pct,
+                duration_threshold_sec=duration_threshold_sec,
+                top_regressions=top_regressions,
+                output_format=output_format,
+                output=output,
+            )
 
         if fail_on_diff and not identical:
             raise CommandError("Reports have differences.")
 
+    @staticmethod
+    def _compare_runs(
+        files: list[Path] | None, runs_dir: Path | None, test_file_name: str | None, timings: bool
+    ) -> bool:
+        if runs_dir:
+            if not runs_dir.is_dir():
+                raise CommandError(f"Runs directory not found: {runs_dir}")
+            paths = find_run_reports(runs_dir)
+            run_labels = [str(path.relative_to(runs_dir)) for path in paths]
+        else:
+            paths = files
+            run_labels = [str(path) for path in paths]
+            for path in paths:
+                if not path.exists():
+                    raise FileNotFoundError(f"File not found: {path}")
+
+        if len(paths) < 2:
+            raise CommandError(f"At least 2 runs are needed to compare, found {len(paths)}.")
+        return compare_runs(paths=paths, run_labels=run_labels, test_file_name=test_file_name, timings=timings)
+
 
 def main() -> None:
     """Entry point: run the compare command from CLI."""
-    print('Starting "Better Report Compare"')
+    print('Starting "Better Report Compare"', file=sys.stderr)  # stdout may carry a json / markdown output
 
     os.environ["PYTHON_BASE_COMMAND_LOG_FILE"] = "false"
     Command().run_from_argv(argv=sys.argv)
@@ -0,0 +1,85 @@
+"""
+CLI tool to rebuild the better-report result files of an interrupted run from its last checkpoint.
+
+Reads the checkpoint written with --checkpoint-every-tests / --checkpoint-every-seconds, merges the tests
+of its journal and those already streamed to the ndjson file (--better-report-format=ndjson) and writes
+valid execution and test results files, marking the execution as cancelled.
+
+Usage:
+    python better_report_recover.py -d <results_output dir>
+"""
+
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from python_base_command import BaseCommand, CommandError, CommandParser
+
+from pytest_plugins.const import (
+    CHECKPOINT_FILENAME,
+    CHECKPOINT_JOURNAL_FILENAME,
+    EXECUTION_RESULTS_FILENAME,
+    NDJSON_TEST_RESULTS_FILENAME,
+    TEST_RESULTS_FILENAME,
+)
+from pytest_plugins.models import ExecutionStatus
+from pytest_plugins.utils.checkpoint import load_checkpoint, load_records
+from pytest_plugins.utils.helper import save_as_json
+
+
+def recover_report(output_dir: Path) -> tuple[dict, dict]:
+    checkpoint = load_checkpoint(output_dir / CHECKPOINT_FILENAME)
+    execution_results = checkpoint["execution_results"]
+    test_results = checkpoint["test_results"]
+    test_results.update(load_records(output_dir / CHECKPOINT_JOURNAL_FILENAME))
+    test_results.update(load_records(output_dir / NDJSON_TEST_RESULTS_FILENAME))
+
+    exec_info = execution_results["execution_info"]
+    end_times = [t["test_end_time"] for t in test_results.values() if t.get("test_end_time")]
+    exec_info["execution_end_time"] = max([checkpoint["checkpoint_time"], *end_times])
+    if exec_info.get("execution_start_time"):
+        start_obj = datetime.fromisoformat(exec_info["execution_start_time"])
+        end_obj = datetime.fromisoformat(exec_info["execution_end_time"])
+        exec_info["execution_duration_sec"] = (end_obj - start_obj).total_seconds()
+    exec_info["execution_status"] = ExecutionStatus.CANCELLED.value
+
+    return execution_results, test_results
+
+
+class Command(BaseCommand):
+    help = "Rebuild the better-report result files of an interrupted run from its last checkpoint."
+    version = "1.0.0"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "-d",
+            "--output-dir",
+            type=Path,
+            required=True,
+            help=f'Path to the "results_output" directory that contains "{CHECKPOINT_FILENAME}".',
+        )
+
+    def handle(self, **kwargs: Any) -> None:
+        output_dir: Path = kwargs["output_dir"]
+
+        if not (output_dir / CHECKPOINT_FILENAME).exists():
+            raise CommandError(f"Checkpoint not found: {output_dir / CHECKPOINT_FILENAME}")
+
+        execution_results, test_results = recover_report(output_dir)
+        save_as_json(path=output_dir / EXECUTION_RESULTS_FILENAME, data=execution_results)
+        save_as_json(path=output_dir / TEST_RESULTS_FILENAME, data=test_results)
+        self.logger.info(f"Recovered {len(test_results)} test results into {output_dir}")
+
+
+def main() -> None:
+    """Entry point: run the recover command from CLI."""
+    print('Starting "Better Report Recover"')
+
+    os.environ["PYTHON_BASE_COMMAND_LOG_FILE"] = "false"
+    Command().run_from_argv(argv=sys.argv)
+
+
+if __name__ == "__main__":
+    main()
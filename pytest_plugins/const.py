@@ -1 +1,11 @@
 LOGGER_NAME = "pytest_plugins"
+
+# the result files of better_report, read by the other plugins and the CLI tools
+EXECUTION_RESULTS_FILENAME = "execution_results.json"
+TEST_RESULTS_FILENAME = "test_results.json"
+NDJSON_TEST_RESULTS_FILENAME = "test_results.ndjson"
+CHECKPOINT_FILENAME = "checkpoint.json"
+CHECKPOINT_JOURNAL_FILENAME = "checkpoint.ndjson"
+FIXTURE_RESULTS_FILENAME = "fixture_results.json"
+AGGREGATES_FILENAME = "aggregates.json"
+HTML_REPORT_FILENAME = "test_report.html"
@@ -1,3 +1,4 @@
+import sys
 from collections.abc import Generator
 from typing import Any
 
@@ -9,7 +10,7 @@ from custom_python_logger import get_logger
 from pytest_plugins.better_report import test_results
 from pytest_plugins.const import LOGGER_NAME
 from pytest_plugins.models import ExecutionStatus
-from pytest_plugins.utils.pytest_helper import get_test_full_name
+from pytest_plugins.utils.pytest_helper import get_test_identity, unregister_plugin
 
 logger = get_logger(f"{LOGGER_NAME}.fail2skip")
 
@@ -25,6 +26,7 @@ def pytest_addoption(parser: Parser) -> None:
 
 def pytest_configure(config: Config) -> None:
     if not config.getoption("--fail2skip"):
+        unregister_plugin(config=config, plugin=sys.modules[__name__])
         return
 
     config._fail2skip_enabled = config.getoption("--fail2skip")  # pylint: disable=W0212
@@ -46,9 +48,9 @@ def pytest_runtest_makereport(item: Function, call: Any) -> Generator[None, Any,
         report.longrepr = "fail2skip: forcibly skipped after failure"
         report.wasxfail = "fail2skip"
 
-        if get_test_full_name(item=item) in test_results:
-            test_results[get_test_full_name(item=item)].test_status = ExecutionStatus.FAILED_SKIPPED
-            test_results[get_test_full_name(item=item)].exception_message.update(
+        if (test_full_name := get_test_identity(item=item).test_full_name) in test_results:
+            test_results[test_full_name].test_status = ExecutionStatus.FAILED_SKIPPED
+            test_results[test_full_name].exception_message.update(
                 {
                     "fail2skip_reason": [
                         marker.kwargs.get("reason", None) for marker in item.iter_markers(name="fail2skip")
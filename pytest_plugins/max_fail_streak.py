@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 from _pytest.config import Config, Parser
 from _pytest.python import Function
@@ -6,7 +8,7 @@ from custom_python_logger import get_logger
 from pytest_plugins.better_report import test_results
 from pytest_plugins.const import LOGGER_NAME
 from pytest_plugins.models import ExecutionStatus
-from pytest_plugins.utils.pytest_helper import get_test_full_name
+from pytest_plugins.utils.pytest_helper import get_test_identity, unregister_plugin
 
 logger = get_logger(f"{LOGGER_NAME}.max_fail_streak")
 global_interface = {}
@@ -24,6 +26,7 @@ def pytest_addoption(parser: Parser) -> None:
 
 def pytest_configure(config: Config) -> None:
     if not config.getoption("--maxfail-streak"):
+        unregister_plugin(config=config, plugin=sys.modules[__name__])
         return
 
     _max_fail_streak = config.getoption("--maxfail-streak")
@@ -40,7 +43,7 @@ def pytest_runtest_setup(item: Function) -> None:
     if max_streak and fail_streak >= max_streak:
         _skip_message = "Skipping test due to maximum consecutive failures reached."
 
-        if (test_name := get_test_full_name(item=item)) in test_results:
+        if (test_name := get_test_identity(item=item).test_full_name) in test_results:
             test_results[test_name].test_status = ExecutionStatus.SKIPPED
             test_results[test_name].exception_message = {
                 "exception_type": "MaxFailStreakReached",
@@ -1,5 +1,21 @@
+from pytest_plugins.models.aggregate_data import AggregateData
 from pytest_plugins.models.execution_data import ExecutionData
+from pytest_plugins.models.fixture_data import FixtureData
+from pytest_plugins.models.history_entry import HistoryEntry
+from pytest_plugins.models.history_record import HistoryRecord
+from pytest_plugins.models.shard_plan import ShardPlan
 from pytest_plugins.models.status import ExecutionStatus
 from pytest_plugins.models.test_data import TestData
+from pytest_plugins.models.test_identity import TestIdentity
 
-__all__ = ["ExecutionStatus", "ExecutionData", "TestData"]
+__all__ = [
+    "AggregateData",
+    "ExecutionStatus",
+    "ExecutionData",
+    "FixtureData",
+    "HistoryEntry",
+    "HistoryRecord",
+    "ShardPlan",
+    "TestData",
+    "TestIdentity",
+]
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class AggregateData:
+    name: str  # the test file, or "<test file>::<class>"
+    test_count: int = 0
+    passed_count: int = 0
+    failed_count: int = 0
+    skipped_count: int = 0
+    total_duration_sec: float = 0.0
+    max_duration_sec: float = 0.0
@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 
+from pytest_plugins.models.shard_plan import ShardPlan
 from pytest_plugins.models.status import ExecutionStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionData:
     execution_status: ExecutionStatus
     revision: str | None
@@ -18,3 +19,11 @@ class ExecutionData:
     commit: str | None = None
 
     test_list: list | None = None
+
+    # xdist only
+    worker_count: int | None = None
+    peak_concurrency: int | None = None  # max tests running at the same moment
+    average_concurrency: float | None = None  # sum of test durations / execution duration
+
+    # --shard-count / --shard-index only
+    shard_plan: ShardPlan | None = None
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class FixtureData:
+    fixture_name: str
+    scope: str
+    setup_count: int = 0
+    cache_hits: int = 0  # tests that got the cached value instead of a new setup
+    setup_total_sec: float = 0.0
+    setup_p50_sec: float | None = None
+    setup_p95_sec: float | None = None
+    teardown_count: int = 0
+    teardown_total_sec: float = 0.0
+    teardown_p50_sec: float | None = None
+    teardown_p95_sec: float | None = None
+    total_sec: float = 0.0  # setup + teardown
@@ -0,0 +1,10 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class HistoryEntry:
+    test_full_path: str
+    run_count: int = 0
+    ewma_duration_sec: float | None = None  # exponentially weighted moving average of the durations
+    ewma_variance: float = 0.0  # exponentially weighted moving variance of the durations (sec^2)
+    last_statuses: list[str] = field(default_factory=list)  # the oldest first
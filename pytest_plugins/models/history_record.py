@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class HistoryRecord:
+    duration_sec: float | None = None  # None when the test did not finish in the recorded run
+    failed: bool = False
@@ -0,0 +1,13 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class ShardPlan:
+    shard_count: int
+    shard_index: int
+    history_path: str | None = None
+    tests_with_history: int = 0  # the others are predicted with the mean recorded duration
+    shard_test_counts: list[int] = field(default_factory=list)  # per shard, by shard index
+    shard_predicted_duration_sec: list[float] = field(default_factory=list)  # per shard, by shard index
+    predicted_duration_sec: float | None = None  # this shard
+    actual_duration_sec: float | None = None  # this shard, the sum of its test durations
@@ -12,3 +12,6 @@ class ExecutionStatus(StrEnum):
     CANCELLED = "cancelled"
     SKIPPED = "skipped"
     FAILED_SKIPPED = "failed-skipped"  # Force skipped, used in fail2skip plugin
+    CACHED_PASS = (
+        "cached-pass"  # Skipped, passed before with the same code and environment, used in result_cache plugin
+    )
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from pytest_plugins.models.status import ExecutionStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class TestData:
     test_file_name: str
     class_test_name: str
@@ -16,6 +16,10 @@ class TestData:
     test_markers: list | None = None
     test_start_time: str | None = None
     test_end_time: str | None = None
-    test_duration_sec: float | None = None  # only for the tst itself, not including fixtures
+    test_duration_sec: float | None = None  # setup + call + teardown
+    setup_duration_sec: float | None = None  # fixtures setup
+    call_duration_sec: float | None = None  # the test body itself
+    teardown_duration_sec: float | None = None  # fixtures teardown
     exception_message: str | None = None
     run_index: int | None = None
+    worker_id: str | None = None  # xdist worker that ran the test
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class TestIdentity:
+    test_name: str  # without parameters, e.g. "TestClass::test_method"
+    pytest_test_name: str  # as in the node id, e.g. "TestClass::test_method[1-2]"
+    test_full_name: str  # with the parameters dict, e.g. "TestClass::test_method[{'x': 1, 'y': 2}]"
+    test_full_path: str  # full name prefixed with the test file path
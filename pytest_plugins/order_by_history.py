@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+
+import pytest
+from _pytest.config import Config, Parser
+from _pytest.python import Function
+from custom_python_logger import get_logger
+
+from pytest_plugins.const import LOGGER_NAME, TEST_RESULTS_FILENAME
+from pytest_plugins.utils.history import (
+    ORDER_MODES,
+    SLOWEST_FIRST,
+    history_sort_key,
+    load_history_index,
+    resolve_history_path,
+)
+from pytest_plugins.utils.pytest_helper import get_test_identity, unregister_plugin
+
+logger = get_logger(f"{LOGGER_NAME}.order_by_history")
+
+
+def pytest_addoption(parser: Parser) -> None:
+    parser.addoption(
+        "--order-by-history",
+        action="store",
+        default=None,
+        type=Path,
+        help=f'Reorder the tests by the durations recorded in a previous "{TEST_RESULTS_FILENAME}" (plain or '
+        'compressed), a "--better-report-history" store, or the output dir holding them, the slowest first',
+    )
+    parser.addoption(
+        "--order-by-history-mode",
+        action="store",
+        default=SLOWEST_FIRST,
+        choices=ORDER_MODES,
+        help=f'"{SLOWEST_FIRST}" (default) shortens the tail of a parallel (xdist) run, '
+        '"failed-first" runs the previously failed tests first (the slowest first) for the fastest feedback',
+    )
+
+
+def pytest_configure(config: Config) -> None:
+    if not config.getoption("--order-by-history"):
+        unregister_plugin(config=config, plugin=sys.modules[__name__])
+        return
+
+    path = resolve_history_path(path=config.getoption("--order-by-history"), results_filename=TEST_RESULTS_FILENAME)
+    if not path.is_file():
+        raise pytest.UsageError(f"--order-by-history: No test results found at {path}")
+    config._order_by_history_index = load_history_index(path=path)  # pylint: disable=W0212
+    logger.debug(f"Order by history: {len(config._order_by_history_index)} tests loaded from {path}")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config: Config, items: list[Function]) -> None:
+    if (index := getattr(config, "_order_by_history_index", None)) is None:
+        return
+
+    sort_key = history_sort_key(index=index, mode=config.getoption("--order-by-history-mode"))
+    items.sort(key=lambda item: sort_key(get_test_identity(item=item).test_full_path))  # stable: same order everywhere
@@ -1,7 +1,11 @@
+import sys
+
 import pytest
-from _pytest.config import Parser
+from _pytest.config import Config, Parser
 from _pytest.main import Session
 
+from pytest_plugins.utils.pytest_helper import unregister_plugin
+
 
 def pytest_addoption(parser: Parser) -> None:
     parser.addoption(
@@ -12,6 +16,11 @@ def pytest_addoption(parser: Parser) -> None:
     )
 
 
+def pytest_configure(config: Config) -> None:
+    if not config.getoption("--require-tests"):
+        unregister_plugin(config=config, plugin=sys.modules[__name__])
+
+
 def pytest_collection_finish(session: Session) -> None:
     if session.config.option.require_tests and not session.items:
         raise pytest.UsageError("--require-tests: No tests collected.")
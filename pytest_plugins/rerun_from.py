@@ -0,0 +1,56 @@
+import sys
+from pathlib import Path
+
+import pytest
+from _pytest.config import Config, Parser
+from _pytest.python import Function
+from custom_python_logger import get_logger
+
+from pytest_plugins.const import LOGGER_NAME, TEST_RESULTS_FILENAME
+from pytest_plugins.utils.history import load_failed_tests, resolve_history_path
+from pytest_plugins.utils.pytest_helper import get_test_identity, unregister_plugin
+
+logger = get_logger(f"{LOGGER_NAME}.rerun_from")
+
+
+def pytest_addoption(parser: Parser) -> None:
+    parser.addoption(
+        "--rerun-from",
+        action="store",
+        default=None,
+        type=Path,
+        help=f'Run only the tests that failed (or failed-skipped) in a previous "{TEST_RESULTS_FILENAME}" (plain or '
+        'compressed, e.g. downloaded from a CI run), a "--better-report-history" store, or the output dir holding '
+        "them, and deselect the others",
+    )
+
+
+def pytest_configure(config: Config) -> None:
+    if not config.getoption("--rerun-from"):
+        unregister_plugin(config=config, plugin=sys.modules[__name__])
+        return
+
+    path = resolve_history_path(path=config.getoption("--rerun-from"), results_filename=TEST_RESULTS_FILENAME)
+    if not path.is_file():
+        raise pytest.UsageError(f"--rerun-from: No test results found at {path}")
+    config._rerun_from_failed_tests = load_failed_tests(path=path)  # pylint: disable=W0212
+    logger.debug(f"Rerun from: {len(config._rerun_from_failed_tests)} failed test names loaded from {path}")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config: Config, items: list[Function]) -> None:
+    if (failed_tests := getattr(config, "_rerun_from_failed_tests", None)) is None:
+        return
+
+    selected = []
+    deselected = []
+    for item in items:
+        identity = get_test_identity(item=item)
+        if failed_tests.intersection((identity.test_full_path, identity.test_full_name, identity.pytest_test_name)):
+            selected.append(item)
+        else:
+            deselected.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+    logger.info(f"Rerun from: {len(selected)} previously failed tests selected, {len(deselected)} deselected")
@@ -0,0 +1,158 @@
+import os
+import sys
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from _pytest.config import Config, Parser
+from _pytest.main import Session
+from _pytest.python import Function
+from custom_python_logger import get_logger
+
+from pytest_plugins.better_report import test_results
+from pytest_plugins.const import LOGGER_NAME
+from pytest_plugins.models import ExecutionStatus
+from pytest_plugins.utils.pytest_helper import get_test_identity, get_xdist_worker_id, unregister_plugin
+from pytest_plugins.utils.result_cache import (
+    DEFAULT_MAX_ENTRIES,
+    RESULT_CACHE_FILENAME,
+    CacheKeyBuilder,
+    ResultCache,
+)
+
+logger = get_logger(f"{LOGGER_NAME}.result_cache")
+global_interface = {}
+
+cache_key_key = pytest.StashKey[str]()
+cache_hit_key = pytest.StashKey[bool]()
+call_passed_key = pytest.StashKey[bool]()
+CACHED_PASS_REASON = "cached-pass: passed before with the same code and environment"
+
+
+def pytest_addoption(parser: Parser) -> None:
+    parser.addoption(
+        "--result-cache",
+        action="store_true",
+        default=False,
+        help="Skip the tests that passed before with the same test file, conftest / fixture files and environment, "
+        f'reported as "{ExecutionStatus.CACHED_PASS}"',
+    )
+    parser.addoption(
+        "--result-cache-refresh",
+        action="store_true",
+        default=False,
+        help="Run every test (a full re-run) and refresh the result cache with the results",
+    )
+    parser.addoption(
+        "--result-cache-dir",
+        action="store",
+        default=None,
+        type=Path,
+        help=f'The directory of the "{RESULT_CACHE_FILENAME}" store (default is "<rootdir>/.result_cache")',
+    )
+    parser.addoption(
+        "--result-cache-max-entries",
+        action="store",
+        default=DEFAULT_MAX_ENTRIES,
+        type=int,
+        help=f"The most cached passes kept, the least recently used are evicted (default is {DEFAULT_MAX_ENTRIES})",
+    )
+    parser.addoption(
+        "--result-cache-env",
+        action="append",
+        default=[],
+        help="An environment variable the results depend on, part of the cache key (repeatable)",
+    )
+
+
+def pytest_configure(config: Config) -> None:
+    if not config.getoption("--result-cache"):
+        unregister_plugin(config=config, plugin=sys.modules[__name__])
+        return
+
+    if (max_entries := config.getoption("--result-cache-max-entries")) < 1:
+        raise pytest.UsageError(f"--result-cache-max-entries: expected a positive number, got {max_entries}")
+
+    cache_dir = config.getoption("--result-cache-dir") or config.rootpath / ".result_cache"
+    cache = ResultCache(path=cache_dir / RESULT_CACHE_FILENAME, max_entries=max_entries)
+    config._result_cache = cache  # pylint: disable=W0212
+    # a full re-run (--result-cache-refresh) matches no key, its results replace the cached ones
+    cached_keys = set() if config.getoption("--result-cache-refresh") else cache.get_keys()
+    config._result_cache_keys = cached_keys  # pylint: disable=W0212
+    config._result_cache_key_builder = CacheKeyBuilder(  # pylint: disable=W0212
+        rootpath=config.rootpath,
+        environment={name: os.environ.get(name) for name in config.getoption("--result-cache-env")},
+    )
+    # cache key -> test_full_name of the passed tests, the keys of the failed tests and of the cached passes
+    global_interface["outcomes"] = {"passed": {}, "failed": set(), "used": set()}
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config: Config, items: list[Function]) -> None:
+    if (key_builder := getattr(config, "_result_cache_key_builder", None)) is None:
+        return
+
+    cached_keys = config._result_cache_keys  # pylint: disable=W0212
+    hits = 0
+    for item in items:
+        key = key_builder.key(item=item, test_full_path=get_test_identity(item=item).test_full_path)
+        item.stash[cache_key_key] = key
+        if key in cached_keys:
+            item.stash[cache_hit_key] = True
+            item.add_marker(pytest.mark.skip(reason=CACHED_PASS_REASON))
+            hits += 1
+    logger.info(f"Result cache: {hits} of {len(items)} tests passed before unchanged, skipped")
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item: Function, call: Any) -> Generator[None, Any, None]:
+    outcome = yield
+    report = outcome.get_result()
+    if (key := item.stash.get(cache_key_key, None)) is None:
+        return
+
+    cache_hit = item.stash.get(cache_hit_key, False)
+    if cache_hit and call.when == "setup" and report.skipped:
+        if (test_full_name := get_test_identity(item=item).test_full_name) in test_results:
+            test_results[test_full_name].test_status = ExecutionStatus.CACHED_PASS
+    if call.when == "call":
+        item.stash[call_passed_key] = report.passed and not hasattr(report, "wasxfail")
+    if report.failed:
+        report.result_cache = {"key": key, "outcome": "failed"}
+    elif call.when == "teardown":
+        if cache_hit:
+            report.result_cache = {"key": key, "outcome": "used"}
+        elif item.stash.get(call_passed_key, False):
+            test_full_name = get_test_identity(item=item).test_full_name
+            report.result_cache = {"key": key, "outcome": "passed", "test_full_name": test_full_name}
+
+
+def pytest_runtest_logreport(report: pytest.TestReport) -> None:
+    """Runs on the xdist controller too, the result_cache attribute is shipped with the workers' reports."""
+    if not (result := getattr(report, "result_cache", None)):
+        return
+
+    outcomes = global_interface["outcomes"]
+    if result["outcome"] == "failed":
+        outcomes["passed"].pop(result["key"], None)
+        outcomes["failed"].add(result["key"])
+    elif result["outcome"] == "used":
+        outcomes["used"].add(result["key"])
+    elif result["key"] not in outcomes["failed"]:
+        outcomes["passed"][result["key"]] = result["test_full_name"]
+
+
+def pytest_sessionfinish(session: Session) -> None:
+    cache = session.config._result_cache  # pylint: disable=W0212
+    if get_xdist_worker_id(config=session.config):
+        cache.close()
+        return  # the controller gets every report and updates the cache once
+
+    outcomes = global_interface["outcomes"]
+    with cache:
+        cache.update(passed=outcomes["passed"], failed=outcomes["failed"], used=outcomes["used"])
+        logger.info(
+            f"Result cache: {len(outcomes['passed'])} passes added, {len(outcomes['failed'])} failures dropped, "
+            f"{len(cache)} cached passes kept"
+        )
@@ -0,0 +1,107 @@
+import sys
+from pathlib import Path
+
+import pytest
+from _pytest.config import Config, Parser
+from _pytest.main import Session
+from _pytest.python import Function
+from custom_python_logger import get_logger
+
+from pytest_plugins.const import LOGGER_NAME, TEST_RESULTS_FILENAME
+from pytest_plugins.models import ShardPlan
+from pytest_plugins.utils.helper import dataclass_to_dict
+from pytest_plugins.utils.history import load_history_index, predict_durations, resolve_history_path
+from pytest_plugins.utils.pytest_helper import get_test_identity, unregister_plugin
+from pytest_plugins.utils.sharding import SHARD_PLAN_WORKEROUTPUT_KEY, lpt_partition, shard_totals
+
+logger = get_logger(f"{LOGGER_NAME}.shard")
+
+
+def pytest_addoption(parser: Parser) -> None:
+    parser.addoption(
+        "--shard-count",
+        action="store",
+        default=None,
+        type=int,
+        help="Split the tests into N shards of about the same predicted run time, and run only --shard-index",
+    )
+    parser.addoption(
+        "--shard-index",
+        action="store",
+        default=None,
+        type=int,
+        help="The shard to run, from 0 to --shard-count - 1",
+    )
+    parser.addoption(
+        "--shard-history",
+        action="store",
+        default=None,
+        type=Path,
+        help=f'A previous "{TEST_RESULTS_FILENAME}" (plain or compressed), a "--better-report-history" store, or the '
+        "output dir holding them, whose durations predict the run time of the tests, without it every test weighs "
+        "the same",
+    )
+
+
+def pytest_configure(config: Config) -> None:
+    shard_count = config.getoption("--shard-count")
+    shard_index = config.getoption("--shard-index")
+    if shard_count is None and shard_index is None:
+        unregister_plugin(config=config, plugin=sys.modules[__name__])
+        return
+
+    if shard_count is None or shard_index is None:
+        raise pytest.UsageError("--shard-count and --shard-index must be given together")
+    if shard_count < 1:
+        raise pytest.UsageError(f"--shard-count: expected a positive number of shards, got {shard_count}")
+    if not 0 <= shard_index < shard_count:
+        raise pytest.UsageError(f"--shard-index: expected a shard from 0 to {shard_count - 1}, got {shard_index}")
+
+    config._shard_history_index = {}  # pylint: disable=W0212
+    config._shard_history_path = None  # pylint: disable=W0212
+    if history := config.getoption("--shard-history"):
+        path = resolve_history_path(path=history, results_filename=TEST_RESULTS_FILENAME)
+        if not path.is_file():
+            raise pytest.UsageError(f"--shard-history: No test results found at {path}")
+        config._shard_history_index = load_history_index(path=path)  # pylint: disable=W0212
+        config._shard_history_path = str(path)  # pylint: disable=W0212
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config: Config, items: list[Function]) -> None:
+    if (index := getattr(config, "_shard_history_index", None)) is None:
+        return
+
+    shard_count = config.getoption("--shard-count")
+    shard_index = config.getoption("--shard-index")
+    test_full_paths = [get_test_identity(item=item).test_full_path for item in items]
+    durations = predict_durations(index=index, test_full_paths=test_full_paths)
+    assignments = lpt_partition(durations=durations, shard_count=shard_count)
+    shard_test_counts, shard_predicted_duration_sec = shard_totals(
+        durations=durations, assignments=assignments, shard_count=shard_count
+    )
+    config._shard_plan = ShardPlan(  # pylint: disable=W0212
+        shard_count=shard_count,
+        shard_index=shard_index,
+        history_path=config._shard_history_path,  # pylint: disable=W0212
+        tests_with_history=sum(1 for test_full_path in test_full_paths if test_full_path in index),
+        shard_test_counts=shard_test_counts,
+        shard_predicted_duration_sec=shard_predicted_duration_sec,
+        predicted_duration_sec=shard_predicted_duration_sec[shard_index],
+    )
+
+    selected = [item for item, assigned in zip(items, assignments, strict=True) if assigned == shard_index]
+    deselected = [item for item, assigned in zip(items, assignments, strict=True) if assigned != shard_index]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+    logger.debug(
+        f"Shard {shard_index + 1}/{shard_count}: {len(selected)} of {len(assignments)} tests, "
+        f"predicted {shard_predicted_duration_sec[shard_index]:.2f}s"
+    )
+
+
+def pytest_sessionfinish(session: Session) -> None:
+    plan = getattr(session.config, "_shard_plan", None)
+    if plan and (workeroutput := getattr(session.config, "workeroutput", None)) is not None:
+        workeroutput[SHARD_PLAN_WORKEROUTPUT_KEY] = dataclass_to_dict(plan)  # shipped to the xdist controller
@@ -0,0 +1,99 @@
+from pytest_plugins.models import AggregateData, ExecutionStatus, TestData
+from pytest_plugins.utils.helper import dataclass_to_dict
+
+PASSED_STATUSES = frozenset(
+    {ExecutionStatus.PASSED, ExecutionStatus.XFAIL, ExecutionStatus.XPASS, ExecutionStatus.CACHED_PASS}
+)
+FAILED_STATUSES = frozenset({ExecutionStatus.FAILED})
+SKIPPED_STATUSES = frozenset({ExecutionStatus.SKIPPED, ExecutionStatus.FAILED_SKIPPED})
+
+
+def _status_counts(status: str) -> tuple[int, int, int]:
+    return int(status in PASSED_STATUSES), int(status in FAILED_STATUSES), int(status in SKIPPED_STATUSES)
+
+
+def _get_group(groups: dict[str, AggregateData], name: str) -> AggregateData:
+    if (group := groups.get(name)) is None:
+        group = groups[name] = AggregateData(name=name)
+    return group
+
+
+class ResultAggregates:
+    """
+    Per-file and per-class totals of the finished tests, updated as every test finishes (no rescan of the results).
+    A rerun test replaces its previous run in the counts and the total duration, the max duration keeps every run.
+    """
+
+    def __init__(self) -> None:
+        self.files: dict[str, AggregateData] = {}
+        self.classes: dict[str, AggregateData] = {}
+        # test full path (or full name) -> (status, duration) already counted
+        self._added: dict[str, tuple[str, float]] = {}
+
+    def _groups(self, test_file_name: str, class_test_name: str | None) -> list[AggregateData]:
+        file_name = test_file_name or "-"
+        groups = [_get_group(groups=self.files, name=file_name)]
+        if class_test_name:
+            groups.append(_get_group(groups=self.classes, name=f"{file_name}::{class_test_name}"))
+        return groups
+
+    def add_result(
+        self,
+        test_full_name: str,
+        test_file_name: str,
+        class_test_name: str | None,
+        test_status: str,
+        test_duration_sec: float | None,
+        test_full_path: str | None = None,
+    ) -> None:
+        duration = test_duration_sec or 0.0
+        passed, failed, skipped = _status_counts(test_status)
+        key = test_full_path or test_full_name  # the same-named tests of different modules are different tests
+        previous = self._added.get(key)
+        self._added[key] = (test_status, duration)
+        for group in self._groups(test_file_name=test_file_name, class_test_name=class_test_name):
+            if previous:
+                previous_passed, previous_failed, previous_skipped = _status_counts(previous[0])
+                group.passed_count -= previous_passed
+                group.failed_count -= previous_failed
+                group.skipped_count -= previous_skipped
+                group.total_duration_sec -= previous[1]
+            else:
+                group.test_count += 1
+            group.passed_count += passed
+            group.failed_count += failed
+            group.skipped_count += skipped
+            group.total_duration_sec += duration
+            group.max_duration_sec = max(group.max_duration_sec, duration)
+
+    def add(self, test_data: TestData) -> None:
+        self.add_result(
+            test_full_name=test_data.test_full_name,
+            test_file_name=test_data.test_file_name,
+            class_test_name=test_data.class_test_name,
+            test_status=test_data.test_status,
+            test_duration_sec=test_data.test_duration_sec,
+            test_full_path=test_data.test_full_path,
+        )
+
+    def get_results(self) -> dict[str, tuple[str, float]]:
+        """The status and duration of every finished test by test full path (the last run of a rerun test)."""
+        return self._added
+
+    def get_total_duration_sec(self) -> float:
+        """The summed duration of the finished tests."""
+        return sum(group.total_duration_sec for group in self.files.values())
+
+    def get_files(self) -> list[AggregateData]:
+        """The files, the slowest first."""
+        return sorted(self.files.values(), key=lambda group: group.total_duration_sec, reverse=True)
+
+    def get_classes(self) -> list[AggregateData]:
+        """The classes, the slowest first."""
+        return sorted(self.classes.values(), key=lambda group: group.total_duration_sec, reverse=True)
+
+    def to_dict(self) -> dict:
+        return {
+            "files": {group.name: dataclass_to_dict(group) for group in self.get_files()},
+            "classes": {group.name: dataclass_to_dict(group) for group in self.get_classes()},
+        }
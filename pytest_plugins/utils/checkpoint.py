@@ -0,0 +1,105 @@
+import json
+import os
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from pytest_plugins.utils.helper import open_json, save_as_json
+from pytest_plugins.utils.serializer import JsonSerializer, OrjsonSerializer
+
+
+class Checkpointer:
+    """
+    Periodically persists the report state, every N finished tests and/or every T seconds.
+    The whole state is saved once (save), then each checkpoint appends only the records finished since the previous
+    one to the journal, one compact JSON line per record, so a checkpoint costs the tests it covers, not the run.
+    A checkpoint due before any save (e.g. on an xdist controller, which collects no tests) saves the whole state
+    from the state callable instead, so the journal always has a base to be merged into.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        journal_path: Path | None = None,
+        every_tests: int | None = None,
+        every_seconds: float | None = None,
+        serializer: JsonSerializer | OrjsonSerializer | None = None,
+        state: Callable[[], dict] | None = None,
+    ) -> None:
+        self.path = path
+        self.journal_path = journal_path or path.with_suffix(".ndjson")
+        self.every_tests = every_tests
+        self.every_seconds = every_seconds
+        self.serializer = serializer or JsonSerializer()
+        self.state = state
+        self.saved = False
+        self.pending_records: list[Any] = []
+        self.tests_since_checkpoint = 0
+        self.last_checkpoint_time = time.monotonic()
+
+    def tick(self, record: Any = None) -> bool:
+        """Count a finished test (its record, if any, is journaled) and save a checkpoint when one is due."""
+        self.tests_since_checkpoint += 1
+        if record is not None:
+            self.pending_records.append(record)
+        due_by_count = bool(self.every_tests) and self.tests_since_checkpoint >= self.every_tests
+        due_by_time = bool(self.every_seconds) and time.monotonic() - self.last_checkpoint_time >= self.every_seconds
+        if not (due_by_count or due_by_time):
+            return False
+
+        self.flush()
+        return True
+
+    def save(self, state: dict | None = None) -> None:
+        """Save the whole state (by default from the state callable) and start a new journal."""
+        save_as_json(
+            path=self.path,
+            data={"checkpoint_time": datetime.now(UTC).isoformat(), **(self.state() if state is None else state)},
+            atomic=True,
+            serializer=self.serializer,
+        )
+        self.journal_path.unlink(missing_ok=True)
+        self.saved = True
+        self.pending_records.clear()
+        self.tests_since_checkpoint = 0
+        self.last_checkpoint_time = time.monotonic()
+
+    def flush(self) -> None:
+        """Append the records finished since the last checkpoint to the journal."""
+        if not self.saved and self.state is not None:
+            self.save()  # the first checkpoint: the whole state holds the pending records too
+            return
+
+        with open(self.journal_path, "a", encoding="utf-8") as journal:
+            journal.writelines(f"{self.serializer.dumps(record)}\n" for record in self.pending_records)
+            journal.flush()
+            os.fsync(journal.fileno())
+        self.pending_records.clear()
+        self.tests_since_checkpoint = 0
+        self.last_checkpoint_time = time.monotonic()
+
+    def discard(self) -> None:
+        self.path.unlink(missing_ok=True)
+        self.journal_path.unlink(missing_ok=True)
+
+
+def load_checkpoint(path: Path) -> dict:
+    return open_json(path)
+
+
+def load_records(path: Path) -> dict[str, dict]:
+    """The records of a journal or an ndjson results file by test_full_name, the latest line of a test wins."""
+    records: dict[str, dict] = {}
+    if not path.exists():
+        return records
+
+    with open(path, encoding="utf-8") as ndjson_file:
+        for line in ndjson_file:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                break  # the process was killed in the middle of writing this record
+            records[record["test_full_name"]] = record
+    return records
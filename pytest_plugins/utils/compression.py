@@ -0,0 +1,56 @@
+import bz2
+import gzip
+import lzma
+from collections.abc import Callable
+from pathlib import Path
+from typing import IO
+
+# compression name -> (file suffix, opener), all stdlib codecs
+COMPRESSIONS: dict[str, tuple[str, Callable[..., IO]]] = {
+    "gzip": (".gz", gzip.open),
+    "lzma": (".xz", lzma.open),
+    "bz2": (".bz2", bz2.open),
+}
+
+# leading bytes of each compressed format -> opener
+MAGIC_BYTES: dict[bytes, Callable[..., IO]] = {
+    b"\x1f\x8b": gzip.open,
+    b"\xfd7zXZ\x00": lzma.open,
+    b"BZh": bz2.open,
+}
+MAGIC_BYTES_LENGTH = max(len(magic) for magic in MAGIC_BYTES)
+
+
+def compressed_path(path: Path, compression: str | None) -> Path:
+    """The path of the file once compressed (e.g. "test_results.json" -> "test_results.json.gz")."""
+    if not compression:
+        return path
+    return path.with_name(f"{path.name}{COMPRESSIONS[compression][0]}")
+
+
+def resolve_compressed_path(path: Path) -> Path:
+    """The path itself if it exists, otherwise its first existing compressed variant (or the path as is)."""
+    if path.exists():
+        return path
+    for compression in COMPRESSIONS:
+        if (candidate := compressed_path(path=path, compression=compression)).exists():
+            return candidate
+    return path
+
+
+def open_for_write(path: Path, compression: str | None, binary: bool = False) -> IO:
+    mode = "wb" if binary else "wt"
+    encoding = None if binary else "utf-8"
+    if not compression:
+        return open(path, mode, encoding=encoding)  # pylint: disable=R1732
+    return COMPRESSIONS[compression][1](path, mode, encoding=encoding)
+
+
+def open_for_read(path: Path, binary: bool = False) -> IO:
+    """Open a plain or compressed file, the compression is detected from its magic bytes (not its suffix)."""
+    with open(path, "rb") as raw_file:
+        head = raw_file.read(MAGIC_BYTES_LENGTH)
+    opener = next((opener for magic, opener in MAGIC_BYTES.items() if head.startswith(magic)), open)
+    if binary:
+        return opener(path, "rb")
+    return opener(path, "rt", encoding="utf-8")
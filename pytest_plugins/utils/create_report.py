@@ -1,26 +1,154 @@
-def generate_md_report(report: dict) -> str:
-    status_icons = {
-        "passed": "✅",
-        "failed": "❌",
-        "xpassed": "✅",
-        "xfailed": "❌",
-        "failed-skipped": "⚠️",
-        "skipped": "⏭️",
-        "collected": "📋",
-    }
-    rows = ["| No. | Test Name | Status | Duration | Message |", "|:---:|-----------|:------:|:--------:|---------|"]
-    stats = {"passed": 0, "failed": 0, "xpassed": 0, "xfailed": 0, "failed-skipped": 0, "skipped": 0, "collected": 0}
-    for index, test in enumerate(report.values(), start=1):
-        status = test["test_status"]
-        stats[status] += 1
-        name = test["test_full_name"]
-        icon = status_icons.get(status, status)
-        duration = f"{test['test_duration_sec']:.2f}s"
-        msg = test["exception_message"]["message"] if test["exception_message"] else "-"
-        rows.append(f"|{index}| `{name}` | {icon} {status} | {duration} | `{msg}` |")
-
-    total_summary = f"\n🧪 Total: {len(report)} &nbsp;&nbsp;| &nbsp;&nbsp;" + " &nbsp;&nbsp;| &nbsp;&nbsp;".join(
-        f"{icon} {k.capitalize()}: {v}" for k, v in stats.items() for icon in (status_icons.get(k, ""),)
+import heapq
+from collections.abc import Iterable, Iterator, Mapping
+
+from pytest_plugins.models import AggregateData, TestData
+from pytest_plugins.utils.aggregates import ResultAggregates
+from pytest_plugins.utils.helper import dataclass_to_dict
+
+
+def _format_duration(duration: float | None) -> str:
+    return f"{duration:.2f}s" if duration is not None else "-"
+
+
+SLOWEST_FIXTURES_ROWS = 10
+
+
+def _generate_slowest_fixtures_table(fixture_results: dict) -> str:
+    rows = [
+        "| Fixture | Scope | Setups | Cache Hits | Total | Setup p50 | Setup p95 | Teardown p50 | Teardown p95 |",
+        "|---------|:-----:|:------:|:----------:|:-----:|:---------:|:---------:|:------------:|:------------:|",
+    ]
+    slowest = sorted(fixture_results.values(), key=lambda fixture: fixture["total_sec"], reverse=True)
+    for fixture in slowest[:SLOWEST_FIXTURES_ROWS]:
+        durations = " | ".join(
+            _format_duration(fixture[key])
+            for key in ("total_sec", "setup_p50_sec", "setup_p95_sec", "teardown_p50_sec", "teardown_p95_sec")
+        )
+        rows.append(
+            f"| `{fixture['fixture_name']}` | {fixture['scope']} | {fixture['setup_count']} | "
+            f"{fixture['cache_hits']} | {durations} |"
+        )
+    return "\n<br> \n\n### 🐢 Slowest Fixtures: <br> \n\n" + "\n".join(rows)
+
+
+STATUS_ICONS = {
+    "passed": "✅",
+    "failed": "❌",
+    "xpassed": "✅",
+    "xfailed": "❌",
+    "failed-skipped": "⚠️",
+    "skipped": "⏭️",
+    "cached-pass": "♻️",
+    "collected": "📋",
+}
+FAILURE_STATUSES = frozenset({"failed", "failed-skipped"})  # listed first in a truncated tests table
+TESTS_TABLE_HEADER = (
+    "| No. | Test Name | Status | Duration | Setup | Call | Teardown | Message |\n"
+    "|:---:|-----------|:------:|:--------:|:-----:|:----:|:--------:|---------|"
+)
+
+
+def iter_test_dicts(report: Mapping[str, TestData | dict] | Iterable[TestData | dict]) -> Iterator[dict]:
+    for test in report.values() if isinstance(report, Mapping) else report:
+        yield dataclass_to_dict(test) if isinstance(test, TestData) else test  # shallow, no JSON round-trip
+
+
+def _format_test_row(index: int, test: dict) -> str:
+    status = test["test_status"]
+    duration = _format_duration(test["test_duration_sec"])
+    phases = " | ".join(_format_duration(test.get(f"{phase}_duration_sec")) for phase in ("setup", "call", "teardown"))
+    msg = test["exception_message"]["message"] if test["exception_message"] else "-"
+    icon = STATUS_ICONS.get(status, status)
+    return f"|{index}| `{test['test_full_name']}` | {icon} {status} | {duration} | {phases} | `{msg}` |"
+
+
+def _row_priority(row: tuple[int, dict]) -> tuple[bool, float]:
+    _, test = row
+    return test["test_status"] in FAILURE_STATUSES, test["test_duration_sec"] or 0.0
+
+
+def _generate_aggregates_table(title: str, groups: list[AggregateData]) -> str:
+    rows = [
+        "| Name | Tests | ✅ Passed | ❌ Failed | ⏭️ Skipped | Total Duration | Max Duration |",
+        "|------|:-----:|:---------:|:---------:|:----------:|:--------------:|:------------:|",
+    ]
+    rows.extend(
+        f"| `{group.name}` | {group.test_count} | {group.passed_count} | {group.failed_count} | {group.skipped_count} | "
+        f"{_format_duration(group.total_duration_sec)} | {_format_duration(group.max_duration_sec)} |"
+        for group in groups
+    )
+    return f"\n<br> \n\n<details>\n<summary>{title}</summary>\n\n" + "\n".join(rows) + "\n\n</details>"
+
+
+def iter_md_report(
+    report: Mapping[str, TestData | dict] | Iterable[TestData | dict],
+    fixture_results: dict | None = None,
+    max_rows: int | None = None,
+    aggregates: ResultAggregates | None = None,
+) -> Iterator[str]:
+    """
+    The markdown report in chunks, to be written to the file as they come instead of joined into one string.
+    With max_rows the tests table is truncated to the failures first then the slowest tests, picked with a
+    max_rows-sized heap, otherwise every test is listed in run order.
+    The per-file and per-class totals come from the aggregates when given (kept up to date during the session),
+    otherwise they are aggregated from the report while its rows are written.
+    """
+    stats = dict.fromkeys(STATUS_ICONS, 0)
+    report_aggregates = aggregates or ResultAggregates()
+    total = 0
+
+    def _counted_rows() -> Iterator[tuple[int, dict]]:
+        nonlocal total
+        for index, test in enumerate(iter_test_dicts(report), start=1):
+            total = index
+            status = test["test_status"]
+            stats[status] += 1
+            if aggregates is None:
+                report_aggregates.add_result(
+                    test_full_name=test["test_full_name"],
+                    test_file_name=test.get("test_file_name"),
+                    class_test_name=test.get("class_test_name"),
+                    test_status=status,
+                    test_duration_sec=test["test_duration_sec"],
+                    test_full_path=test.get("test_full_path"),
+                )
+            yield index, test
+
+    yield "## ✅ Test Report Summary\n\n" + TESTS_TABLE_HEADER
+    if max_rows is None:
+        for index, test in _counted_rows():
+            yield f"\n{_format_test_row(index, test)}"
+    else:
+        selected = heapq.nlargest(max_rows, _counted_rows(), key=_row_priority)
+        for index, test in selected:
+            yield f"\n{_format_test_row(index, test)}"
+        if total > len(selected):
+            yield f"\n\n_Showing {len(selected)} of {total} tests: the failures first, then the slowest._"
+
+    total_summary = f"\n🧪 Total: {total} &nbsp;&nbsp;| &nbsp;&nbsp;" + " &nbsp;&nbsp;| &nbsp;&nbsp;".join(
+        f"{STATUS_ICONS.get(k, '')} {k.capitalize()}: {v}" for k, v in stats.items()
     )
+    yield f"\n<br> \n\n### Summary: <br> \n{total_summary}"
+    if files := report_aggregates.get_files():
+        yield _generate_aggregates_table(title=f"📁 Per-file summary ({len(files)} files, slowest first)", groups=files)
+    if classes := report_aggregates.get_classes():
+        yield _generate_aggregates_table(
+            title=f"🧩 Per-class summary ({len(classes)} classes, slowest first)", groups=classes
+        )
+    if fixture_results:
+        yield _generate_slowest_fixtures_table(fixture_results=fixture_results)
+
 
-    return "## ✅ Test Report Summary\n\n" + "\n".join(rows) + f"\n<br> \n\n### Summary: <br> \n{total_summary}"
+def generate_md_report(
+    report: Mapping[str, TestData | dict] | Iterable[TestData | dict],
+    fixture_results: dict | None = None,
+    max_rows: int | None = None,
+    aggregates: ResultAggregates | None = None,
+) -> str:
+    """
+    The report is the test results keyed by name, or any iterable of the results (e.g. streamed from the ndjson file);
+    a result is a TestData as collected, or its already serialized dict.
+    """
+    return "".join(
+        iter_md_report(report=report, fixture_results=fixture_results, max_rows=max_rows, aggregates=aggregates)
+    )
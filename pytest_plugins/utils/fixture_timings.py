@@ -0,0 +1,102 @@
+import math
+import time
+from collections import defaultdict
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from _pytest.fixtures import FixtureDef, SubRequest
+from _pytest.main import Session
+from _pytest.python import Function
+
+from pytest_plugins.models import FixtureData
+
+FIXTURE_TIMINGS_WORKEROUTPUT_KEY = "better_report_fixture_timings"
+
+
+def percentile(values: list[float], percent: float) -> float | None:
+    """Nearest-rank percentile of the values (None when there are no values)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+
+class FixtureTimings:
+    """Records the setup and teardown time, the scope and the cache hits of every fixture."""
+
+    def __init__(self) -> None:
+        self.scopes: dict[str, str] = {}
+        self.uses: dict[str, int] = defaultdict(int)  # tests that requested the fixture (directly or not)
+        self.setup_durations: dict[str, list[float]] = defaultdict(list)
+        self.teardown_durations: dict[str, list[float]] = defaultdict(list)
+        self._teardown_start_ns: dict[FixtureDef, int] = {}
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item: Function) -> None:
+        for fixture_name in item.fixturenames:
+            self.uses[fixture_name] += 1
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef: FixtureDef, request: SubRequest) -> Generator[None, Any, None]:
+        # pylint: disable=W0613
+        start_ns = time.perf_counter_ns()
+        yield
+        self.setup_durations[fixturedef.argname].append((time.perf_counter_ns() - start_ns) / 1e9)
+        self.scopes[fixturedef.argname] = fixturedef.scope
+        # finalizers run last-in first-out, so this one marks the start of the fixture teardown
+        fixturedef.addfinalizer(lambda: self._teardown_start_ns.__setitem__(fixturedef, time.perf_counter_ns()))
+
+    def pytest_fixture_post_finalizer(
+        self, fixturedef: FixtureDef, request: SubRequest
+    ) -> None:  # pylint: disable=W0613
+        if (start_ns := self._teardown_start_ns.pop(fixturedef, None)) is None:
+            return
+        self.teardown_durations[fixturedef.argname].append((time.perf_counter_ns() - start_ns) / 1e9)
+
+    def pytest_sessionfinish(self, session: Session) -> None:
+        if (workeroutput := getattr(session.config, "workeroutput", None)) is not None:
+            workeroutput[FIXTURE_TIMINGS_WORKEROUTPUT_KEY] = self.to_dict()  # shipped to the xdist controller
+
+    def to_dict(self) -> dict:
+        return {
+            "scopes": self.scopes,
+            "uses": dict(self.uses),
+            "setup_durations": dict(self.setup_durations),
+            "teardown_durations": dict(self.teardown_durations),
+        }
+
+    def merge(self, data: dict) -> None:
+        """Merge the timings recorded by another process (an xdist worker)."""
+        self.scopes.update(data["scopes"])
+        for fixture_name, uses in data["uses"].items():
+            self.uses[fixture_name] += uses
+        for fixture_name, durations in data["setup_durations"].items():
+            self.setup_durations[fixture_name].extend(durations)
+        for fixture_name, durations in data["teardown_durations"].items():
+            self.teardown_durations[fixture_name].extend(durations)
+
+    def get_fixture_results(self) -> dict[str, FixtureData]:
+        """Timings aggregated per fixture, the slowest (setup + teardown) first."""
+        results = []
+        for fixture_name, setup_durations in self.setup_durations.items():
+            teardown_durations = self.teardown_durations.get(fixture_name, [])
+            setup_total_sec, teardown_total_sec = sum(setup_durations), sum(teardown_durations)
+            results.append(
+                FixtureData(
+                    fixture_name=fixture_name,
+                    scope=self.scopes[fixture_name],
+                    setup_count=len(setup_durations),
+                    cache_hits=max(self.uses.get(fixture_name, 0) - len(setup_durations), 0),
+                    setup_total_sec=setup_total_sec,
+                    setup_p50_sec=percentile(values=setup_durations, percent=50),
+                    setup_p95_sec=percentile(values=setup_durations, percent=95),
+                    teardown_count=len(teardown_durations),
+                    teardown_total_sec=teardown_total_sec,
+                    teardown_p50_sec=percentile(values=teardown_durations, percent=50),
+                    teardown_p95_sec=percentile(values=teardown_durations, percent=95),
+                    total_sec=setup_total_sec + teardown_total_sec,
+                )
+            )
+        results.sort(key=lambda fixture: fixture.total_sec, reverse=True)
+        return {fixture.fixture_name: fixture for fixture in results}
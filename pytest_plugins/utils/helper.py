@@ -1,11 +1,17 @@
 import json
-from collections.abc import Callable
+import os
+from collections.abc import Callable, Iterable
+from dataclasses import fields, is_dataclass
+from functools import cache
+from operator import attrgetter
 from pathlib import Path
 
 from custom_python_logger import get_logger
 from python_base_toolkit.utils.data_serialization import default_serialize
 
 from pytest_plugins import LOGGER_NAME
+from pytest_plugins.utils.compression import compressed_path, open_for_read, open_for_write
+from pytest_plugins.utils.serializer import JsonSerializer, OrjsonSerializer
 
 logger = get_logger(f"{LOGGER_NAME}")
 
@@ -18,27 +24,70 @@ def get_project_root(marker: str = ".git") -> Path | None:
     return None
 
 
+@cache
+def _dataclass_fields_getter(cls: type) -> tuple[tuple[str, ...], Callable[[object], tuple]]:
+    names = tuple(field.name for field in fields(cls))
+    getter = attrgetter(*names) if len(names) > 1 else lambda obj: tuple(getattr(obj, name) for name in names)
+    return names, getter
+
+
+def dataclass_to_dict(obj: object) -> dict:
+    """Shallow dict of a dataclass instance, also for slotted dataclasses (which have no __dict__)."""
+    names, getter = _dataclass_fields_getter(type(obj))
+    return dict(zip(names, getter(obj), strict=True))
+
+
 def serialize_data(obj: object) -> object:  # default_serialize
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return dataclass_to_dict(obj)
     return default_serialize(obj=obj)
 
 
 def open_json(path: Path) -> dict:
-    with open(path, encoding="utf-8") as json_file:
+    with open_for_read(path) as json_file:  # plain or compressed
         return json.load(json_file)
 
 
-def save_as_json(path: Path, data: dict, default: Callable | None = None) -> None:
+def save_as_json(
+    path: Path,
+    data: dict,
+    default: Callable | None = None,
+    atomic: bool = False,
+    serializer: JsonSerializer | OrjsonSerializer | None = None,
+    compression: str | None = None,
+) -> Path:
+    """Save the data and return the written path (with the suffix of the compression, e.g. ".gz")."""
     if not path.parent.exists():
         path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(path, "w", encoding="utf-8") as json_file:
-        text = json.dumps(data, indent=4, default=default) if default else json.dumps(data, indent=4)
-        json_file.write(text)
+    serializer = serializer or JsonSerializer(pretty=True, default=default)
+    path = compressed_path(path=path, compression=compression)
+    target_path = path.with_name(f"{path.name}.tmp") if atomic else path
+    with open_for_write(path=target_path, compression=compression, binary=serializer.binary) as json_file:
+        serializer.dump(data=data, file=json_file)
+
+    if atomic:  # readers see either the previous file or the complete new one, never a partial write
+        with open(target_path, "rb+") as written_file:  # the compressed stream is complete only once closed
+            os.fsync(written_file.fileno())
+        os.replace(target_path, path)
+    return path
 
 
-def save_as_markdown(path: Path, data: str) -> None:
+def _save_text(path: Path, data: str | Iterable[str]) -> None:
+    """Write the text, either whole or streamed chunk by chunk."""
     if not path.parent.exists():
         path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(path, "w", encoding="utf-8") as md_file:
-        md_file.write(data)
+    with open(path, "w", encoding="utf-8") as text_file:
+        if isinstance(data, str):
+            text_file.write(data)
+        else:
+            text_file.writelines(data)
+
+
+def save_as_markdown(path: Path, data: str | Iterable[str]) -> None:
+    _save_text(path=path, data=data)
+
+
+def save_as_html(path: Path, data: str | Iterable[str]) -> None:
+    _save_text(path=path, data=data)
@@ -0,0 +1,101 @@
+from collections.abc import Callable
+from pathlib import Path
+
+from pytest_plugins.models import ExecutionStatus, HistoryRecord
+from pytest_plugins.utils.compression import open_for_read, resolve_compressed_path
+from pytest_plugins.utils.history_store import HISTORY_STORE_FILENAME, HistoryStore, is_history_store
+from pytest_plugins.utils.json_stream import iter_json_object_items
+
+HISTORY_FAILED_STATUSES = frozenset({ExecutionStatus.FAILED, ExecutionStatus.FAILED_SKIPPED})
+SLOWEST_FIRST = "slowest-first"
+FAILED_FIRST = "failed-first"
+ORDER_MODES = (SLOWEST_FIRST, FAILED_FIRST)
+DEFAULT_PREDICTED_DURATION_SEC = 1.0  # without any recorded duration every test weighs the same
+
+
+def resolve_history_path(path: Path, results_filename: str) -> Path:
+    """
+    A history store or a results file (plain or compressed), or the output dir of a previous run holding them (the
+    history store first, it averages every recorded run).
+    """
+    if path.is_dir():
+        if (store_path := path / HISTORY_STORE_FILENAME).is_file():
+            return store_path
+        path = path / results_filename
+    return resolve_compressed_path(path)
+
+
+def load_history_index(path: Path) -> dict[str, HistoryRecord]:
+    """
+    Index a previous test_results.json by test_full_path (its key when a record has none), streaming its entries:
+    only the duration and whether the test failed are kept. A history store is indexed by its EWMA durations and the
+    last statuses.
+    """
+    if is_history_store(path):
+        with HistoryStore(path=path) as store:
+            return store.load_index()
+    index: dict[str, HistoryRecord] = {}
+    with open_for_read(path) as f:  # plain or compressed (gzip / lzma / bz2)
+        for test_full_name, entry in iter_json_object_items(f):
+            index[entry.get("test_full_path") or test_full_name] = HistoryRecord(
+                duration_sec=entry.get("test_duration_sec"),
+                failed=entry.get("test_status") in HISTORY_FAILED_STATUSES,
+            )
+    return index
+
+
+def load_failed_tests(path: Path) -> set[str]:
+    """
+    The test_full_name and the pytest_test_name of every failed (or failed-skipped) test of a previous
+    test_results.json, streaming its entries, or the test_full_path of the tests whose last run failed in a history
+    store.
+    """
+    if is_history_store(path):
+        with HistoryStore(path=path) as store:
+            return {test_full_path for test_full_path, record in store.load_index().items() if record.failed}
+    failed: set[str] = set()
+    with open_for_read(path) as f:  # plain or compressed (gzip / lzma / bz2)
+        for test_full_name, entry in iter_json_object_items(f):
+            if entry.get("test_status") in HISTORY_FAILED_STATUSES:
+                failed.add(test_full_name)
+                if pytest_test_name := entry.get("pytest_test_name"):
+                    failed.add(pytest_test_name)
+    return failed
+
+
+def mean_duration(index: dict[str, HistoryRecord]) -> float:
+    """The duration predicted for a test with no recorded duration (a new test)."""
+    durations = [record.duration_sec for record in index.values() if record.duration_sec is not None]
+    return sum(durations) / len(durations) if durations else 0.0
+
+
+def predict_durations(index: dict[str, HistoryRecord], test_full_paths: list[str]) -> list[float]:
+    """
+    The recorded duration of every test, the mean recorded duration for a test without one (a new test), or
+    DEFAULT_PREDICTED_DURATION_SEC when nothing was recorded.
+    """
+    default_duration = mean_duration(index) or DEFAULT_PREDICTED_DURATION_SEC
+    predicted = []
+    for test_full_path in test_full_paths:
+        record = index.get(test_full_path)
+        predicted.append(record.duration_sec if record and record.duration_sec is not None else default_duration)
+    return predicted
+
+
+def history_sort_key(index: dict[str, HistoryRecord], mode: str = SLOWEST_FIRST) -> Callable[[str], float]:
+    """
+    The sort key of a test_full_path: the slowest recorded duration first, the previous failures before the rest with
+    failed-first. The tests without history get the mean duration; with a stable sort ties keep their collection order,
+    so every xdist worker gets the same order.
+    The keys are computed once into a name -> float dict, a sort then costs one dict lookup per test.
+    """
+    default_duration = mean_duration(index)
+    # failed-first: the failures are shifted below every other key, keeping them ordered by duration
+    failed_offset = max((record.duration_sec or 0.0 for record in index.values()), default=0.0) + default_duration + 1
+    keys = {
+        test_full_path: -(record.duration_sec if record.duration_sec is not None else default_duration)
+        - (failed_offset if mode == FAILED_FIRST and record.failed else 0.0)
+        for test_full_path, record in index.items()
+    }
+    default_key = -default_duration
+    return lambda test_full_path: keys.get(test_full_path, default_key)
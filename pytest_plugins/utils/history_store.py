@@ -0,0 +1,146 @@
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+
+from pytest_plugins.models import ExecutionStatus, HistoryEntry, HistoryRecord
+
+HISTORY_STORE_FILENAME = "test_history.sqlite3"
+SQLITE_MAGIC = b"SQLite format 3\x00"
+DEFAULT_EWMA_ALPHA = 0.3  # the weight of the latest run
+DEFAULT_STATUSES_KEPT = 10
+
+# one character per status, so the last statuses are a string trimmed by SQLite itself
+STATUS_CODES = {
+    ExecutionStatus.PASSED: "P",
+    ExecutionStatus.FAILED: "F",
+    ExecutionStatus.XFAIL: "x",
+    ExecutionStatus.XPASS: "X",
+    ExecutionStatus.SKIPPED: "S",
+    ExecutionStatus.FAILED_SKIPPED: "f",
+    ExecutionStatus.CANCELLED: "C",
+}
+STATUSES_BY_CODE = {code: str(status) for status, code in STATUS_CODES.items()}
+# a cached pass is recorded as the pass it stands for, without a duration (the test body did not run)
+STATUS_CODES[ExecutionStatus.CACHED_PASS] = STATUS_CODES[ExecutionStatus.PASSED]
+FAILED_CODES = frozenset({STATUS_CODES[ExecutionStatus.FAILED], STATUS_CODES[ExecutionStatus.FAILED_SKIPPED]})
+# the test body did not run
+UNTIMED_STATUSES = frozenset({ExecutionStatus.SKIPPED, ExecutionStatus.CANCELLED, ExecutionStatus.CACHED_PASS})
+HISTORY_STORE_VERSION = 2  # bumped when the key or the schema change, a store of another version is started over
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS test_history (
+    test_full_path TEXT PRIMARY KEY,
+    run_count INTEGER NOT NULL,
+    ewma_duration_sec REAL,
+    ewma_variance REAL NOT NULL,
+    last_statuses TEXT NOT NULL
+) WITHOUT ROWID
+"""
+# the SET expressions all read the values before the update, the variance is the incremental EWMVar:
+# diff = x - mean; mean += alpha * diff; variance = (1 - alpha) * (variance + alpha * diff^2)
+_UPSERT = """
+INSERT INTO test_history (test_full_path, run_count, ewma_duration_sec, ewma_variance, last_statuses)
+VALUES (:test_full_path, 1, :duration, 0.0, :status)
+ON CONFLICT (test_full_path) DO UPDATE SET
+    run_count = run_count + 1,
+    ewma_duration_sec = CASE
+        WHEN excluded.ewma_duration_sec IS NULL THEN ewma_duration_sec
+        WHEN ewma_duration_sec IS NULL THEN excluded.ewma_duration_sec
+        ELSE ewma_duration_sec + :alpha * (excluded.ewma_duration_sec - ewma_duration_sec)
+    END,
+    ewma_variance = CASE
+        WHEN excluded.ewma_duration_sec IS NULL OR ewma_duration_sec IS NULL THEN ewma_variance
+        ELSE (1 - :alpha) * (
+            ewma_variance
+            + :alpha * (excluded.ewma_duration_sec - ewma_duration_sec) * (excluded.ewma_duration_sec - ewma_duration_sec)
+        )
+    END,
+    last_statuses = substr(last_statuses || excluded.last_statuses, -:statuses_kept)
+"""
+_COLUMNS = "test_full_path, run_count, ewma_duration_sec, ewma_variance, last_statuses"
+
+
+def is_history_store(path: Path) -> bool:
+    """Whether the file is a history store, detected from its magic bytes (not its suffix)."""
+    with open(path, "rb") as f:
+        return f.read(len(SQLITE_MAGIC)) == SQLITE_MAGIC
+
+
+def _to_entry(row: tuple) -> HistoryEntry:
+    test_full_path, run_count, ewma_duration_sec, ewma_variance, last_statuses = row
+    return HistoryEntry(
+        test_full_path=test_full_path,
+        run_count=run_count,
+        ewma_duration_sec=ewma_duration_sec,
+        ewma_variance=ewma_variance,
+        last_statuses=[STATUSES_BY_CODE[code] for code in last_statuses],
+    )
+
+
+class HistoryStore:
+    """
+    The per-test history of the runs in a local SQLite file: the EWMA of the duration and its variance, the last
+    statuses and the run count, keyed by test_full_path (the node id with the parameters), so the same-named tests
+    of different modules keep their own rows.
+    A session is added with one batched upsert in a single transaction, the averages are computed by SQLite, so an
+    update never reads the store back.
+    """
+
+    def __init__(
+        self, path: Path, alpha: float = DEFAULT_EWMA_ALPHA, statuses_kept: int = DEFAULT_STATUSES_KEPT
+    ) -> None:
+        self.path = path
+        self.alpha = alpha
+        self.statuses_kept = statuses_kept
+        self._connection = sqlite3.connect(path)
+        if self._connection.execute("PRAGMA user_version").fetchone()[0] != HISTORY_STORE_VERSION:
+            with self._connection:  # e.g. the rows of version 1 were keyed by test_full_name
+                self._connection.execute("DROP TABLE IF EXISTS test_history")
+                self._connection.execute(f"PRAGMA user_version = {HISTORY_STORE_VERSION}")
+        self._connection.execute(_CREATE_TABLE)
+
+    def __enter__(self) -> "HistoryStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM test_history").fetchone()[0]
+
+    def update(self, results: Iterable[tuple[str, str, float | None]]) -> int:
+        """Add a run of the (test_full_path, test_status, test_duration_sec) results, the tests not run are ignored."""
+        rows = (
+            {
+                "test_full_path": test_full_path,
+                "duration": None if status in UNTIMED_STATUSES else duration,
+                "status": STATUS_CODES[status],
+                "alpha": self.alpha,
+                "statuses_kept": self.statuses_kept,
+            }
+            for test_full_path, status, duration in results
+            if status in STATUS_CODES
+        )
+        with self._connection:  # one transaction
+            return self._connection.executemany(_UPSERT, rows).rowcount
+
+    def get(self, test_full_path: str) -> HistoryEntry | None:
+        row = self._connection.execute(
+            f"SELECT {_COLUMNS} FROM test_history WHERE test_full_path = ?", (test_full_path,)
+        ).fetchone()
+        return _to_entry(row) if row else None
+
+    def get_all(self) -> dict[str, HistoryEntry]:
+        return {row[0]: _to_entry(row) for row in self._connection.execute(f"SELECT {_COLUMNS} FROM test_history")}
+
+    def load_index(self) -> dict[str, HistoryRecord]:
+        """The test_full_path -> HistoryRecord index of ordering and sharding: the EWMA duration and the last status."""
+        return {
+            test_full_path: HistoryRecord(duration_sec=duration, failed=last_statuses[-1:] in FAILED_CODES)
+            for test_full_path, duration, last_statuses in self._connection.execute(
+                "SELECT test_full_path, ewma_duration_sec, last_statuses FROM test_history"
+            )
+        }
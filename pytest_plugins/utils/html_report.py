@@ -0,0 +1,207 @@
+import html
+import json
+from collections.abc import Iterable, Iterator, Mapping
+
+from pytest_plugins.models import TestData
+from pytest_plugins.utils.create_report import iter_test_dicts
+
+HTML_COLUMNS = ("no", "name", "file", "class", "status", "duration", "setup", "call", "teardown", "markers", "message")
+ROW_HEIGHT_PX = 28  # fixed, so the table body only renders the rows in view (the same value is used by the CSS)
+
+HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: -apple-system, "Segoe UI", Roboto, sans-serif; margin: 16px; color: #1f2328; }}
+h1 {{ font-size: 20px; margin: 0 0 8px; }}
+#summary span {{ margin-right: 16px; }}
+#filters {{ display: flex; gap: 8px; margin: 12px 0; flex-wrap: wrap; }}
+#filters select, #filters input {{ padding: 4px; }}
+.grid {{ display: grid; grid-template-columns: 70px minmax(300px, 4fr) minmax(120px, 1fr) 110px 90px 90px 90px 90px
+    minmax(80px, 1fr) minmax(200px, 3fr); }}
+.grid > div {{ padding: 0 6px; white-space: nowrap; overflow: hidden; text-overflow: ellipsis;
+    line-height: {row_height}px; height: {row_height}px; }}
+#header {{ font-weight: 600; border-bottom: 2px solid #d0d7de; }}
+#header .sortable {{ cursor: pointer; user-select: none; }}
+#viewport {{ height: 70vh; overflow-y: auto; position: relative; border-bottom: 1px solid #d0d7de; }}
+#rows {{ position: absolute; left: 0; right: 0; top: 0; }}
+#rows .grid:nth-child(even) {{ background: #f6f8fa; }}
+.passed, .xpassed, .cached-pass {{ color: #1a7f37; }} .failed, .xfailed {{ color: #cf222e; }}
+.skipped, .failed-skipped {{ color: #9a6700; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+<div id="summary"></div>
+<div id="filters">
+<select id="status-filter"><option value="">All statuses</option></select>
+<select id="file-filter"><option value="">All files</option></select>
+<select id="marker-filter"><option value="">All markers</option></select>
+<input id="text-filter" type="search" placeholder="Filter by test name">
+<span id="shown"></span>
+</div>
+<div id="header" class="grid"><div>No.</div><div>Test Name</div><div>File</div><div>Status</div>
+<div class="sortable" data-sort="duration">Duration</div><div class="sortable" data-sort="setup">Setup</div>
+<div class="sortable" data-sort="call">Call</div><div class="sortable" data-sort="teardown">Teardown</div>
+<div>Markers</div><div>Message</div></div>
+<div id="viewport"><div id="spacer"></div><div id="rows"></div></div>
+"""
+
+HTML_SCRIPT = """<script>
+(() => {
+  const ROW_HEIGHT = %(row_height)d;
+  const data = JSON.parse(document.getElementById("better-report-data").textContent);
+  const col = Object.fromEntries(data.columns.map((name, index) => [name, index]));
+  const rows = data.rows;
+  const viewport = document.getElementById("viewport");
+  const spacer = document.getElementById("spacer");
+  const body = document.getElementById("rows");
+  const filters = {
+    status: document.getElementById("status-filter"),
+    file: document.getElementById("file-filter"),
+    marker: document.getElementById("marker-filter"),
+    text: document.getElementById("text-filter"),
+  };
+  let view = [];
+  let sort = { column: null, direction: 0 };
+
+  const counts = {};
+  const files = new Set();
+  const markers = new Set();
+  for (const row of rows) {
+    counts[row[col.status]] = (counts[row[col.status]] || 0) + 1;
+    files.add(row[col.file]);
+    for (const marker of row[col.markers]) markers.add(marker);
+  }
+  const addOptions = (select, values) => {
+    for (const value of [...values].sort()) select.add(new Option(value, value));
+  };
+  addOptions(filters.status, Object.keys(counts));
+  addOptions(filters.file, files);
+  addOptions(filters.marker, markers);
+  document.getElementById("summary").innerHTML = "";
+  for (const [label, count] of [["total", rows.length], ...Object.entries(counts)]) {
+    const span = document.createElement("span");
+    span.className = label;
+    span.textContent = `${label}: ${count}`;
+    document.getElementById("summary").append(span);
+  }
+
+  const formatDuration = (value) => (value === null ? "-" : `${value.toFixed(2)}s`);
+
+  function apply() {
+    const status = filters.status.value;
+    const file = filters.file.value;
+    const marker = filters.marker.value;
+    const text = filters.text.value.toLowerCase();
+    view = [];
+    for (let index = 0; index < rows.length; index++) {
+      const row = rows[index];
+      if (status && row[col.status] !== status) continue;
+      if (file && row[col.file] !== file) continue;
+      if (marker && !row[col.markers].includes(marker)) continue;
+      if (text && !row[col.name].toLowerCase().includes(text)) continue;
+      view.push(index);
+    }
+    if (sort.direction) {
+      const sortCol = col[sort.column];
+      view.sort((a, b) => sort.direction * ((rows[a][sortCol] ?? -1) - (rows[b][sortCol] ?? -1)));
+    }
+    document.getElementById("shown").textContent = `${view.length} of ${rows.length} tests shown`;
+    spacer.style.height = `${view.length * ROW_HEIGHT}px`;
+    viewport.scrollTop = 0;
+    render();
+  }
+
+  function render() {
+    const first = Math.floor(viewport.scrollTop / ROW_HEIGHT);
+    const count = Math.ceil(viewport.clientHeight / ROW_HEIGHT) + 1;
+    body.style.transform = `translateY(${first * ROW_HEIGHT}px)`;
+    const fragment = document.createDocumentFragment();
+    for (const index of view.slice(first, first + count)) {
+      const row = rows[index];
+      const line = document.createElement("div");
+      line.className = "grid";
+      const cells = [
+        row[col.no], row[col.name], row[col.file], row[col.status], formatDuration(row[col.duration]),
+        formatDuration(row[col.setup]), formatDuration(row[col.call]), formatDuration(row[col.teardown]),
+        row[col.markers].join(", "), row[col.message] ?? "-",
+      ];
+      for (const value of cells) {
+        const cell = document.createElement("div");
+        cell.textContent = value;
+        cell.title = value;
+        line.append(cell);
+      }
+      line.children[3].className = row[col.status];
+      fragment.append(line);
+    }
+    body.replaceChildren(fragment);
+  }
+
+  for (const header of document.querySelectorAll("#header .sortable")) {
+    header.addEventListener("click", () => {
+      // descending (slowest first) -> ascending -> run order
+      sort = sort.column === header.dataset.sort
+        ? { column: sort.column, direction: sort.direction === -1 ? 1 : sort.direction === 1 ? 0 : -1 }
+        : { column: header.dataset.sort, direction: -1 };
+      for (const other of document.querySelectorAll("#header .sortable")) {
+        other.textContent = other.textContent.replace(/ [▲▼]$/, "");
+      }
+      if (sort.direction) header.textContent += sort.direction === -1 ? " ▼" : " ▲";
+      apply();
+    });
+  }
+  for (const filter of Object.values(filters)) filter.addEventListener("input", apply);
+  viewport.addEventListener("scroll", () => requestAnimationFrame(render));
+  window.addEventListener("resize", render);
+  apply();
+})();
+</script>
+</body>
+</html>
+"""
+
+
+def _round(duration: float | None) -> float | None:
+    return round(duration, 4) if duration is not None else None
+
+
+def _html_row(index: int, test: dict) -> list:
+    exception_message = test.get("exception_message")
+    return [
+        index,
+        test["test_full_name"],
+        test.get("test_file_name") or "-",
+        test.get("class_test_name"),
+        test["test_status"],
+        _round(test["test_duration_sec"]),
+        _round(test.get("setup_duration_sec")),
+        _round(test.get("call_duration_sec")),
+        _round(test.get("teardown_duration_sec")),
+        test.get("test_markers") or [],
+        exception_message["message"] if exception_message else None,
+    ]
+
+
+def _script_json(data: object) -> str:
+    # "<" only occurs inside JSON strings, where its escape keeps "</script>" or "<!--" from ending the script
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).replace("<", "\\u003c")
+
+
+def iter_html_report(
+    report: Mapping[str, TestData | dict] | Iterable[TestData | dict], title: str = "Test Report"
+) -> Iterator[str]:
+    """
+    A single-file HTML report in chunks: the page, then the results embedded as compact JSON rows (one array per test,
+    the column names once), streamed from the report one test at a time.
+    The page filters by status / file / marker / name, sorts by the durations and only renders the rows in view.
+    """
+    yield HTML_HEAD.format(title=html.escape(title), row_height=ROW_HEIGHT_PX)
+    yield f'<script id="better-report-data" type="application/json">{{"columns":{_script_json(HTML_COLUMNS)},"rows":['
+    for index, test in enumerate(iter_test_dicts(report), start=1):
+        yield f"{',' if index > 1 else ''}\n{_script_json(_html_row(index=index, test=test))}"
+    yield "\n]}</script>\n"
+    yield HTML_SCRIPT % {"row_height": ROW_HEIGHT_PX}
@@ -0,0 +1,70 @@
+import json
+import re
+from collections.abc import Iterator
+from typing import IO, Any
+
+CHUNK_SIZE = 1 << 20  # characters read from the file at a time
+
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r"[ \t\n\r]*")
+
+
+def iter_json_object_items(file: IO[str], chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[str, Any]]:
+    """
+    Stream the (key, value) pairs of a top-level JSON object chunk by chunk, so only one value is held in memory.
+    Each value is decoded as a whole by the stdlib (C) scanner.
+    """
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def read_more() -> None:
+        nonlocal buffer, pos, eof
+        chunk = file.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+    def next_char() -> str:
+        """Skip whitespace and peek the next character ("" at the end of the file)."""
+        nonlocal pos
+        while True:
+            pos = _whitespace.match(buffer, pos).end()
+            if pos < len(buffer) or eof:
+                return buffer[pos : pos + 1]
+            read_more()
+
+    def decode() -> Any:
+        nonlocal pos
+        while True:
+            try:
+                value, end = _decoder.raw_decode(buffer, pos)
+                # a value cut by the end of the buffer may still decode (e.g. "-3" of "-3.5"), so it is complete only
+                # once the delimiter that follows it is in the buffer
+                delimiter = _whitespace.match(buffer, end).end()
+                if eof or (delimiter < len(buffer) and buffer[delimiter] in ",:}"):
+                    pos = end
+                    return value
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            read_more()
+
+    def expect(char: str) -> None:
+        nonlocal pos
+        if (found := next_char()) != char:
+            raise ValueError(f"Expected {char!r} at position {pos} of the JSON object, found {found!r}")
+        pos += 1
+
+    expect("{")
+    if next_char() == "}":
+        return
+    while True:
+        key = decode()
+        expect(":")
+        next_char()
+        yield key, decode()
+        if next_char() == "}":
+            return
+        expect(",")
+        next_char()
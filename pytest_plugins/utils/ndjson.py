@@ -0,0 +1,108 @@
+import json
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from pytest_plugins.utils.compression import compressed_path, open_for_write
+from pytest_plugins.utils.serializer import JsonSerializer, OrjsonSerializer
+
+
+class NdjsonWriter:
+    """
+    Append-only writer of one compact JSON record per line, keyed by the record name.
+    The file is opened (and a previous run's file truncated) on the first record, so a run that finishes no test
+    (e.g. --collect-only) leaves it untouched.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        default: Callable | None = None,
+        serializer: JsonSerializer | OrjsonSerializer | None = None,
+    ) -> None:
+        self.path = path
+        self.default = default
+        self.serializer = serializer or JsonSerializer(pretty=False, default=default)
+        self.bytes_written = 0
+        self.last_line_of: dict[str, tuple[int, int]] = {}  # record key -> (offset, length) of its latest line
+        self._file: BinaryIO | None = None
+
+    def open(self) -> None:
+        """Create (or truncate) the file, once: write calls it on the first record."""
+        if self._file is not None:
+            return
+        if not self.path.parent.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "wb")  # pylint: disable=R1732
+
+    def write(self, key: str, record: Any) -> None:
+        self.open()
+        line = f"{self.serializer.dumps(record)}\n".encode()
+        self._file.write(line)
+        self._file.flush()
+        self.last_line_of[key] = (self.bytes_written, len(line))  # a rerun appends again, its latest line wins
+        self.bytes_written += len(line)
+
+    def close(self) -> None:
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+
+    def finalize_to_json(
+        self,
+        path: Path,
+        pending: dict[str, Any] | None = None,
+        compression: str | None = None,
+        order: Iterable[str] | None = None,
+    ) -> Path:
+        """
+        Write a JSON object keyed by record name from the streamed lines (without re-parsing them) and the pending
+        records, in the given order (e.g. the collection order), then any other record in the order it came.
+        """
+        self.close()
+        path = compressed_path(path=path, compression=compression)
+        with self._open_lines() as src, open_for_write(path=path, compression=compression) as dst:
+            separator = "\n"
+            dst.write("{")
+            for key, line, record in self._iter_ordered(src=src, pending=pending or {}, order=order):
+                value = line.decode("utf-8").rstrip() if line is not None else self.serializer.dumps(record)
+                dst.write(f"{separator}{json.dumps(key)}:{value}")
+                separator = ",\n"
+            dst.write("\n}\n")
+        return path
+
+    def iter_records(self, pending: dict[str, Any] | None = None, order: Iterable[str] | None = None) -> Iterator[Any]:
+        """
+        The latest record of every key in the order of finalize_to_json, the streamed ones parsed one line at a time,
+        the pending ones not streamed yet as they are (not serialized).
+        """
+        if self._file is not None and not self._file.closed:
+            self._file.flush()
+        with self._open_lines() as src:
+            for _, line, record in self._iter_ordered(src=src, pending=pending or {}, order=order):
+                yield json.loads(line) if line is not None else record
+
+    def _open_lines(self) -> AbstractContextManager[BinaryIO | None]:
+        return open(self.path, "rb") if self.last_line_of else nullcontext()
+
+    def _iter_ordered(
+        self, src: BinaryIO | None, pending: dict[str, Any], order: Iterable[str] | None
+    ) -> Iterator[tuple[str, bytes | None, Any]]:
+        """(key, streamed line or None, pending record) of every key, the streamed line read back by its offset."""
+        keys = dict.fromkeys(order or ())
+        keys.update(dict.fromkeys(self.last_line_of))
+        keys.update(dict.fromkeys(pending))
+        for key in keys:
+            if (position := self.last_line_of.get(key)) is not None:
+                offset, length = position
+                src.seek(offset)
+                yield key, src.read(length), None
+            elif key in pending:
+                yield key, None, pending[key]
+
+
+def iter_ndjson(path: Path) -> Iterator[dict]:
+    with open(path, encoding="utf-8") as ndjson_file:
+        for line in ndjson_file:
+            if line := line.strip():
+                yield json.loads(line)
@@ -1,13 +1,18 @@
 import json
 
+import pytest
+from _pytest.config import Config
 from _pytest.python import Function
 from custom_python_logger import get_logger
-from python_base_toolkit.utils.data_serialization import default_serialize
 
 from pytest_plugins import LOGGER_NAME
+from pytest_plugins.models.test_identity import TestIdentity
+from pytest_plugins.utils.helper import serialize_data
 
 logger = get_logger(LOGGER_NAME)
 
+test_identity_key = pytest.StashKey[TestIdentity]()
+
 
 def get_test_path_without_parameters(item: Function) -> str:
     """Get the test name without parameters."""
@@ -36,11 +41,53 @@ def get_test_full_path(item: Function) -> str:
     return f"{test_name}[{item.callspec.params}]" if getattr(item, "callspec", None) else test_name
 
 
+def build_test_identity(item: Function) -> TestIdentity:
+    """Compute the identity of the test and store it in the item stash (again after its node id changes)."""
+    test_name = get_test_name_without_parameters(item=item)
+    parameters = f"[{item.callspec.params}]" if getattr(item, "callspec", None) else ""
+    identity = TestIdentity(
+        test_name=test_name,
+        pytest_test_name=get_pytest_test_name(item=item),
+        test_full_name=f"{test_name}{parameters}",
+        test_full_path=f"{get_test_path_without_parameters(item=item)}{parameters}",
+    )
+    item.stash[test_identity_key] = identity
+    return identity
+
+
+def get_test_identity(item: Function) -> TestIdentity:
+    """Get the identity of the test, computed once per item and shared by all the plugins."""
+    if (identity := item.stash.get(test_identity_key, None)) is None:
+        identity = build_test_identity(item=item)
+    return identity
+
+
+def unregister_plugin(config: Config, plugin: object) -> None:
+    """Unregister a plugin whose feature is disabled, so its hooks add no overhead to every test."""
+    if config.pluginmanager.is_registered(plugin):
+        config.pluginmanager.unregister(plugin)
+
+
+def get_xdist_worker_id(config: Config) -> str | None:
+    """Get the xdist worker id (e.g. "gw0") when running inside an xdist worker process."""
+    workerinput = getattr(config, "workerinput", None)
+    return workerinput["workerid"] if workerinput else None
+
+
+def is_xdist_controller(config: Config) -> bool:
+    """Check whether this process distributes the tests to xdist workers."""
+    return (
+        not get_xdist_worker_id(config=config)
+        and getattr(config.option, "dist", "no") != "no"
+        and not config.getoption("--collect-only")
+    )
+
+
 def log_test_results(item: Function, test_results: dict) -> None:
     if not getattr(item.config, "_better_report_enabled", None):
         return
 
-    if (test_full_name := get_test_full_name(item=item)) in test_results:
-        logger.debug(f"Test Results: \n{json.dumps(test_results[test_full_name], indent=4, default=default_serialize)}")
+    if (test_full_name := get_test_identity(item=item).test_full_name) in test_results:
+        logger.debug(f"Test Results: \n{json.dumps(test_results[test_full_name], indent=4, default=serialize_data)}")
     else:
         logger.warning(f"Test {test_full_name} missing in test_results during report")
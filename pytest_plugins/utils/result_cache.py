@@ -0,0 +1,159 @@
+import hashlib
+import inspect
+import json
+import platform
+import sqlite3
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from _pytest.python import Function
+from custom_python_logger import get_logger
+
+from pytest_plugins.const import LOGGER_NAME
+
+logger = get_logger(f"{LOGGER_NAME}.result_cache")
+
+RESULT_CACHE_FILENAME = "result_cache.sqlite3"
+RESULT_CACHE_VERSION = 1  # bumped when the key or the schema change, a store of another version is dropped
+DEFAULT_MAX_ENTRIES = 100_000
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS result_cache (
+    cache_key TEXT PRIMARY KEY,
+    test_full_name TEXT NOT NULL,
+    last_used_ns INTEGER NOT NULL
+) WITHOUT ROWID
+"""
+_CREATE_INDEX = "CREATE INDEX IF NOT EXISTS result_cache_last_used ON result_cache (last_used_ns)"
+
+
+class ResultCache:
+    """
+    The keys of the tests that passed, in a local SQLite file, the least recently used evicted beyond max_entries.
+    A key covers everything the result depends on (see CacheKeyBuilder), so a change never matches an old entry;
+    a test that fails with a cached key is dropped. An unreadable store or one of another version is started over.
+    """
+
+    def __init__(self, path: Path, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self._connection = self._open()
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"Result cache: {path} is unreadable ({e}), starting over")
+            path.unlink(missing_ok=True)
+            self._connection = self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=30)  # xdist workers read it while another run may write
+        if connection.execute("PRAGMA user_version").fetchone()[0] != RESULT_CACHE_VERSION:
+            with connection:
+                connection.execute("DROP TABLE IF EXISTS result_cache")
+                connection.execute(f"PRAGMA user_version = {RESULT_CACHE_VERSION}")
+        connection.execute(_CREATE_TABLE)
+        connection.execute(_CREATE_INDEX)
+        return connection
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM result_cache").fetchone()[0]
+
+    def get_keys(self) -> set[str]:
+        """Every cached key, one query for the whole session (the store is bounded by max_entries)."""
+        return {key for (key,) in self._connection.execute("SELECT cache_key FROM result_cache")}
+
+    def update(self, passed: dict[str, str], failed: Iterable[str], used: Iterable[str]) -> None:
+        """
+        Add the passed tests (cache key -> test_full_name), drop the failed ones, mark the cached passes as used and
+        evict the least recently used entries beyond max_entries, in one transaction.
+        """
+        now_ns = time.time_ns()
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO result_cache (cache_key, test_full_name, last_used_ns) VALUES (?, ?, ?)",
+                ((key, test_full_name, now_ns) for key, test_full_name in passed.items()),
+            )
+            self._connection.executemany("DELETE FROM result_cache WHERE cache_key = ?", ((key,) for key in failed))
+            self._connection.executemany(
+                "UPDATE result_cache SET last_used_ns = ? WHERE cache_key = ?", ((now_ns, key) for key in used)
+            )
+            self._connection.execute(
+                "DELETE FROM result_cache WHERE cache_key IN "
+                "(SELECT cache_key FROM result_cache ORDER BY last_used_ns DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+
+class CacheKeyBuilder:
+    """
+    The cache key of a test: a sha256 of its node id (with the parameters), of the content of its test file, of the
+    conftest.py files above it and of the files defining its fixtures, and of the environment (Python, platform and
+    the chosen environment variables). Every file is hashed once per session, and the files of the tests sharing a
+    test file and fixtures once per session too.
+    """
+
+    def __init__(self, rootpath: Path, environment: dict[str, str | None]) -> None:
+        self.rootpath = rootpath
+        environment = {"python": platform.python_version(), "platform": platform.platform(), **environment}
+        self._environment_digest = hashlib.sha256(json.dumps(environment, sort_keys=True).encode()).hexdigest()
+        self._file_digests: dict[Path, str] = {}
+        self._conftests: dict[Path, list[Path]] = {}
+        self._fixture_files: dict[object, Path | None] = {}
+        self._files_digests: dict[tuple[Path, frozenset], str] = {}
+
+    def file_digest(self, path: Path) -> str:
+        if (digest := self._file_digests.get(path)) is None:
+            try:
+                digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError:
+                digest = ""  # e.g. a fixture defined in a zipped package, the other inputs still apply
+            self._file_digests[path] = digest
+        return digest
+
+    def _conftest_paths(self, directory: Path) -> list[Path]:
+        if (paths := self._conftests.get(directory)) is None:
+            paths = [conftest] if (conftest := directory / "conftest.py").is_file() else []
+            if directory != self.rootpath and directory.parent != directory and directory.is_relative_to(self.rootpath):
+                paths = paths + self._conftest_paths(directory.parent)
+            self._conftests[directory] = paths
+        return paths
+
+    def _fixture_path(self, func: object) -> Path | None:
+        if func not in self._fixture_files:
+            try:
+                source_file = inspect.getsourcefile(func)
+            except TypeError:
+                source_file = None  # a fixture without a Python source (e.g. a builtin)
+            self._fixture_files[func] = Path(source_file) if source_file else None
+        return self._fixture_files[func]
+
+    def _files_digest(self, test_path: Path, fixture_funcs: frozenset) -> str:
+        """The digest of the files a test depends on, computed once per test file and set of fixtures."""
+        if (digest := self._files_digests.get((test_path, fixture_funcs))) is None:
+            paths = {test_path, *self._conftest_paths(test_path.parent)}
+            paths.update(path for func in fixture_funcs if (path := self._fixture_path(func)))
+            files = hashlib.sha256()
+            for path in sorted(paths):
+                name = path.relative_to(self.rootpath) if path.is_relative_to(self.rootpath) else path
+                files.update(f"\0{name}\0{self.file_digest(path)}".encode())
+            digest = self._files_digests[(test_path, fixture_funcs)] = files.hexdigest()
+        return digest
+
+    def key(self, item: Function, test_full_path: str) -> str:
+        fixture_info = getattr(item, "_fixtureinfo", None)
+        fixturedefs = fixture_info.name2fixturedefs.values() if fixture_info else ()
+        fixture_funcs = frozenset(fixturedef.func for definitions in fixturedefs for fixturedef in definitions)
+        files_digest = self._files_digest(test_path=item.path, fixture_funcs=fixture_funcs)
+        return hashlib.sha256(
+            f"{RESULT_CACHE_VERSION}\0{self._environment_digest}\0{test_full_path}\0{files_digest}".encode()
+        ).hexdigest()
@@ -0,0 +1,94 @@
+import json
+from collections.abc import Callable
+from dataclasses import is_dataclass
+from itertools import islice
+from typing import IO, Any
+
+try:
+    import orjson
+except ImportError:  # optional faster backend: pip install "pytest-plugins[fast]"
+    orjson = None
+
+SERIALIZER_BACKENDS = ("auto", "json", "orjson")
+JSON_STYLES = ("pretty", "compact")
+RECORDS_BATCH_SIZE = 1000  # top-level records encoded at once by the stdlib serializer
+
+
+class JsonSerializer:
+    """Stdlib json, streamed to the file in batches of records."""
+
+    name = "json"
+    binary = False
+
+    def __init__(self, pretty: bool = True, default: Callable | None = None) -> None:
+        self.pretty = pretty
+        self.default = default
+        self._encoder = json.JSONEncoder(
+            indent=4 if pretty else None, separators=None if pretty else (",", ":"), default=default
+        )
+        self._compact_encoder = json.JSONEncoder(separators=(",", ":"), default=default)
+
+    def dumps(self, obj: Any) -> str:
+        """A single compact line (ndjson records)."""
+        return self._compact_encoder.encode(obj)
+
+    def _record(self, value: Any) -> Any:
+        """A top-level dataclass record converted up front, so the encoder never calls back into "default" for it."""
+        return self.default(value) if self.default is not None and is_dataclass(value) else value
+
+    def dump(self, data: Any, file: IO[str]) -> None:
+        if not isinstance(data, dict) or not data:
+            file.writelines(self._encoder.iterencode(data))
+            return
+
+        # the records are encoded in batches: the document is never built as a whole, and the compact style still
+        # gets the C encoder (which stdlib json only uses to encode whole documents, not for iterencode)
+        closing = "\n}" if self.pretty else "}"
+        records = iter(data.items())
+        separator = "{"
+        # each batch converts its own records, only RECORDS_BATCH_SIZE of them are held converted at a time
+        while batch := {key: self._record(value) for key, value in islice(records, RECORDS_BATCH_SIZE)}:
+            file.write(separator)
+            file.write(self._encoder.encode(batch)[1 : -len(closing)])
+            separator = ","
+        file.write(closing)
+
+
+class OrjsonSerializer:
+    """orjson backend, a single native call per file (pretty output is indented by 2 spaces)."""
+
+    name = "orjson"
+    binary = True
+
+    def __init__(self, pretty: bool = True, default: Callable | None = None, native_dataclasses: bool = False) -> None:
+        if orjson is None:
+            raise ModuleNotFoundError('The "orjson" serializer requires the orjson package: pip install orjson')
+        self.pretty = pretty
+        self.default = default
+        self.native_dataclasses = native_dataclasses
+        self._options = orjson.OPT_NON_STR_KEYS
+        if not native_dataclasses:  # dataclasses go through "default", which may add fields (e.g. --add-parameters)
+            self._options |= orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def dumps(self, obj: Any) -> str:
+        """A single compact line (ndjson records)."""
+        return orjson.dumps(obj, default=self.default, option=self._options).decode("utf-8")
+
+    def dump(self, data: Any, file: IO[bytes]) -> None:
+        # the dataclass records are converted one by one by "default" while orjson encodes them
+        options = self._options | orjson.OPT_INDENT_2 if self.pretty else self._options
+        file.write(orjson.dumps(data, default=self.default, option=options))
+
+
+def get_serializer(
+    backend: str = "json", pretty: bool = True, default: Callable | None = None, native_dataclasses: bool = False
+) -> JsonSerializer | OrjsonSerializer:
+    """
+    Build the serializer of the backend, "auto" picks orjson when it is installed.
+    The stdlib backend is the default: its pretty output keeps the 4-space indentation of the result files, orjson
+    only indents by 2 spaces.
+    With native_dataclasses, orjson serializes the dataclasses itself instead of calling "default" for them.
+    """
+    if backend == "orjson" or (backend == "auto" and orjson is not None):
+        return OrjsonSerializer(pretty=pretty, default=default, native_dataclasses=native_dataclasses)
+    return JsonSerializer(pretty=pretty, default=default)
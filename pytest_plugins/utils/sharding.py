@@ -0,0 +1,29 @@
+import heapq
+
+SHARD_PLAN_WORKEROUTPUT_KEY = "better_report_shard_plan"
+
+
+def lpt_partition(durations: list[float], shard_count: int) -> list[int]:
+    """
+    The shard of every test, by longest-processing-time greedy bin packing: the tests from the longest to the shortest,
+    each to the shard with the least predicted time so far (a heap of the shard loads, O(n log shards)).
+    Ties go to the first test and to the lowest shard index, so every shard computes the same plan from the same
+    collection.
+    """
+    assignments = [0] * len(durations)
+    loads = [(0.0, shard_index) for shard_index in range(shard_count)]  # already a heap
+    for position in sorted(range(len(durations)), key=lambda position: -durations[position]):
+        load, shard_index = loads[0]
+        assignments[position] = shard_index
+        heapq.heapreplace(loads, (load + durations[position], shard_index))
+    return assignments
+
+
+def shard_totals(durations: list[float], assignments: list[int], shard_count: int) -> tuple[list[int], list[float]]:
+    """The test count and the predicted duration of every shard."""
+    counts = [0] * shard_count
+    predicted = [0.0] * shard_count
+    for duration, shard_index in zip(durations, assignments, strict=True):
+        counts[shard_index] += 1
+        predicted[shard_index] += duration
+    return counts, [round(duration, 4) for duration in predicted]
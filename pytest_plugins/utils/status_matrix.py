@@ -0,0 +1,98 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+
+from pytest_plugins.models import ExecutionStatus
+
+MISSING = 0  # the run has no such test
+# a status compared as another one: a cached pass is the pass it was cached from
+EQUIVALENT_STATUSES = {ExecutionStatus.CACHED_PASS.value: ExecutionStatus.PASSED.value}
+STATUS_CODES = {status.value: code for code, status in enumerate(ExecutionStatus, start=1)}
+STATUS_CODES.update({status: STATUS_CODES[equivalent] for status, equivalent in EQUIVALENT_STATUSES.items()})
+FAILED_CODE = STATUS_CODES[ExecutionStatus.FAILED.value]
+
+
+def comparable_status(status: str | None) -> str | None:
+    """The status as compared between runs (see EQUIVALENT_STATUSES)."""
+    return EQUIVALENT_STATUSES.get(status, status)
+
+
+@dataclass(slots=True)
+class StatusMatrix:
+    run_labels: list[str]
+    test_names: list[str]
+    codes: np.ndarray  # tests x runs, int8 status codes
+
+
+@dataclass(slots=True)
+class FlakinessResult:
+    test_name: str
+    flips: int  # status changes between consecutive runs that have the test
+    failure_rate: float  # failed runs / runs that have the test
+    changed_in_runs: list[int]  # 1-based numbers of the runs where the status changed
+
+
+def encode_statuses(report: dict[str, dict]) -> tuple[list[str], np.ndarray]:
+    """The test names of a loaded report and their statuses as int8 codes."""
+    codes = np.fromiter(
+        (STATUS_CODES.get(entry.get("test_status"), MISSING) for entry in report.values()),
+        dtype=np.int8,
+        count=len(report),
+    )
+    return list(report), codes
+
+
+def build_status_matrix(runs: Iterable[tuple[str, list[str], np.ndarray]]) -> StatusMatrix:
+    """Build the test-by-run matrix in one pass over the runs, each given as (label, test names, status codes)."""
+    test_rows: dict[str, int] = {}
+    run_labels: list[str] = []
+    columns: list[np.ndarray] = []
+    for label, names, codes in runs:
+        rows = np.fromiter(
+            (test_rows.setdefault(name, len(test_rows)) for name in names), dtype=np.int64, count=len(names)
+        )
+        column = np.full(len(test_rows), MISSING, dtype=np.int8)
+        column[rows] = codes
+        run_labels.append(label)
+        columns.append(column)
+
+    codes = np.full((len(test_rows), len(columns)), MISSING, dtype=np.int8)
+    for index, column in enumerate(columns):  # tests first seen in a later run are missing from the earlier ones
+        codes[: len(column), index] = column
+    return StatusMatrix(run_labels=run_labels, test_names=list(test_rows), codes=codes)
+
+
+def get_flakiness(matrix: StatusMatrix) -> list[FlakinessResult]:
+    """Flips, failure rate and the runs where the status changed of every test, the flakiest first."""
+    codes = matrix.codes
+    if not codes.size:
+        return []
+
+    present = codes != MISSING
+    # carry the last known status of a test forward over the runs that don't have it
+    last_seen = np.where(present, np.arange(codes.shape[1], dtype=np.int32), 0)
+    np.maximum.accumulate(last_seen, axis=1, out=last_seen)
+    previous = np.take_along_axis(codes, last_seen, axis=1)[:, :-1]
+    changed = present[:, 1:] & (previous != MISSING) & (codes[:, 1:] != previous)
+
+    flips = changed.sum(axis=1)
+    runs_with_test = present.sum(axis=1)
+    failure_rates = np.divide(
+        (codes == FAILED_CODE).sum(axis=1), runs_with_test, out=np.zeros(len(codes)), where=runs_with_test > 0
+    )
+    # the runs where each test changed: the column indexes of "changed", grouped by row (np.nonzero is row-major)
+    changed_rows, changed_columns = np.nonzero(changed)
+    changed_runs = np.split((changed_columns + 2).tolist(), np.cumsum(flips)[:-1]) if len(changed_rows) else None
+
+    order = np.lexsort((-failure_rates, -flips)).tolist()
+    flips_list, failure_rates_list = flips.tolist(), failure_rates.tolist()
+    return [
+        FlakinessResult(
+            test_name=matrix.test_names[row],
+            flips=flips_list[row],
+            failure_rate=failure_rates_list[row],
+            changed_in_runs=changed_runs[row].tolist() if flips_list[row] else [],
+        )
+        for row in order
+    ]
@@ -1,8 +1,10 @@
+import sys
+
 import pytest
 from _pytest.config import Config, Parser
 from _pytest.python import Function
 
-from pytest_plugins.utils.pytest_helper import get_test_full_name
+from pytest_plugins.utils.pytest_helper import build_test_identity, get_test_identity, unregister_plugin
 
 
 def pytest_addoption(parser: Parser) -> None:
@@ -17,6 +19,7 @@ def pytest_addoption(parser: Parser) -> None:
 
 def pytest_configure(config: Config) -> None:
     if not config.getoption("--verbose-param-ids"):
+        unregister_plugin(config=config, plugin=sys.modules[__name__])
         return
 
     config._verbose_param_ids = config.getoption("--verbose-param-ids")  # pylint: disable=W0212
@@ -28,6 +31,7 @@ def pytest_collection_modifyitems(config: Config, items: list[Function]) -> None
         return
 
     for item in items:
-        test_full_name = get_test_full_name(item=item)
+        test_full_name = get_test_identity(item=item).test_full_name
         test_full_name = test_full_name.replace("{", "").replace("}", "")
         item._nodeid = f"{item.fspath.basename}::{test_full_name}"  # pylint: disable=W0212
+        build_test_identity(item=item)  # the pytest test name derives from the node id
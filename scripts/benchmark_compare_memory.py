@@ -0,0 +1,88 @@
+import json
+import logging
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from custom_python_logger import build_logger
+
+from pytest_plugins import LOGGER_NAME
+from pytest_plugins.better_report_compare import load_report
+
+logger = build_logger(project_name=f"{LOGGER_NAME}.benchmark_compare_memory", log_level=logging.DEBUG)
+
+TRACEBACK_FRAMES = 20  # a --traceback report: every failed test carries its traceback
+
+
+def write_report(path: Path, tests: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{")
+        for index in range(tests):
+            failed = index % 5 == 0
+            entry = {
+                "test_file_name": f"test_module_{index % 50}.py",
+                "test_name": "test_parametrized",
+                "pytest_test_name": f"test_parametrized[{index}]",
+                "test_full_name": f"test_parametrized[{{'index': {index}}}]",
+                "test_status": "failed" if failed else "passed",
+                "test_duration_sec": index / 1000,
+                "exception_message": (
+                    {
+                        "exception_type": "AssertionError",
+                        "message": "assert 1 == 2" * 20,
+                        "traceback": {
+                            "traceback": [f"/repo/tests/test_module_{frame}.py" for frame in range(TRACEBACK_FRAMES)]
+                        },
+                    }
+                    if failed
+                    else None
+                ),
+            }
+            f.write(f'{"," if index else ""}\n{json.dumps(entry["test_full_name"])}: {json.dumps(entry, indent=4)}')
+        f.write("\n}")
+
+
+def _legacy_load_report(path: Path, test_file_name: str | None = None) -> dict[str, dict]:
+    """load_report before streaming: the whole file parsed, then indexed."""
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+    indexed: dict[str, dict] = {}
+    for entry in raw.values():
+        if test_file_name and entry.get("test_file_name") != test_file_name:
+            continue
+        if pytest_name := entry.get("pytest_test_name"):
+            indexed[pytest_name] = entry
+    return indexed
+
+
+def measure(name: str, load: Callable[[], dict]) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    report = load()
+    duration = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    logger.info(
+        f"{name:<28} peak {peak / 2**20:>8.1f} MiB  retained {current / 2**20:>8.1f} MiB  {duration:>6.2f} s  "
+        f"({len(report)} tests)"
+    )
+
+
+def main() -> None:
+    tests = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "test_results.json"
+        write_report(path=path, tests=tests)
+        logger.info(f"Loading a report of {tests} tests ({path.stat().st_size / 2**20:.1f} MiB)")
+
+        measure(name="json.load + index (before)", load=lambda: _legacy_load_report(path=path))
+        measure(name="streamed", load=lambda: load_report(path=path))
+        measure(name="json.load + index, filtered", load=lambda: _legacy_load_report(path, "test_module_1.py"))
+        measure(name="streamed, filtered", load=lambda: load_report(path=path, test_file_name="test_module_1.py"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+from custom_python_logger import build_logger
+
+from pytest_plugins import LOGGER_NAME
+
+logger = build_logger(project_name=f"{LOGGER_NAME}.benchmark_disabled_overhead", log_level=logging.DEBUG)
+
+PLUGIN_NAMES = (
+    "better_report",
+    "max_fail_streak",
+    "fail2skip",
+    "add_config_parameters",
+    "verbose_param_ids",
+    "require_tests",
+    "order_by_history",
+    "shard",
+    "rerun_from",
+    "result_cache",
+)
+REPEATS = 3
+
+TEST_MODULE = """
+import pytest
+
+@pytest.mark.parametrize("index", range({tests}))
+def test_noop(index):
+    pass
+"""
+
+
+class _RunLoopTimer:
+    def __init__(self) -> None:
+        self.duration_ns = 0
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtestloop(self, session: pytest.Session) -> object:  # pylint: disable=W0613
+        start = time.perf_counter_ns()
+        yield
+        self.duration_ns = time.perf_counter_ns() - start
+
+
+def run_suite(test_dir: Path, extra_args: list[str]) -> int:
+    """Run the suite and return the best run loop duration (ns) out of a few repeats."""
+    durations = []
+    for _ in range(REPEATS):
+        timer = _RunLoopTimer()
+        pytest.main([str(test_dir), "-q", "-p", "no:cacheprovider", "-p", "no:logging", *extra_args], plugins=[timer])
+        durations.append(timer.duration_ns)
+    return min(durations)
+
+
+def main() -> None:
+    tests = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        test_dir = Path(tmp_dir)
+        (test_dir / "pytest.ini").write_text("[pytest]\n")
+        (test_dir / "test_benchmark_disabled_overhead.py").write_text(TEST_MODULE.format(tests=tests))
+
+        not_loaded = run_suite(test_dir=test_dir, extra_args=[f"-pno:{name}" for name in PLUGIN_NAMES])
+        all_off = run_suite(test_dir=test_dir, extra_args=[])
+
+    logger.info(f"{tests} tests, best of {REPEATS} runs")
+    logger.info(f"{'plugins not loaded':<35} {not_loaded / tests / 1000:>8.2f} us/test")
+    logger.info(f"{'plugins loaded, all features off':<35} {all_off / tests / 1000:>8.2f} us/test")
+    logger.info(f"{'plugins overhead':<35} {(all_off - not_loaded) / tests / 1000:>8.2f} us/test")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import logging
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+from _pytest.python import Function
+from custom_python_logger import build_logger
+
+from pytest_plugins import (
+    LOGGER_NAME,
+    better_report,
+    fail2skip,
+    max_fail_streak,
+    order_by_history,
+    rerun_from,
+    result_cache,
+    shard,
+    verbose_param_ids,
+)
+from pytest_plugins.utils.pytest_helper import TestIdentity, build_test_identity
+
+logger = build_logger(project_name=f"{LOGGER_NAME}.benchmark_hook_overhead", log_level=logging.DEBUG)
+
+# the plugin modules reading the item identity in their hooks
+PLUGIN_MODULES = (
+    better_report,
+    fail2skip,
+    max_fail_streak,
+    order_by_history,
+    rerun_from,
+    result_cache,
+    shard,
+    verbose_param_ids,
+)
+PLUGIN_ARGS = ("--better-report", "--fail2skip", "--maxfail-streak=1000000", "--verbose-param-ids")
+REPEATS = 3
+
+TEST_MODULE = """
+import pytest
+
+@pytest.mark.parametrize("index, name", [(i, f"name-{{i}}") for i in range({tests})])
+def test_parametrized(index, name):
+    pass
+"""
+
+
+class _RunLoopTimer:
+    def __init__(self) -> None:
+        self.duration_ns = 0
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtestloop(self, session: pytest.Session) -> object:  # pylint: disable=W0613
+        start = time.perf_counter_ns()
+        yield
+        self.duration_ns = time.perf_counter_ns() - start
+
+
+def _recompute_test_identity(item: Function) -> TestIdentity:
+    return build_test_identity(item=item)
+
+
+@contextmanager
+def recomputed_test_identity() -> Iterator[None]:
+    """Re-compute the identity on every lookup, like get_test_full_name did before the identity was stashed."""
+    originals = {module: module.get_test_identity for module in PLUGIN_MODULES}
+    for module in PLUGIN_MODULES:
+        module.get_test_identity = _recompute_test_identity
+    try:
+        yield
+    finally:
+        for module, original in originals.items():
+            module.get_test_identity = original
+
+
+def run_suite(test_dir: Path, output_dir: Path) -> int:
+    """Run the suite with the plugins on and return the run loop duration (ns)."""
+    timer = _RunLoopTimer()
+    args = [str(test_dir), "-q", "-p", "no:cacheprovider", "-p", "no:logging", *PLUGIN_ARGS]
+    pytest.main([*args, "--output-dir", str(output_dir)], plugins=[timer])
+    return timer.duration_ns
+
+
+def main() -> None:
+    tests = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    recomputed_runs, stashed_runs = [], []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        test_dir = Path(tmp_dir) / "tests"
+        test_dir.mkdir()
+        (test_dir / "pytest.ini").write_text("[pytest]\n")
+        (test_dir / "test_benchmark_hook_overhead.py").write_text(TEST_MODULE.format(tests=tests))
+
+        for index in range(REPEATS):  # interleaved, so warm-up and machine noise hit both modes alike
+            with recomputed_test_identity():
+                recomputed_runs.append(run_suite(test_dir=test_dir, output_dir=Path(tmp_dir) / f"recomputed-{index}"))
+            stashed_runs.append(run_suite(test_dir=test_dir, output_dir=Path(tmp_dir) / f"stashed-{index}"))
+    recomputed, stashed = min(recomputed_runs), min(stashed_runs)
+
+    logger.info(f"{tests} parametrized tests, plugins: {' '.join(PLUGIN_ARGS)}, best of {REPEATS} runs")
+    logger.info(f"{'identity re-computed on every lookup':<40} {recomputed / tests / 1000:>8.2f} us/test")
+    logger.info(f"{'identity stashed once per item':<40} {stashed / tests / 1000:>8.2f} us/test")
+    logger.info(f"{'saved':<40} {(recomputed - stashed) / tests / 1000:>8.2f} us/test")
+
+
+if __name__ == "__main__":
+    main()
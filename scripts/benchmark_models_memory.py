@@ -0,0 +1,108 @@
+import logging
+import sys
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, fields, make_dataclass
+
+from custom_python_logger import build_logger
+
+from pytest_plugins import LOGGER_NAME
+from pytest_plugins.models import ExecutionStatus, TestData
+
+logger = build_logger(project_name=f"{LOGGER_NAME}.benchmark_models_memory", log_level=logging.DEBUG)
+
+# the TestData layout before slots: a regular dataclass, "--add-parameters" values pushed into its __dict__
+LegacyTestData = make_dataclass("LegacyTestData", [(f.name, f.type, f) for f in fields(TestData)])
+
+TEST_FILE_PATH = "/repo/tests/test_benchmark_module.py"
+CLASS_NAME = "TestBenchmark"  # item.cls.__name__, one string shared by the tests of the class
+MARKER_NAMES = ("smoke", "regression")  # marker.name, shared by the tests too
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    tests: int
+    total_bytes: int
+
+    @property
+    def bytes_per_test(self) -> float:
+        return self.total_bytes / self.tests
+
+
+def _make_fields(index: int, intern: bool) -> dict:
+    """
+    The fields as better_report builds them from the item: the strings are split out of each test's node id (and
+    the file name out of its path), so every test gets its own copies unless they are interned, like the real
+    construction path before (intern=False) and after (intern=True) the change.
+    """
+    params = {"param1": index % 7, "param2": f"value-{index % 13}"}
+    nodeid = f"tests/test_benchmark_module.py::{CLASS_NAME}::test_parametrized[{index % 7}-value-{index % 13}]"
+    test_name = nodeid.split(".py::")[-1].split("[")[0]
+    test_file_name = TEST_FILE_PATH.rsplit("/", 1)[-1]  # item.fspath.basename
+    class_test_name, markers = CLASS_NAME, list(MARKER_NAMES)
+    if intern:
+        test_name, test_file_name = sys.intern(test_name), sys.intern(test_file_name)
+        class_test_name, markers = sys.intern(class_test_name), [sys.intern(marker) for marker in markers]
+    return {
+        "test_file_name": test_file_name,
+        "class_test_name": class_test_name,
+        "test_name": test_name,
+        "pytest_test_name": nodeid.split(".py::")[-1],
+        "test_full_name": f"{test_name}[{params}]",
+        "test_full_path": f"{nodeid.split('[')[0]}[{params}]",
+        "test_status": ExecutionStatus.PASSED,
+        "test_parameters": params,
+        "test_markers": markers,
+        "test_start_time": "2026-01-01T00:00:00.000000+00:00",
+        "test_end_time": "2026-01-01T00:00:01.000000+00:00",
+        "test_duration_sec": 1.0,
+        "run_index": index,
+    }
+
+
+def _build_legacy(tests: int) -> list:
+    results = []
+    for index in range(tests):
+        kwargs = _make_fields(index=index, intern=False)
+        test_data = LegacyTestData(**kwargs)
+        test_data.__dict__.update(**kwargs["test_parameters"])
+        results.append(test_data)
+    return results
+
+
+def _build_slotted(tests: int) -> tuple[list, dict]:
+    results, extra_parameters = [], {}
+    for index in range(tests):
+        kwargs = _make_fields(index=index, intern=True)
+        test_data = TestData(**kwargs)
+        extra_parameters[test_data.test_full_name] = kwargs["test_parameters"]
+        results.append(test_data)
+    return results, extra_parameters
+
+
+def measure(name: str, tests: int, build: Callable[[int], object]) -> BenchmarkResult:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    data = build(tests)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return BenchmarkResult(name=name, tests=tests, total_bytes=after - before)
+
+
+def main() -> None:
+    tests = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    logger.info(f"Measuring the memory of {tests} parametrized test results (--add-parameters enabled)")
+
+    legacy = measure(name="dataclass + __dict__ parameters", tests=tests, build=_build_legacy)
+    slotted = measure(name="slotted + interned + side table", tests=tests, build=_build_slotted)
+    for result in (legacy, slotted):
+        logger.info(
+            f"{result.name:<35} {result.bytes_per_test:>8.0f} bytes/test  {result.total_bytes / 2**20:>8.1f} MiB"
+        )
+    logger.info(f"Saved: {(1 - slotted.total_bytes / legacy.total_bytes) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import json
+import logging
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from custom_python_logger import build_logger
+
+from pytest_plugins import LOGGER_NAME
+from pytest_plugins.models import ExecutionStatus, TestData
+from pytest_plugins.utils.helper import save_as_json, serialize_data
+from pytest_plugins.utils.serializer import JsonSerializer, OrjsonSerializer, orjson
+
+logger = build_logger(project_name=f"{LOGGER_NAME}.benchmark_serializer", log_level=logging.DEBUG)
+
+
+def build_test_results(tests: int) -> dict[str, TestData]:
+    test_results = {}
+    for index in range(tests):
+        test_full_name = f"TestBenchmark::test_parametrized[{{'index': {index}}}]"
+        test_results[test_full_name] = TestData(
+            test_file_name="test_benchmark_module.py",
+            class_test_name="TestBenchmark",
+            test_name="TestBenchmark::test_parametrized",
+            pytest_test_name=f"TestBenchmark::test_parametrized[{index}]",
+            test_full_name=test_full_name,
+            test_full_path=f"tests/test_benchmark_module.py::{test_full_name}",
+            test_status=ExecutionStatus.PASSED,
+            test_parameters={"index": index},
+            test_markers=["smoke"],
+            test_start_time="2026-01-01T00:00:00.000000+00:00",
+            test_end_time="2026-01-01T00:00:01.000000+00:00",
+            test_duration_sec=1.0,
+            run_index=index,
+        )
+    return test_results
+
+
+def _legacy_save_as_json(path: Path, data: dict) -> None:
+    """save_as_json before the serializer layer: the whole document built as one string, then written."""
+    with open(path, "w", encoding="utf-8") as json_file:
+        json_file.write(json.dumps(data, indent=4, default=serialize_data))
+
+
+def measure(save: Callable[[Path], None], path: Path) -> float:
+    """Return the best write time (seconds) out of a few repeats."""
+    durations = []
+    for _ in range(3):
+        start = time.perf_counter_ns()
+        save(path)
+        durations.append((time.perf_counter_ns() - start) / 1e9)
+    return min(durations)
+
+
+def main() -> None:
+    tests = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    test_results = build_test_results(tests=tests)
+    logger.info(f"Writing the test results of {tests} tests")
+
+    candidates = {
+        "json.dumps(indent=4) (before)": lambda path: _legacy_save_as_json(path=path, data=test_results),
+        "stdlib, pretty, streamed": lambda path: save_as_json(
+            path=path, data=test_results, serializer=JsonSerializer(pretty=True, default=serialize_data)
+        ),
+        "stdlib, compact, streamed": lambda path: save_as_json(
+            path=path, data=test_results, serializer=JsonSerializer(pretty=False, default=serialize_data)
+        ),
+    }
+    if orjson is not None:
+        for pretty in (True, False):
+            serializer = OrjsonSerializer(pretty=pretty, default=serialize_data, native_dataclasses=True)
+            candidates[f"orjson, {'pretty' if pretty else 'compact'}"] = lambda path, s=serializer: save_as_json(
+                path=path, data=test_results, serializer=s
+            )
+    else:
+        logger.info("orjson is not installed, skipping the orjson backend")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "test_results.json"
+        for name, save in candidates.items():
+            duration = measure(save=save, path=path)
+            logger.info(f"{name:<32} {duration:>8.3f} s  {path.stat().st_size / 2**20:>8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,18 @@ import json
 import logging
 import sys
 from collections import Counter
+from pathlib import Path
 
 from custom_python_logger import build_logger
 
 from pytest_plugins import LOGGER_NAME
+from pytest_plugins.utils.compression import open_for_read, resolve_compressed_path
 
 logger = build_logger(project_name=f"{LOGGER_NAME}.automation_tests_check_status", log_level=logging.DEBUG)
 
 
 def summarize_tests(json_path: str) -> None:
-    with open(json_path, encoding="utf-8") as f:
+    with open_for_read(resolve_compressed_path(Path(json_path))) as f:  # plain or compressed
         test_results = json.load(f)
 
     statuses = [v["test_status"] for v in test_results.values()]
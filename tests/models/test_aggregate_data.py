@@ -0,0 +1,12 @@
+from pytest_plugins.models.aggregate_data import AggregateData
+
+
+class TestAggregateData:
+    def test_counters_default_to_zero(self) -> None:
+        data = AggregateData(name="test_a.py")
+        assert data.test_count == 0, "Expected no tests by default"
+        assert data.failed_count == 0, "Expected no failures by default"
+        assert data.max_duration_sec == 0.0, "Expected zero max duration by default"
+
+    def test_is_slotted(self) -> None:
+        assert not hasattr(AggregateData(name="test_a.py"), "__dict__"), "Expected a slotted dataclass"
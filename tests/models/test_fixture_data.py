@@ -0,0 +1,18 @@
+from pytest_plugins.models.fixture_data import FixtureData
+
+
+class TestFixtureData:
+    def test_create_with_required_fields(self) -> None:
+        data = FixtureData(fixture_name="my_fixture", scope="session")
+        assert data.fixture_name == "my_fixture", "Expected fixture name to match"
+        assert data.scope == "session", "Expected scope to match"
+
+    def test_counters_default_to_zero(self) -> None:
+        data = FixtureData(fixture_name="my_fixture", scope="function")
+        assert data.setup_count == 0, "Expected no setups by default"
+        assert data.cache_hits == 0, "Expected no cache hits by default"
+        assert data.total_sec == 0.0, "Expected zero total by default"
+        assert data.setup_p95_sec is None, "Expected None p95 by default"
+
+    def test_is_slotted(self) -> None:
+        assert not hasattr(FixtureData(fixture_name="f", scope="function"), "__dict__"), "Expected a slotted dataclass"
@@ -0,0 +1,13 @@
+from pytest_plugins.models.history_entry import HistoryEntry
+
+
+class TestHistoryEntry:
+    def test_defaults_to_no_runs(self) -> None:
+        entry = HistoryEntry(test_full_path="test_a.py::test_foo")
+        assert entry.run_count == 0 and entry.ewma_duration_sec is None, f"Expected no runs by default: {entry}"
+        assert entry.last_statuses == [], "Expected no statuses by default"
+
+    def test_is_slotted(self) -> None:
+        assert not hasattr(
+            HistoryEntry(test_full_path="test_a.py::test_foo"), "__dict__"
+        ), "Expected a slotted dataclass"
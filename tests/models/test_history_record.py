@@ -0,0 +1,11 @@
+from pytest_plugins.models.history_record import HistoryRecord
+
+
+class TestHistoryRecord:
+    def test_defaults_to_no_duration_and_not_failed(self) -> None:
+        record = HistoryRecord()
+        assert record.duration_sec is None, "Expected no duration by default"
+        assert record.failed is False, "Expected not failed by default"
+
+    def test_is_slotted(self) -> None:
+        assert not hasattr(HistoryRecord(), "__dict__"), "Expected a slotted dataclass"
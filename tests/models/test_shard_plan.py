@@ -0,0 +1,16 @@
+from pytest_plugins.models.shard_plan import ShardPlan
+
+
+class TestShardPlan:
+    def test_per_shard_lists_default_to_empty(self) -> None:
+        plan = ShardPlan(shard_count=2, shard_index=0)
+        assert plan.shard_test_counts == [] and plan.shard_predicted_duration_sec == [], "Expected empty lists"
+        assert plan.actual_duration_sec is None, "Expected no actual duration before the run"
+
+    def test_lists_are_not_shared(self) -> None:
+        first, second = ShardPlan(shard_count=2, shard_index=0), ShardPlan(shard_count=2, shard_index=1)
+        first.shard_test_counts.append(1)
+        assert second.shard_test_counts == [], "Expected a new list per plan"
+
+    def test_is_slotted(self) -> None:
+        assert not hasattr(ShardPlan(shard_count=1, shard_index=0), "__dict__"), "Expected a slotted dataclass"
@@ -14,6 +14,7 @@ class TestExecutionStatus:
             "CANCELLED",
             "SKIPPED",
             "FAILED_SKIPPED",
+            "CACHED_PASS",
         }
         actual = {s.name for s in ExecutionStatus}
         assert actual == expected, f"Expected members {expected}, got {actual}"
@@ -21,6 +22,9 @@ class TestExecutionStatus:
     def test_passed_value(self) -> None:
         assert ExecutionStatus.PASSED == "passed", "Expected PASSED value to be 'passed'"
 
+    def test_cached_pass_value(self) -> None:
+        assert ExecutionStatus.CACHED_PASS == "cached-pass", "Expected CACHED_PASS value to be 'cached-pass'"
+
     def test_failed_value(self) -> None:
         assert ExecutionStatus.FAILED == "failed", "Expected FAILED value to be 'failed'"
 
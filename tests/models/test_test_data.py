@@ -78,3 +78,7 @@ class TestTestData:
         assert data.test_start_time == "2024-01-01T12:00:00+00:00", "Expected start time to be set"
         assert data.test_end_time == "2024-01-01T12:00:01+00:00", "Expected end time to be set"
         assert data.test_duration_sec == 1.0, "Expected duration to be set"
+
+    def test_is_slotted(self) -> None:
+        data = make_test_data()
+        assert not hasattr(data, "__dict__"), "Expected a slotted dataclass without per-instance __dict__"
@@ -0,0 +1,35 @@
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def write_history(pytester: pytest.Pytester) -> Callable[[dict[str, tuple[str, float]], Path], Path]:
+    """Write a previous test_results.json of a test file from test_full_name -> (test_status, test_duration_sec)."""
+
+    def _write_history(results: dict[str, tuple[str, float]], test_file: Path) -> Path:
+        path = pytester.path / "history.json"
+        history = {
+            name: {
+                "test_full_path": f"{test_file.name}::{name}",
+                "test_status": status,
+                "test_duration_sec": duration,
+            }
+            for name, (status, duration) in results.items()
+        }
+        path.write_text(json.dumps(history), encoding="utf-8")
+        return path
+
+    return _write_history
+
+
+@pytest.fixture
+def passed_tests() -> Callable[[pytest.RunResult], list[str]]:
+    """The names of the tests that passed in a "-v" run, in their run order."""
+
+    def _passed_tests(result: pytest.RunResult) -> list[str]:
+        return [line.split("::")[1].split()[0] for line in result.outlines if "::test_" in line and "PASSED" in line]
+
+    return _passed_tests
@@ -33,3 +33,16 @@ class TestAddConfigParameters:
         )
         result = pytester.runpytest_subprocess("--config-path")
         assert result.ret == pytest.ExitCode.OK, f"Expected OK, got {result.ret}"
+
+    def test_fixture_registered_only_with_flag(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(
+            """
+            class TestFoo:
+                def test_foo(self) -> None:
+                    assert True
+        """
+        )
+        result = pytester.runpytest_subprocess("--setup-plan")
+        assert "add_param_to_class" not in result.stdout.str(), "Expected no autouse fixture without the flag"
+        result = pytester.runpytest_subprocess("--setup-plan", "--config-path")
+        result.stdout.fnmatch_lines(["*add_param_to_class*"])
@@ -1,8 +1,18 @@
+import gzip
 import json
 
 import pytest
 
-from pytest_plugins.better_report import EXECUTION_RESULTS_FILENAME, TEST_RESULTS_FILENAME
+from pytest_plugins.better_report import get_peak_concurrency
+from pytest_plugins.const import (
+    AGGREGATES_FILENAME,
+    EXECUTION_RESULTS_FILENAME,
+    FIXTURE_RESULTS_FILENAME,
+    HTML_REPORT_FILENAME,
+    NDJSON_TEST_RESULTS_FILENAME,
+    TEST_RESULTS_FILENAME,
+)
+from pytest_plugins.utils.history_store import HISTORY_STORE_FILENAME, HistoryStore
 
 
 class TestBetterReport:
@@ -104,6 +114,59 @@ class TestBetterReport:
         output_dir = pytester.path / "results_output"
         assert (output_dir / "test_report.md").exists(), "Expected test_report.md to be created"
 
+    def test_aggregates_saved(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(
+            """
+            class TestGroup:
+                def test_foo(self) -> None:
+                    assert True
+
+                def test_bar(self) -> None:
+                    assert False
+
+            def test_baz() -> None:
+                assert True
+        """
+        )
+        result = pytester.runpytest_subprocess("--better-report", "--better-report-format=ndjson", "--md-report")
+        assert result.ret == pytest.ExitCode.TESTS_FAILED, f"Expected TESTS_FAILED, got {result.ret}"
+        output_dir = pytester.path / "results_output"
+        aggregates = json.loads((output_dir / AGGREGATES_FILENAME).read_text())
+        [file_data] = aggregates["files"].values()
+        assert (file_data["test_count"], file_data["passed_count"], file_data["failed_count"]) == (3, 2, 1), aggregates
+        [class_data] = aggregates["classes"].values()
+        assert class_data["test_count"] == 2, f"Expected the two class tests: {aggregates}"
+        assert "Per-class summary (1 classes" in (output_dir / "test_report.md").read_text(), "Expected md section"
+
+    def test_html_report_generated_with_flag(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(
+            """
+            def test_foo() -> None:
+                assert True
+        """
+        )
+        result = pytester.runpytest_subprocess("--better-report", "--better-report-format=ndjson", "--html-report")
+        assert result.ret == pytest.ExitCode.OK, f"Expected OK, got {result.ret}"
+        page = (pytester.path / "results_output" / HTML_REPORT_FILENAME).read_text()
+        assert '"rows":[' in page and "test_foo" in page, "Expected the results embedded in the HTML report"
+
+    def test_md_report_max_rows(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(
+            """
+            import pytest
+
+            @pytest.mark.parametrize("index", range(5))
+            def test_foo(index: int) -> None:
+                assert index != 3
+        """
+        )
+        result = pytester.runpytest_subprocess("--better-report", "--md-report", "--md-report-max-rows=1")
+        assert result.ret == pytest.ExitCode.TESTS_FAILED, f"Expected TESTS_FAILED, got {result.ret}"
+        report = (pytester.path / "results_output" / "test_report.md").read_text()
+        assert "`test_foo[{'index': 3}]` | ❌ failed" in report, f"Expected the failure listed: {report}"
+        assert "`test_foo[{'index': 0}]`" not in report, "Expected the passed tests left out of the table"
+        assert "Showing 1 of 5 tests" in report, "Expected the truncation note"
+
     def test_repo_name_stored_in_execution_results(self, pytester: pytest.Pytester) -> None:
         pytester.makepyfile(
             """
@@ -173,3 +236,317 @@ class TestBetterReport:
         assert (
             data["execution_info"]["execution_status"] == "passed"
         ), f"Expected 'passed' when skipped tests present, got {data['execution_info']['execution_status']}"
+
+    def test_ndjson_format_streams_one_record_per_test(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(
+            """
+            def test_first() -> None:
+                assert True
+
+            def test_second() -> None:
+                assert False
+        """
+        )
+        result = pytester.runpytest_subprocess("--better-report", "--better-report-format=ndjson")
+        assert result.ret == pytest.ExitCode.TESTS_FAILED, f"Expected TESTS_FAILED, got {result.ret}"
+        ndjson_file = pytester.path / "results_output" / NDJSON_TEST_RESULTS_FILENAME
+        records = [json.loads(line) for line in ndjson_file.read_text().splitlines()]
+        assert [r["test_full_name"] for r in records] == [
+            "test_first",
+            "test_second",
+        ], f"Expected one record per test in execution order, got {records}"
+        assert [r["test_status"] for r in records] == ["passed", "failed"], "Expected statuses in ndjson records"
+
+    def test_ndjson_format_collect_only_keeps_previous_records(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(
+            """
+            def test_first() -> None:
+                assert True
+        """
+        )
+        pytester.runpytest_subprocess("--better-report", "--better-report-format=ndjson")
+        ndjson_file = pytester.path / "results_output" / NDJSON_TEST_RESULTS_FILENAME
+        previous_records = ndjson_file.read_text()
+        result = pytester.runpytest_subprocess("--better-report", "--better-report-format=ndjson", "--collect-only")
+        assert result.ret == pytest.ExitCode.OK, f"Expected OK, got {result.ret}"
+        assert ndjson_file.read_text() == previous_records, "Expected --collect-only to leave the ndjson file as is"
+
+    def test_ndjson_format_rerun_keeps_run_index(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(
+            """
+            import pytest
+
+            attempts = []
+
+            def test_first() -> None:
+                assert True
+
+            @pytest.mark.flaky(reruns=1)
+            def test_flaky() -> None:
+                attempts.append(1)
+                assert len(attempts) > 1
+        """
+        )
+        result = pytester.runpytest_subprocess("--better-report", "--better-report-format=ndjson")
+        assert result.ret == pytest.ExitCode.OK, f"Expected OK, got {result.ret}"
+        data = json.loads((pytester.path / "results_output" / TEST_RESULTS_FILENAME).read_text())
+        assert data["test_flaky"]["test_status"] == "passed", f"Expected the rerun to pass, got {data['test_flaky']}"
+        assert data["test_flaky"]["run_index"] == 2, f"Expected the first attempt's run_index, got {data['test_flaky']}"
+
+    def test_ndjson_format_still_produces_json_files(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(
+            """
+            import pytest
+
+            @pytest.mark.parametrize("x", [1, 2])
+            def test_foo(x: int) -> None:
+                assert x == 1
+        """
+        )
+        result = pytester.runpytest_subprocess("--better-report", "--better-report-format=ndjson", "--md-report")
+        assert result.ret == pytest.ExitCode.TESTS_FAILED, f"Expected TESTS_FAILED, got {result.ret}"
+        output_dir = pytester.path / "results_output"
+        data = json.loads((output_dir / TEST_RESULTS_FILENAME).read_text())
+        assert list(data) == ["test_foo[{'x': 1}]", "test_foo[{'x': 2}]"], f"Expected keyed test results, got {data}"
+        assert data["test_foo[{'x': 2}]"]["test_status"] == "failed", "Expected failed status in finalized file"
+        execution = json.loads((output_dir / EXECUTION_RESULTS_FILENAME).read_text())
+        assert execution["execution_info"]["execution_status"] == "failed", "Expected failed execution status"
+        assert execution["execution_info"]["test_list"] == list(data), "Expected test_list to match test results"
+        assert (output_dir / "test_report.md").exists(), "Expected test_report.md to be created"
+
+    def test_add_parameters_adds_param_fields(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(
+            """
+            import pytest
+
+            @pytest.mark.parametrize("x", [1])
+            def test_foo(x: int) -> None:
+                assert x == 1
+        """
+        )
+        result = pytester.runpytest_subprocess("--better-report", "--add-parameters")
+        assert result.ret == pytest.ExitCode.OK, f"Expected OK, got {result.ret}"
+        data = json.loads((pytester.path / "results_output" / TEST_RESULTS_FILENAME).read_text())
+        test_entry = next(iter(data.values()))
+        assert test_entry["x"] == 1, f"Expected parameter 'x' as a test result field, got {test_entry}"
+
+    @pytest.mark.parametrize("serializer", ["json", "orjson"])
+    def test_compact_json_style(self, pytester: pytest.Pytester, serializer: str) -> None:
+        if serializer == "orjson":
+            pytest.importorskip("orjson")
+        pytester.makepyfile(
+            """
+            def test_foo() -> None:
+                assert True
+        """
+        )
+        result = pytester.runpytest_subprocess(
+            "--better-report", "--better-report-json-style=compact", f"--better-report-serializer={serializer}"
+        )
+        assert result.ret == pytest.ExitCode.OK, f"Expected OK, got {result.ret}"
+        text = (pytester.path / "results_output" / TEST_RESULTS_FILENAME).read_text()
+        assert "\n" not in text and ": " not in text, f"Expected a compact file, got {text}"
+        assert json.loads(text)["test_foo"]["test_status"] == "passed", f"Unexpected test results: {text}"
+
+    def test_compressed_test_results(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(
+            """
+            def test_foo() -> None:
+                assert True
+        """
+        )
+        result = pytester.runpytest_subprocess(
+            "--better-report", "--better-report-compression=gzip", "--better-report-format=ndjson", "--md-report"
+        )
+        assert result.ret == pytest.ExitCode.OK, f"Expected OK, got {result.ret}"
+        output_dir = pytester.path / "results_output"
+        assert not (output_dir / TEST_RESULTS_FILENAME).exists(), "Expected no uncompressed test results file"
+        with gzip.open(output_dir / f"{TEST_RESULTS_FILENAME}.gz", "rt") as file:
+            assert json.load(file)["test_foo"]["test_status"] == "passed", "Expected gzip compressed test results"
+        assert "test_foo" in (output_dir / "test_report.md").read_text(), "Expected md report from compressed file"
+        execution_data = json.loads((output_dir / EXECUTION_RESULTS_FILENAME).read_text())
+        assert execution_data["execution_info"], "Expected the execution results to stay plain JSON"
+
+    def test_phase_durations_separate_fixture_time_from_test_body(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(
+            """
+            import time
+
+            import pytest
+
+            @pytest.fixture
+            def slow_fixture():
+                time.sleep(0.2)
+                yield
+                time.sleep(0.1)
+
+            def test_foo(slow_fixture) -> None:
+                assert True
+        """
+        )
+        result = pytester.runpytest_subprocess("--better-report")
+        assert result.ret == pytest.ExitCode.OK, f"Expected OK, got {result.ret}"
+        data = json.loads((pytester.path / "results_output" / TEST_RESULTS_FILENAME).read_text())
+        test_entry = next(iter(data.values()))
+        assert test_entry["setup_duration_sec"] >= 0.2, f"Expected the fixture setup time, got {test_entry}"
+        assert test_entry["teardown_duration_sec"] >= 0.1, f"Expected the fixture teardown time, got {test_entry}"
+        assert test_entry["call_duration_sec"] < 0.1, f"Expected a fast test body, got {test_entry}"
+        assert test_entry["test_duration_sec"] == pytest.approx(
+            test_entry["setup_duration_sec"] + test_entry["call_duration_sec"] + test_entry["teardown_duration_sec"]
+        ), f"Expected the total to be the sum of the phases, got {test_entry}"
+
+    def test_fixture_timings_aggregated_per_fixture(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(
+            """
+            import time
+
+            import pytest
+
+            @pytest.fixture(scope="module")
+            def slow_module_fixture():
+                time.sleep(0.2)
+                yield
+                time.sleep(0.1)
+
+            @pytest.mark.parametrize("x", range(3))
+            def test_foo(slow_module_fixture, x: int) -> None:
+                assert True
+        """
+        )
+        result = pytester.runpytest_subprocess("--better-report", "--fixture-timings", "--md-report")
+        assert result.ret == pytest.ExitCode.OK, f"Expected OK, got {result.ret}"
+        output_dir = pytester.path / "results_output"
+        fixture_results = json.loads((output_dir / FIXTURE_RESULTS_FILENAME).read_text())
+        fixture = fixture_results["slow_module_fixture"]
+        assert fixture["scope"] == "module", f"Expected the fixture scope, got {fixture}"
+        assert fixture["setup_count"] == 1, f"Expected a single setup, got {fixture}"
+        assert fixture["cache_hits"] == 2, f"Expected the other tests to hit the cache, got {fixture}"
+        assert fixture["setup_total_sec"] >= 0.2, f"Expected the setup time, got {fixture}"
+        assert fixture["teardown_total_sec"] >= 0.1, f"Expected the teardown time, got {fixture}"
+        assert next(iter(fixture_results)) == "slow_module_fixture", "Expected the slowest fixture first"
+        assert "Slowest Fixtures" in (output_dir / "test_report.md").read_text(), "Expected slowest fixtures table"
+
+    def test_no_fixture_results_without_flag(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(
+            """
+            def test_foo() -> None:
+                assert True
+        """
+        )
+        result = pytester.runpytest_subprocess("--better-report")
+        assert result.ret == pytest.ExitCode.OK, f"Expected OK, got {result.ret}"
+        assert not (pytester.path / "results_output" / FIXTURE_RESULTS_FILENAME).exists(), "Expected no fixture file"
+
+    def test_history_store_updated_every_session(self, pytester: pytest.Pytester) -> None:
+        tests = """
+            def test_foo() -> None:
+                assert True
+
+            def test_bar() -> None:
+                assert False
+        """
+        pytester.makepyfile(test_a=tests, test_b=tests.replace("assert False", "assert True"))
+        for _ in range(2):  # e.g. the jobs of a CI matrix, each running its own files into the same history
+            for test_file in ("test_a.py", "test_b.py"):
+                pytester.runpytest_subprocess(test_file, "--better-report", "--better-report-history")
+        with HistoryStore(path=pytester.path / "results_output" / HISTORY_STORE_FILENAME) as store:
+            history = store.get_all()
+        expected = {"test_a.py::test_foo", "test_a.py::test_bar", "test_b.py::test_foo", "test_b.py::test_bar"}
+        assert set(history) == expected, f"Expected the same-named tests of both modules apart, got {history}"
+        assert history["test_a.py::test_bar"].run_count == 2, f"Expected 2 runs, got {history['test_a.py::test_bar']}"
+        assert history["test_a.py::test_bar"].last_statuses == ["failed", "failed"], "Expected the failures"
+        assert history["test_b.py::test_bar"].last_statuses == [
+            "passed",
+            "passed",
+        ], "Expected the other module's passes"
+        assert history["test_a.py::test_foo"].ewma_duration_sec is not None, "Expected the duration average"
+
+    def test_no_history_store_without_flag(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(
+            """
+            def test_foo() -> None:
+                assert True
+        """
+        )
+        pytester.runpytest_subprocess("--better-report")
+        assert not (pytester.path / "results_output" / HISTORY_STORE_FILENAME).exists(), "Expected no history store"
+
+
+class TestBetterReportXdist:
+    def test_worker_results_merged_on_controller(self, pytester: pytest.Pytester) -> None:
+        pytest.importorskip("xdist")
+        pytester.makepyfile(
+            """
+            import pytest
+
+            @pytest.mark.parametrize("x", range(4))
+            def test_foo(x: int) -> None:
+                assert x != 3
+        """
+        )
+        result = pytester.runpytest_subprocess("--better-report", "-n", "2")
+        assert result.ret == pytest.ExitCode.TESTS_FAILED, f"Expected TESTS_FAILED, got {result.ret}"
+        output_dir = pytester.path / "results_output"
+        data = json.loads((output_dir / TEST_RESULTS_FILENAME).read_text())
+        assert len(data) == 4, f"Expected 4 merged test entries, got {len(data)}"
+        assert {t["worker_id"] for t in data.values()} <= {"gw0", "gw1"}, "Expected the worker id of each test"
+        assert data["test_foo[{'x': 3}]"]["test_status"] == "failed", "Expected worker status in merged report"
+        exec_info = json.loads((output_dir / EXECUTION_RESULTS_FILENAME).read_text())["execution_info"]
+        assert exec_info["execution_status"] == "failed", f"Expected 'failed', got {exec_info['execution_status']}"
+        assert sorted(exec_info["test_list"]) == sorted(data), "Expected test_list of all merged tests"
+        assert exec_info["peak_concurrency"] >= 1, "Expected the peak concurrency to be recorded"
+        assert exec_info["worker_count"] >= 1, "Expected the worker count to be recorded"
+
+    def test_worker_mutations_from_fail2skip_reach_controller(self, pytester: pytest.Pytester) -> None:
+        pytest.importorskip("xdist")
+        pytester.makepyfile(
+            """
+            import pytest
+
+            @pytest.mark.fail2skip(reason="known issue")
+            def test_foo() -> None:
+                assert False
+        """
+        )
+        result = pytester.runpytest_subprocess("--better-report", "--fail2skip", "-n", "2")
+        assert result.ret == pytest.ExitCode.OK, f"Expected OK, got {result.ret}"
+        data = json.loads((pytester.path / "results_output" / TEST_RESULTS_FILENAME).read_text())
+        test_entry = data["test_foo"]
+        assert test_entry["test_status"] == "failed-skipped", f"Expected 'failed-skipped', got {test_entry}"
+        assert test_entry["exception_message"]["fail2skip_reason"] == "known issue", "Expected fail2skip reason"
+
+    def test_worker_fixture_timings_merged_on_controller(self, pytester: pytest.Pytester) -> None:
+        pytest.importorskip("xdist")
+        pytester.makepyfile(
+            """
+            import pytest
+
+            @pytest.fixture(scope="session")
+            def session_fixture():
+                yield
+
+            @pytest.mark.parametrize("x", range(4))
+            def test_foo(session_fixture, x: int) -> None:
+                assert True
+        """
+        )
+        result = pytester.runpytest_subprocess("--better-report", "--fixture-timings", "-n", "2")
+        assert result.ret == pytest.ExitCode.OK, f"Expected OK, got {result.ret}"
+        fixture_results = json.loads((pytester.path / "results_output" / FIXTURE_RESULTS_FILENAME).read_text())
+        fixture = fixture_results["session_fixture"]
+        assert fixture["setup_count"] + fixture["cache_hits"] == 4, f"Expected every test counted, got {fixture}"
+        assert fixture["teardown_count"] == fixture["setup_count"], f"Expected a teardown per setup, got {fixture}"
+
+
+class TestGetPeakConcurrency:
+    def test_no_intervals(self) -> None:
+        assert get_peak_concurrency(intervals=[]) == 0, "Expected 0 without tests"
+
+    def test_sequential_intervals(self) -> None:
+        assert (
+            get_peak_concurrency(intervals=[(0, 1), (1, 2), (2, 3)]) == 1
+        ), "Expected back-to-back tests not to overlap"
+
+    def test_overlapping_intervals(self) -> None:
+        intervals = [(0, 10), (1, 3), (2, 4), (5, 6)]
+        assert get_peak_concurrency(intervals=intervals) == 3, "Expected 3 tests running at the same moment"
@@ -0,0 +1,251 @@
+import json
+import lzma
+from pathlib import Path
+
+import pytest
+
+from pytest_plugins import better_report_compare
+from pytest_plugins.better_report_compare import (
+    compare_reports,
+    compare_runs,
+    compare_trees,
+    find_duration_regressions,
+    find_report_pairs,
+    find_run_reports,
+    load_report,
+    load_reports,
+)
+
+
+def _write_report(
+    path: Path, statuses: dict[str, str], compress: bool = False, durations: dict[str, float] | None = None
+) -> Path:
+    report = {
+        name: {
+            "pytest_test_name": name,
+            "test_file_name": "test_a.py",
+            "test_status": status,
+            "test_duration_sec": (durations or {}).get(name),
+        }
+        for name, status in statuses.items()
+    }
+    if compress:
+        with lzma.open(path, "wt", encoding="utf-8") as file:
+            json.dump(report, file)
+    else:
+        path.write_text(json.dumps(report))
+    return path
+
+
+class TestLoadReport:
+    def test_indexes_by_pytest_test_name(self, tmp_path: Path) -> None:
+        path = _write_report(tmp_path / "a.json", {"test_foo": "passed"})
+        assert list(load_report(path)) == ["test_foo"], "Expected the report indexed by pytest_test_name"
+
+    def test_filters_by_test_file_name(self, tmp_path: Path) -> None:
+        path = _write_report(tmp_path / "a.json", {"test_foo": "passed"})
+        assert not load_report(path, test_file_name="test_b.py"), "Expected tests of other files filtered out"
+
+    def test_reads_compressed_report(self, tmp_path: Path) -> None:
+        path = _write_report(tmp_path / "a.json.xz", {"test_foo": "failed"}, compress=True)
+        assert load_report(path)["test_foo"]["test_status"] == "failed", "Expected the lzma report to be read"
+
+
+class TestLoadReports:
+    def test_results_in_input_order(self, tmp_path: Path) -> None:
+        file_a = _write_report(tmp_path / "a.json", {"test_a": "passed"})
+        file_b = _write_report(tmp_path / "b.json", {"test_b": "passed"})
+        reports = load_reports([file_a, file_b])
+        assert [list(report) for report in reports] == [["test_a"], ["test_b"]], "Expected the input order"
+
+    def test_large_files_loaded_in_processes(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(better_report_compare, "PROCESS_POOL_MIN_BYTES", 0)
+        monkeypatch.setattr(better_report_compare.os, "cpu_count", lambda: 2)
+        file_a = _write_report(tmp_path / "a.json", {"test_a": "passed"})
+        file_b = _write_report(tmp_path / "b.json.xz", {"test_b": "failed"}, compress=True)
+        report_a, report_b = load_reports([file_a, file_b])
+        assert report_b["test_b"]["test_status"] == "failed", "Expected the report loaded by a worker process"
+        assert list(report_a) == ["test_a"], "Expected the report loaded by a worker process"
+
+
+class TestCompareReports:
+    def test_identical_reports(self, tmp_path: Path) -> None:
+        file_a = _write_report(tmp_path / "a.json", {"test_foo": "passed"})
+        file_b = _write_report(tmp_path / "b.json.xz", {"test_foo": "passed"}, compress=True)
+        assert compare_reports(file_a, file_b), "Expected a plain and a compressed identical report to match"
+
+    def test_status_difference(self, tmp_path: Path) -> None:
+        file_a = _write_report(tmp_path / "a.json", {"test_foo": "passed"})
+        file_b = _write_report(tmp_path / "b.json", {"test_foo": "failed"})
+        assert not compare_reports(file_a, file_b), "Expected the status difference to be found"
+
+    def test_cached_pass_is_a_pass(self, tmp_path: Path) -> None:
+        file_a = _write_report(tmp_path / "a.json", {"test_foo": "passed"})
+        file_b = _write_report(tmp_path / "b.json", {"test_foo": "cached-pass"})
+        assert compare_reports(file_a, file_b), "Expected a cached pass to match a pass"
+
+    def test_timings_printed_on_request(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        file_a = _write_report(tmp_path / "a.json", {"test_foo": "passed"})
+        compare_reports(file_a, file_a, timings=True)
+        output = capsys.readouterr().out
+        assert all(phase in output for phase in ("TIMINGS", "load", "diff", "print")), "Expected phase timings"
+
+    def test_no_timings_by_default(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        file_a = _write_report(tmp_path / "a.json", {"test_foo": "passed"})
+        compare_reports(file_a, file_a)
+        assert "TIMINGS" not in capsys.readouterr().out, "Expected no timings without the flag"
+
+    def test_duration_regression_is_a_difference(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        file_a = _write_report(tmp_path / "a.json", {"test_foo": "passed"}, durations={"test_foo": 1.0})
+        file_b = _write_report(tmp_path / "b.json", {"test_foo": "passed"}, durations={"test_foo": 3.0})
+        assert compare_reports(file_a, file_b), "Expected durations ignored without a threshold"
+        assert not compare_reports(file_a, file_b, duration_threshold_pct=50), "Expected the regression found"
+        output = capsys.readouterr().out
+        assert "Duration regressions" in output and "+200%" in output, f"Expected the regressions table: {output}"
+
+
+class TestOutputFormats:
+    @staticmethod
+    def _compare(tmp_path: Path, output_format: str) -> str:
+        file_a = _write_report(
+            tmp_path / "a.json", {"test_foo": "passed", "test_gone": "passed"}, durations={"test_foo": 1.0}
+        )
+        file_b = _write_report(tmp_path / "b.json", {"test_foo": "failed", "test_new[a|b]": "passed"})
+        output = tmp_path / "diff" / f"compare.{output_format}"
+        assert not compare_reports(file_a, file_b, output_format=output_format, output=output), "Expected differences"
+        return output.read_text(encoding="utf-8")
+
+    def test_json(self, tmp_path: Path) -> None:
+        data = json.loads(self._compare(tmp_path, "json"))
+        assert data["missing_in_b"] == ["test_gone"] and data["missing_in_a"] == ["test_new[a|b]"], f"Got {data}"
+        assert data["status_diffs"] == [{"test_name": "test_foo", "status_a": "passed", "status_b": "failed"}]
+        assert data["identical"] is False and data["duration_regressions_count"] is None, "Expected no duration mode"
+
+    def test_ndjson_summary_first(self, tmp_path: Path) -> None:
+        records = [json.loads(line) for line in self._compare(tmp_path, "ndjson").splitlines()]
+        types = [record["type"] for record in records]
+        assert types == ["summary", "missing_in_a", "missing_in_b", "status_diff"], f"Unexpected records: {types}"
+        assert records[0]["common_count"] == 1, "Expected the counts in the summary record"
+
+    def test_markdown_escapes_table_cells(self, tmp_path: Path) -> None:
+        markdown = self._compare(tmp_path, "markdown")
+        assert markdown.startswith("## Better-Report Comparison"), "Expected the markdown heading"
+        assert "| `test_foo` | passed | failed |" in markdown, f"Expected the status diffs table: {markdown}"
+        assert "`test_new[a\\|b]`" in markdown, "Expected the pipe escaped"
+
+    def test_structured_output_on_stdout(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        file_a = _write_report(tmp_path / "a.json", {"test_foo": "passed"})
+        compare_reports(file_a, file_a, timings=True, output_format="json")
+        captured = capsys.readouterr()
+        assert json.loads(captured.out)["identical"] is True, "Expected only the json on stdout"
+        assert "TIMINGS" in captured.err, "Expected the timings moved to stderr"
+
+
+class TestFindDurationRegressions:
+    @staticmethod
+    def _reports(durations_a: list[float], durations_b: list[float]) -> tuple[dict, dict, list[str]]:
+        names = [f"test_{index}" for index in range(len(durations_a))]
+        report_a = {
+            name: {"test_status": "passed", "test_duration_sec": duration_a}
+            for name, duration_a in zip(names, durations_a, strict=True)
+        }
+        report_b = {
+            name: {"test_status": "passed", "test_duration_sec": duration_b}
+            for name, duration_b in zip(names, durations_b, strict=True)
+        }
+        return report_a, report_b, names
+
+    def test_top_k_by_absolute_increase(self) -> None:
+        report_a, report_b, common = self._reports([1.0, 1.0, 10.0, 2.0], [3.0, 1.5, 15.0, 2.0])
+        count, top = find_duration_regressions(report_a, report_b, common, threshold_pct=10, top_k=2)
+        assert count == 3, f"Expected the three slower tests counted, got {count}"
+        assert [regression.test_name for regression in top] == ["test_2", "test_0"], "Expected largest increase first"
+
+    def test_both_thresholds_must_be_exceeded(self) -> None:
+        report_a, report_b, common = self._reports([0.01, 10.0], [0.1, 11.0])
+        count, top = find_duration_regressions(report_a, report_b, common, threshold_pct=50, threshold_sec=0.5)
+        assert count == 0 and not top, "Expected +900% of 0.09s and +1s of +10% both below a threshold"
+
+    def test_status_changes_and_missing_durations_skipped(self) -> None:
+        report_a, report_b, common = self._reports([1.0, 1.0], [5.0, 5.0])
+        report_b["test_0"]["test_status"] = "failed"
+        report_a["test_1"]["test_duration_sec"] = None
+        assert find_duration_regressions(report_a, report_b, common, threshold_sec=1) == (0, []), "Expected none"
+
+    def test_cached_pass_compared_as_pass(self) -> None:
+        report_a, report_b, common = self._reports([1.0], [5.0])
+        report_b["test_0"]["test_status"] = "cached-pass"
+        count, _ = find_duration_regressions(report_a, report_b, common, threshold_sec=1)
+        assert count == 1, f"Expected the regression of a cached pass kept, got {count}"
+
+
+class TestCompareRuns:
+    def test_flaky_test_reported(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        paths = [
+            _write_report(tmp_path / f"run_{index}.json", {"test_flaky": status, "test_stable": "passed"})
+            for index, status in enumerate(("passed", "failed", "passed"))
+        ]
+        assert not compare_runs(paths=paths), "Expected the flaky test to be found"
+        output = capsys.readouterr().out
+        assert "test_flaky" in output and "#2, #3" in output, f"Expected the flaky test and its runs: {output}"
+        assert "test_stable" not in output, "Expected only the flaky tests to be listed"
+
+    def test_stable_runs(self, tmp_path: Path) -> None:
+        paths = [_write_report(tmp_path / f"run_{index}.json", {"test_foo": "passed"}) for index in range(3)]
+        assert compare_runs(paths=paths), "Expected no flaky tests"
+
+
+class TestFindRunReports:
+    def test_finds_plain_and_compressed_results_ordered_by_path(self, tmp_path: Path) -> None:
+        for run in ("b", "a"):
+            (tmp_path / run / "results_output").mkdir(parents=True)
+        _write_report(tmp_path / "b" / "results_output" / "test_results.json", {"test_foo": "passed"})
+        _write_report(tmp_path / "a" / "results_output" / "test_results.json.xz", {"test_foo": "passed"}, True)
+        (tmp_path / "a" / "results_output" / "test_results.ndjson").write_text("")
+        paths = [path.relative_to(tmp_path).as_posix() for path in find_run_reports(tmp_path)]
+        assert paths == [
+            "a/results_output/test_results.json.xz",
+            "b/results_output/test_results.json",
+        ], f"Unexpected run reports: {paths}"
+
+
+class TestCompareTrees:
+    @staticmethod
+    def _write_tree(root: Path, shards: dict[str, dict[str, str]]) -> Path:
+        for shard, statuses in shards.items():
+            (root / shard / "results_output").mkdir(parents=True)
+            _write_report(root / shard / "results_output" / "test_results.json", statuses)
+        return root
+
+    def test_pairs_by_relative_directory(self, tmp_path: Path) -> None:
+        dir_a = self._write_tree(tmp_path / "a", {"shard_1": {}, "shard_2": {}})
+        dir_b = self._write_tree(tmp_path / "b", {"shard_2": {}, "shard_3": {}})
+        pairs, only_in_a, only_in_b = find_report_pairs(dir_a, dir_b)
+        assert list(pairs) == ["shard_2/results_output"], f"Unexpected pairs: {pairs}"
+        assert only_in_a == ["shard_1/results_output"] and only_in_b == ["shard_3/results_output"], "Expected unpaired"
+
+    def test_aggregated_summary(self, tmp_path: Path) -> None:
+        dir_a = self._write_tree(tmp_path / "a", {"shard_1": {"test_foo": "passed"}, "shard_2": {"test_bar": "passed"}})
+        dir_b = self._write_tree(tmp_path / "b", {"shard_1": {"test_foo": "passed"}, "shard_2": {"test_bar": "failed"}})
+        output = tmp_path / "compare.json"
+        assert not compare_trees(dir_a, dir_b, output_format="json", output=output), "Expected the differences found"
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert data["pairs_count"] == 2 and data["status_diffs_count"] == 1, f"Unexpected totals: {data}"
+        assert [pair["identical"] for pair in data["pairs"]] == [True, False], "Expected a result per pair"
+
+    def test_pairs_compared_in_processes(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(better_report_compare.os, "cpu_count", lambda: 2)
+        dir_a = self._write_tree(tmp_path / "a", {"shard_1": {"test_foo": "passed"}, "shard_2": {"test_bar": "passed"}})
+        dir_b = self._write_tree(tmp_path / "b", {"shard_1": {"test_foo": "failed"}, "shard_2": {"test_bar": "passed"}})
+        assert not compare_trees(dir_a, dir_b), "Expected the difference found by a worker process"
+
+    def test_identical_trees(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        dir_a = self._write_tree(tmp_path / "a", {"shard_1": {"test_foo": "passed"}})
+        dir_b = self._write_tree(tmp_path / "b", {"shard_1": {"test_foo": "passed"}})
+        assert compare_trees(dir_a, dir_b), "Expected identical trees"
+        assert "DIRECTORIES ARE IDENTICAL" in capsys.readouterr().out, "Expected the aggregated text summary"
+
+    def test_missing_report_is_a_difference(self, tmp_path: Path) -> None:
+        dir_a = self._write_tree(tmp_path / "a", {"shard_1": {"test_foo": "passed"}, "shard_2": {}})
+        dir_b = self._write_tree(tmp_path / "b", {"shard_1": {"test_foo": "passed"}})
+        assert not compare_trees(dir_a, dir_b), "Expected the report missing from dir B to be a difference"
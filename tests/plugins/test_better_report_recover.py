@@ -0,0 +1,133 @@
+import json
+import sys
+
+import pytest
+
+from pytest_plugins.better_report_recover import recover_report
+from pytest_plugins.const import CHECKPOINT_FILENAME, EXECUTION_RESULTS_FILENAME, TEST_RESULTS_FILENAME
+
+CRASHING_SUITE = """
+    import os
+
+    def test_first() -> None:
+        assert True
+
+    def test_second() -> None:
+        assert False
+
+    def test_crash() -> None:
+        os._exit(1)
+
+    def test_never_run() -> None:
+        assert True
+"""
+
+# the last test kills the xdist controller (the parent of the worker) once the other tests are done
+XDIST_CRASHING_SUITE = """
+    import os
+    import signal
+    import time
+
+    def test_first() -> None:
+        assert True
+
+    def test_second() -> None:
+        assert False
+
+    def test_third() -> None:
+        assert True
+
+    def test_kill_controller() -> None:
+        time.sleep(2)
+        os.kill(os.getppid(), signal.SIGKILL)
+"""
+
+
+class TestBetterReportRecover:
+    def test_checkpoint_survives_killed_process(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(CRASHING_SUITE)
+        pytester.runpytest_subprocess("--better-report", "--checkpoint-every-tests=1")
+        output_dir = pytester.path / "results_output"
+        assert (output_dir / CHECKPOINT_FILENAME).exists(), f"Expected {CHECKPOINT_FILENAME} to be created"
+        assert not (output_dir / EXECUTION_RESULTS_FILENAME).exists(), "Expected no final results after a crash"
+
+    def test_recover_rebuilds_report_from_checkpoint(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(CRASHING_SUITE)
+        pytester.runpytest_subprocess("--better-report", "--checkpoint-every-tests=1")
+        execution_results, test_results = recover_report(pytester.path / "results_output")
+        exec_info = execution_results["execution_info"]
+        assert exec_info["execution_status"] == "cancelled", f"Expected 'cancelled', got {exec_info}"
+        assert exec_info["execution_duration_sec"] is not None, "Expected duration up to the last checkpoint"
+        assert test_results["test_first"]["test_status"] == "passed", "Expected checkpointed passed status"
+        assert test_results["test_second"]["test_status"] == "failed", "Expected checkpointed failed status"
+        assert test_results["test_never_run"]["test_status"] == "collected", "Expected not-run test as collected"
+
+    def test_recover_merges_streamed_ndjson_results(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(CRASHING_SUITE)
+        pytester.runpytest_subprocess(
+            "--better-report", "--better-report-format=ndjson", "--checkpoint-every-seconds=3600"
+        )
+        execution_results, test_results = recover_report(pytester.path / "results_output")
+        assert execution_results["execution_info"]["execution_status"] == "cancelled", "Expected cancelled status"
+        assert test_results["test_first"]["test_status"] == "passed", "Expected streamed passed status"
+        assert test_results["test_second"]["test_status"] == "failed", "Expected streamed failed status"
+
+    def test_checkpoint_removed_after_completed_run(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(
+            """
+            def test_foo() -> None:
+                assert True
+        """
+        )
+        result = pytester.runpytest_subprocess("--better-report", "--checkpoint-every-tests=1")
+        assert result.ret == pytest.ExitCode.OK, f"Expected OK, got {result.ret}"
+        output_dir = pytester.path / "results_output"
+        assert (output_dir / EXECUTION_RESULTS_FILENAME).exists(), "Expected final results to be written"
+        assert not (output_dir / CHECKPOINT_FILENAME).exists(), "Expected checkpoint to be discarded"
+
+    def test_recover_command_writes_result_files(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(CRASHING_SUITE)
+        pytester.runpytest_subprocess("--better-report", "--checkpoint-every-tests=1")
+        output_dir = pytester.path / "results_output"
+        result = pytester.run(sys.executable, "-m", "pytest_plugins.better_report_recover", "-d", str(output_dir))
+        assert result.ret == 0, f"Expected recover command to succeed, got {result.ret}"
+        data = json.loads((output_dir / EXECUTION_RESULTS_FILENAME).read_text())
+        assert data["execution_info"]["execution_status"] == "cancelled", "Expected cancelled execution status"
+
+    @pytest.mark.parametrize("report_format", ["json", "ndjson"])
+    def test_recover_killed_xdist_run(self, pytester: pytest.Pytester, report_format: str) -> None:
+        pytester.makepyfile(XDIST_CRASHING_SUITE)
+        pytester.runpytest_subprocess(
+            "-n", "2", "--better-report", f"--better-report-format={report_format}", "--checkpoint-every-tests=1"
+        )
+        output_dir = pytester.path / "results_output"
+        assert not (output_dir / EXECUTION_RESULTS_FILENAME).exists(), "Expected no final results after a crash"
+        execution_results, test_results = recover_report(output_dir)
+        assert execution_results["execution_info"]["execution_status"] == "cancelled", "Expected cancelled status"
+        statuses = {name: test_data["test_status"] for name, test_data in test_results.items()}
+        expected = {"test_first": "passed", "test_second": "failed", "test_third": "passed"}
+        assert statuses == expected, f"Expected the tests finished before the kill, got {statuses}"
+
+    def test_xdist_checkpoints_into_output_dir(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(CRASHING_SUITE.replace("os._exit(1)", "pass"))
+        result = pytester.runpytest_subprocess(
+            "-n", "2", "--better-report", "--output-dir=out1", "--checkpoint-every-tests=2"
+        )
+        assert result.ret == pytest.ExitCode.TESTS_FAILED, f"Expected TESTS_FAILED, got {result.ret}"
+        test_results = json.loads((pytester.path / "out1" / "results_output" / TEST_RESULTS_FILENAME).read_text())
+        assert len(test_results) == 4, f"Expected every test in the report, got {list(test_results)}"
+
+    def test_recover_xdist_run_killed_before_any_test_finished(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(
+            """
+            import os
+            import signal
+
+            def test_kill_controller() -> None:
+                os.kill(os.getppid(), signal.SIGKILL)
+        """
+        )
+        pytester.runpytest_subprocess("-n", "2", "--better-report", "--output-dir=out1", "--checkpoint-every-tests=2")
+        execution_results, test_results = recover_report(pytester.path / "out1" / "results_output")
+        assert execution_results["execution_info"]["execution_status"] == "cancelled", "Expected cancelled status"
+        assert not test_results, f"Expected no finished test, got {test_results}"
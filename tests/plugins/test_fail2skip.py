@@ -101,3 +101,21 @@ class TestFail2Skip:
         assert result.ret == pytest.ExitCode.OK, f"Expected OK, got {result.ret}"
         # Plugin sets report.wasxfail which pytest counts as xfailed, not skipped
         result.assert_outcomes(xfailed=2, passed=1)
+
+    def test_plugin_unregistered_when_flag_is_off(self, pytester: pytest.Pytester) -> None:
+        pytester.makeconftest(
+            """
+            def pytest_sessionstart(session):
+                plugin = session.config.pluginmanager.get_plugin("fail2skip")
+                print(f"fail2skip registered: {plugin is not None}")
+        """
+        )
+        pytester.makepyfile(
+            """
+            def test_pass():
+                assert True
+        """
+        )
+        result = pytester.runpytest_subprocess("-s")
+        assert result.ret == pytest.ExitCode.OK, f"Expected OK, got {result.ret}"
+        result.stdout.fnmatch_lines(["*fail2skip registered: False*"])
@@ -0,0 +1,46 @@
+from collections.abc import Callable
+
+import pytest
+
+TESTS = """
+    def test_fast():
+        pass
+
+    def test_slow():
+        pass
+
+    def test_broken():
+        pass
+
+    def test_new():
+        pass
+"""
+
+
+HISTORY = {"test_fast": ("passed", 0.1), "test_slow": ("passed", 5.0), "test_broken": ("failed", 0.2)}
+
+
+class TestOrderByHistory:
+    def test_slowest_first(self, pytester: pytest.Pytester, write_history: Callable, passed_tests: Callable) -> None:
+        history = write_history(HISTORY, test_file=pytester.makepyfile(TESTS))
+        result = pytester.runpytest_subprocess("-v", f"--order-by-history={history}")
+        order = passed_tests(result)
+        assert order == ["test_slow", "test_new", "test_broken", "test_fast"], f"Unexpected order: {order}"
+
+    def test_failed_first(self, pytester: pytest.Pytester, write_history: Callable, passed_tests: Callable) -> None:
+        history = write_history(HISTORY, test_file=pytester.makepyfile(TESTS))
+        result = pytester.runpytest_subprocess(
+            "-v", f"--order-by-history={history}", "--order-by-history-mode=failed-first"
+        )
+        order = passed_tests(result)
+        assert order == ["test_broken", "test_slow", "test_new", "test_fast"], f"Unexpected order: {order}"
+
+    def test_missing_history_is_a_usage_error(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(TESTS)
+        result = pytester.runpytest_subprocess(f"--order-by-history={pytester.path / 'missing.json'}")
+        assert result.ret == pytest.ExitCode.USAGE_ERROR, f"Expected {pytest.ExitCode.USAGE_ERROR}, got {result.ret}"
+
+    def test_without_flag_keeps_collection_order(self, pytester: pytest.Pytester, passed_tests: Callable) -> None:
+        pytester.makepyfile(TESTS)
+        order = passed_tests(pytester.runpytest_subprocess("-v"))
+        assert order == ["test_fast", "test_slow", "test_broken", "test_new"], f"Unexpected order: {order}"
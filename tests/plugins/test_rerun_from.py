@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from pytest_plugins.const import TEST_RESULTS_FILENAME
+
+TESTS = """
+    import pytest
+
+    def test_ok():
+        pass
+
+    def test_broken():
+        assert False
+
+    @pytest.mark.parametrize("x", range(3))
+    def test_param(x):
+        assert x != 1
+"""
+
+
+class TestRerunFrom:
+    def test_runs_only_the_failed_tests(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(TESTS)
+        pytester.runpytest_subprocess("--better-report")
+        result = pytester.runpytest_subprocess("-v", "--rerun-from=results_output")
+        assert result.ret == pytest.ExitCode.TESTS_FAILED, f"Expected TESTS_FAILED, got {result.ret}"
+        result.stdout.fnmatch_lines(["*2 failed, 3 deselected*"])
+        ran = {line.split("::")[1].split()[0] for line in result.outlines if "FAILED" in line and "::" in line}
+        assert ran == {"test_broken", "test_param[1]"}, f"Expected only the previous failures, got {ran}"
+
+    def test_matches_by_pytest_test_name(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(TESTS)
+        results = {"renamed": {"test_status": "failed", "pytest_test_name": "test_param[2]"}}
+        (pytester.path / TEST_RESULTS_FILENAME).write_text(json.dumps(results), encoding="utf-8")
+        result = pytester.runpytest_subprocess(f"--rerun-from={TEST_RESULTS_FILENAME}")
+        result.stdout.fnmatch_lines(["*1 passed, 4 deselected*"])
+
+    def test_missing_results_is_a_usage_error(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(TESTS)
+        result = pytester.runpytest_subprocess("--rerun-from=missing.json")
+        assert result.ret == pytest.ExitCode.USAGE_ERROR, f"Expected {pytest.ExitCode.USAGE_ERROR}, got {result.ret}"
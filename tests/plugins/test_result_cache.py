@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from pytest_plugins.const import TEST_RESULTS_FILENAME
+
+TESTS = """
+    def test_ok(shared):
+        assert shared
+
+    def test_broken():
+        assert False
+"""
+CONFTEST = """
+    import pytest
+
+    @pytest.fixture
+    def shared():
+        return 1
+"""
+
+
+class TestResultCache:
+    def test_unchanged_passes_are_cached(self, pytester: pytest.Pytester) -> None:
+        pytester.makeconftest(CONFTEST)
+        pytester.makepyfile(TESTS)
+        pytester.runpytest_subprocess("--result-cache").assert_outcomes(passed=1, failed=1)
+        result = pytester.runpytest_subprocess("--better-report", "--result-cache")
+        result.assert_outcomes(skipped=1, failed=1)
+        data = json.loads((pytester.path / "results_output" / TEST_RESULTS_FILENAME).read_text())
+        assert data["test_ok"]["test_status"] == "cached-pass", f"Expected 'cached-pass', got {data['test_ok']}"
+        assert data["test_broken"]["test_status"] == "failed", "Expected the failed test to run again"
+
+    def test_changed_conftest_invalidates(self, pytester: pytest.Pytester) -> None:
+        pytester.makeconftest(CONFTEST)
+        pytester.makepyfile(TESTS)
+        pytester.runpytest_subprocess("--result-cache")
+        pytester.makeconftest(CONFTEST.replace("return 1", "return 2"))
+        pytester.runpytest_subprocess("--result-cache").assert_outcomes(passed=1, failed=1)
+
+    def test_refresh_runs_every_test(self, pytester: pytest.Pytester) -> None:
+        pytester.makeconftest(CONFTEST)
+        pytester.makepyfile(TESTS)
+        pytester.runpytest_subprocess("--result-cache")
+        pytester.runpytest_subprocess("--result-cache", "--result-cache-refresh").assert_outcomes(passed=1, failed=1)
+        pytester.runpytest_subprocess("--result-cache").assert_outcomes(skipped=1, failed=1)
+
+    def test_without_flag_runs_every_test(self, pytester: pytest.Pytester) -> None:
+        pytester.makeconftest(CONFTEST)
+        pytester.makepyfile(TESTS)
+        pytester.runpytest_subprocess("--result-cache")
+        pytester.runpytest_subprocess().assert_outcomes(passed=1, failed=1)
@@ -0,0 +1,64 @@
+import json
+from collections.abc import Callable
+
+import pytest
+
+from pytest_plugins.const import EXECUTION_RESULTS_FILENAME
+
+TESTS = """
+    import pytest
+
+    @pytest.mark.parametrize("index", range(6))
+    def test_foo(index: int) -> None:
+        pass
+"""
+
+
+HISTORY = {
+    f"test_foo[{{'index': {index}}}]": ("passed", duration)
+    for index, duration in enumerate([8.0, 7.0, 3.0, 3.0, 2.0, 1.0])
+}
+
+
+class TestShard:
+    def test_shards_split_all_tests_by_predicted_time(
+        self, pytester: pytest.Pytester, write_history: Callable, passed_tests: Callable
+    ) -> None:
+        history = write_history(HISTORY, test_file=pytester.makepyfile(TESTS))
+        shards = []
+        for index in range(2):
+            args = ("-v", "--shard-count=2", f"--shard-index={index}", f"--shard-history={history}")
+            shards.append(set(passed_tests(pytester.runpytest_subprocess(*args))))
+        assert not shards[0] & shards[1], f"Expected disjoint shards, got {shards}"
+        assert len(shards[0] | shards[1]) == 6, f"Expected every test in a shard, got {shards}"
+        assert shards[0] == {"test_foo[0]", "test_foo[3]", "test_foo[5]"}, f"Expected 8 + 3 + 1 in shard 0: {shards}"
+
+    def test_plan_recorded_in_execution_results(self, pytester: pytest.Pytester, write_history: Callable) -> None:
+        history = write_history(HISTORY, test_file=pytester.makepyfile(TESTS))
+        result = pytester.runpytest_subprocess(
+            "--better-report", "--shard-count=2", "--shard-index=1", f"--shard-history={history}"
+        )
+        assert result.ret == pytest.ExitCode.OK, f"Expected OK, got {result.ret}"
+        result.stdout.fnmatch_lines(["*3 passed, 3 deselected*"])
+        exec_info = json.loads((pytester.path / "results_output" / EXECUTION_RESULTS_FILENAME).read_text())[
+            "execution_info"
+        ]
+        plan = exec_info["shard_plan"]
+        assert plan["shard_predicted_duration_sec"] == [12.0, 12.0], f"Unexpected predictions: {plan}"
+        assert plan["shard_test_counts"] == [3, 3], f"Unexpected test counts: {plan}"
+        assert plan["predicted_duration_sec"] == 12.0 and plan["tests_with_history"] == 6, f"Unexpected plan: {plan}"
+        assert plan["actual_duration_sec"] is not None, "Expected the actual duration of the shard"
+
+    def test_without_history_splits_by_count(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(TESTS)
+        result = pytester.runpytest_subprocess("--shard-count=4", "--shard-index=3")
+        result.stdout.fnmatch_lines(["*1 passed, 5 deselected*"])
+
+    @pytest.mark.parametrize(
+        "args",
+        [("--shard-count=2",), ("--shard-count=2", "--shard-index=2"), ("--shard-count=0", "--shard-index=0")],
+    )
+    def test_invalid_options_are_usage_errors(self, pytester: pytest.Pytester, args: tuple[str, ...]) -> None:
+        pytester.makepyfile(TESTS)
+        result = pytester.runpytest_subprocess(*args)
+        assert result.ret == pytest.ExitCode.USAGE_ERROR, f"Expected {pytest.ExitCode.USAGE_ERROR}, got {result.ret}"
@@ -1,5 +1,9 @@
+import json
+
 import pytest
 
+from pytest_plugins.const import TEST_RESULTS_FILENAME
+
 
 class TestVerboseParamIds:
     def test_node_ids_contain_param_dict_with_flag(self, pytester: pytest.Pytester) -> None:
@@ -57,3 +61,19 @@ class TestVerboseParamIds:
         result = pytester.runpytest_subprocess("--verbose-param-ids")
         assert result.ret == pytest.ExitCode.OK, f"Expected OK, got {result.ret}"
         result.assert_outcomes(passed=2)
+
+    def test_report_uses_the_rewritten_node_ids(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile(
+            """
+            import pytest
+
+            @pytest.mark.parametrize("x", [1])
+            def test_foo(x: int) -> None:
+                assert x > 0
+        """
+        )
+        result = pytester.runpytest_subprocess("--verbose-param-ids", "--better-report")
+        assert result.ret == pytest.ExitCode.OK, f"Expected OK, got {result.ret}"
+        data = json.loads((pytester.path / "results_output" / TEST_RESULTS_FILENAME).read_text())
+        test_data = data["test_foo[{'x': 1}]"]
+        assert test_data["pytest_test_name"] == "test_foo['x': 1]", f"Expected the rewritten id, got {test_data}"
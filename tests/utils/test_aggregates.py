@@ -0,0 +1,57 @@
+from pytest_plugins.models import ExecutionStatus
+from pytest_plugins.utils.aggregates import ResultAggregates
+
+
+def _add(
+    aggregates: ResultAggregates,
+    name: str,
+    status: str = ExecutionStatus.PASSED,
+    duration: float = 1.0,
+    file_name: str = "test_a.py",
+    class_name: str | None = "TestA",
+) -> None:
+    aggregates.add_result(
+        test_full_name=name,
+        test_file_name=file_name,
+        class_test_name=class_name,
+        test_status=status,
+        test_duration_sec=duration,
+    )
+
+
+class TestResultAggregates:
+    def test_file_and_class_totals(self) -> None:
+        aggregates = ResultAggregates()
+        _add(aggregates, "test_1", duration=1.0)
+        _add(aggregates, "test_2", status=ExecutionStatus.FAILED, duration=3.0)
+        _add(aggregates, "test_3", status=ExecutionStatus.SKIPPED, duration=0.5, class_name=None)
+        file_data = aggregates.files["test_a.py"]
+        assert (file_data.test_count, file_data.passed_count, file_data.failed_count, file_data.skipped_count) == (
+            3,
+            1,
+            1,
+            1,
+        ), f"Unexpected file counts: {file_data}"
+        assert file_data.total_duration_sec == 4.5 and file_data.max_duration_sec == 3.0, "Unexpected file durations"
+        assert aggregates.classes["test_a.py::TestA"].test_count == 2, "Expected only the class tests in the class"
+
+    def test_rerun_replaces_previous_run(self) -> None:
+        aggregates = ResultAggregates()
+        _add(aggregates, "test_1", status=ExecutionStatus.FAILED, duration=2.0)
+        _add(aggregates, "test_1", status=ExecutionStatus.PASSED, duration=1.0)
+        file_data = aggregates.files["test_a.py"]
+        assert (file_data.test_count, file_data.passed_count, file_data.failed_count) == (1, 1, 0), f"{file_data}"
+        assert file_data.total_duration_sec == 1.0, "Expected the duration of the last run only"
+
+    def test_total_duration_across_files(self) -> None:
+        aggregates = ResultAggregates()
+        _add(aggregates, "test_1", duration=1.5, file_name="test_a.py")
+        _add(aggregates, "test_2", duration=2.5, file_name="test_b.py", class_name=None)
+        assert aggregates.get_total_duration_sec() == 4.0, "Expected the durations of every file summed"
+
+    def test_slowest_first(self) -> None:
+        aggregates = ResultAggregates()
+        _add(aggregates, "test_1", duration=1.0, file_name="test_fast.py")
+        _add(aggregates, "test_2", duration=5.0, file_name="test_slow.py")
+        assert [group.name for group in aggregates.get_files()] == ["test_slow.py", "test_fast.py"], "Expected slowest"
+        assert list(aggregates.to_dict()["files"]) == ["test_slow.py", "test_fast.py"], "Expected slowest first"
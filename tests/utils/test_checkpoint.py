@@ -0,0 +1,60 @@
+from pathlib import Path
+
+from pytest_plugins.utils.checkpoint import Checkpointer, load_checkpoint, load_records
+
+
+class TestCheckpointer:
+    def test_saves_every_n_tests(self, tmp_path: Path) -> None:
+        checkpointer = Checkpointer(path=tmp_path / "checkpoint.json", every_tests=2)
+        saved = [checkpointer.tick() for _ in range(4)]
+        assert saved == [False, True, False, True], f"Expected a checkpoint every 2 tests, got {saved}"
+
+    def test_saves_when_interval_elapsed(self, tmp_path: Path) -> None:
+        checkpointer = Checkpointer(path=tmp_path / "checkpoint.json", every_seconds=0.0001)
+        checkpointer.last_checkpoint_time -= 1
+        assert checkpointer.tick(), "Expected a checkpoint once the interval elapsed"
+
+    def test_save_contains_state_and_time(self, tmp_path: Path) -> None:
+        checkpointer = Checkpointer(path=tmp_path / "checkpoint.json", every_tests=1)
+        checkpointer.save(state={"test_results": {"a": 1}})
+        data = load_checkpoint(tmp_path / "checkpoint.json")
+        assert data["test_results"] == {"a": 1}, "Expected the saved state"
+        assert data["checkpoint_time"], "Expected the checkpoint time"
+
+    def test_journal_appends_only_the_records_since_last_checkpoint(self, tmp_path: Path) -> None:
+        checkpointer = Checkpointer(path=tmp_path / "checkpoint.json", every_tests=2)
+        checkpointer.save(state={})
+        for name in ["a", "b", "c", "a"]:
+            checkpointer.tick(record={"test_full_name": name, "run": name})
+        lines = checkpointer.journal_path.read_text().splitlines()
+        assert len(lines) == 4, f"Expected each record journaled once, got {lines}"
+        assert list(load_records(checkpointer.journal_path)) == ["a", "b", "c"], "Expected the records by name"
+
+    def test_records_not_written_when_not_due(self, tmp_path: Path) -> None:
+        checkpointer = Checkpointer(path=tmp_path / "checkpoint.json", every_tests=10)
+        assert not checkpointer.tick(record={"test_full_name": "a"}), "Expected no checkpoint before N tests"
+        assert not checkpointer.journal_path.exists(), "Expected the record kept until the next checkpoint"
+
+    def test_save_starts_a_new_journal(self, tmp_path: Path) -> None:
+        checkpointer = Checkpointer(path=tmp_path / "checkpoint.json", every_tests=1)
+        checkpointer.tick(record={"test_full_name": "a"})
+        checkpointer.save(state={})
+        assert not load_records(checkpointer.journal_path), "Expected the journal reset by a full save"
+
+    def test_first_checkpoint_saves_the_whole_state(self, tmp_path: Path) -> None:
+        checkpointer = Checkpointer(
+            path=tmp_path / "checkpoint.json", every_tests=1, state=lambda: {"test_results": {"a": 1}}
+        )
+        checkpointer.tick(record={"test_full_name": "a"})
+        assert load_checkpoint(tmp_path / "checkpoint.json")["test_results"] == {"a": 1}, "Expected the base state"
+        assert not checkpointer.journal_path.exists(), "Expected the record covered by the base state"
+        checkpointer.tick(record={"test_full_name": "b"})
+        assert list(load_records(checkpointer.journal_path)) == ["b"], "Expected the next records journaled"
+
+    def test_discard_removes_file(self, tmp_path: Path) -> None:
+        checkpointer = Checkpointer(path=tmp_path / "checkpoint.json", every_tests=1)
+        checkpointer.save(state={})
+        checkpointer.tick(record={"test_full_name": "a"})
+        checkpointer.discard()
+        assert not (tmp_path / "checkpoint.json").exists(), "Expected checkpoint file to be removed"
+        assert not checkpointer.journal_path.exists(), "Expected the journal to be removed"
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pytest
+
+from pytest_plugins.utils.compression import (
+    COMPRESSIONS,
+    compressed_path,
+    open_for_read,
+    open_for_write,
+    resolve_compressed_path,
+)
+
+
+class TestCompressedPath:
+    def test_no_compression_keeps_path(self) -> None:
+        assert compressed_path(path=Path("a.json"), compression=None) == Path("a.json"), "Expected the same path"
+
+    @pytest.mark.parametrize("compression, suffix", [("gzip", ".gz"), ("lzma", ".xz"), ("bz2", ".bz2")])
+    def test_adds_suffix(self, compression: str, suffix: str) -> None:
+        result = compressed_path(path=Path("a.json"), compression=compression)
+        assert result == Path(f"a.json{suffix}"), f"Expected the {suffix} suffix, got {result}"
+
+
+class TestResolveCompressedPath:
+    def test_existing_plain_file(self, tmp_path: Path) -> None:
+        (tmp_path / "a.json").write_text("{}")
+        assert resolve_compressed_path(tmp_path / "a.json") == tmp_path / "a.json", "Expected the plain file"
+
+    def test_falls_back_to_compressed_file(self, tmp_path: Path) -> None:
+        (tmp_path / "a.json.xz").write_bytes(b"")
+        assert resolve_compressed_path(tmp_path / "a.json") == tmp_path / "a.json.xz", "Expected the .xz file"
+
+
+class TestOpenForRead:
+    @pytest.mark.parametrize("compression", [None, *COMPRESSIONS])
+    def test_detects_compression_from_magic_bytes(self, tmp_path: Path, compression: str | None) -> None:
+        path = tmp_path / "no_suffix_on_purpose.json"
+        with open_for_write(path=path, compression=compression) as file:
+            file.write('{"a": 1}')
+        with open_for_read(path) as file:
+            assert file.read() == '{"a": 1}', f"Expected the decompressed content ({compression})"
@@ -1,3 +1,5 @@
+from pytest_plugins.models import ExecutionStatus, TestData
+from pytest_plugins.utils.aggregates import ResultAggregates
 from pytest_plugins.utils.create_report import generate_md_report
 
 
@@ -15,6 +17,20 @@ def _make_test_entry(
     }
 
 
+def _make_fixture_entry(fixture_name: str = "my_fixture", total_sec: float = 1.0) -> dict:
+    return {
+        "fixture_name": fixture_name,
+        "scope": "session",
+        "setup_count": 1,
+        "cache_hits": 9,
+        "total_sec": total_sec,
+        "setup_p50_sec": total_sec,
+        "setup_p95_sec": total_sec,
+        "teardown_p50_sec": None,
+        "teardown_p95_sec": None,
+    }
+
+
 class TestGenerateMdReport:
     def test_report_contains_header(self) -> None:
         result = generate_md_report(report={"t": _make_test_entry()})
@@ -22,7 +38,9 @@ class TestGenerateMdReport:
 
     def test_report_contains_table_headers(self) -> None:
         result = generate_md_report(report={"t": _make_test_entry()})
-        assert "| No. | Test Name | Status | Duration | Message |" in result, "Expected table headers row"
+        assert (
+            "| No. | Test Name | Status | Duration | Setup | Call | Teardown | Message |" in result
+        ), "Expected table headers row"
 
     def test_passed_test_shows_checkmark_icon(self) -> None:
         result = generate_md_report(report={"t": _make_test_entry(test_status="passed")})
@@ -63,6 +81,19 @@ class TestGenerateMdReport:
         result = generate_md_report(report={"t": _make_test_entry(test_duration_sec=1.5)})
         assert "1.50s" in result, "Expected duration formatted to 2 decimal places"
 
+    def test_phase_durations_shown_in_row(self) -> None:
+        entry = _make_test_entry(test_duration_sec=1.5) | {
+            "setup_duration_sec": 1.0,
+            "call_duration_sec": 0.25,
+            "teardown_duration_sec": 0.25,
+        }
+        result = generate_md_report(report={"t": entry})
+        assert "| 1.50s | 1.00s | 0.25s | 0.25s |" in result, "Expected the setup / call / teardown durations"
+
+    def test_missing_phase_durations_show_dash_placeholder(self) -> None:
+        result = generate_md_report(report={"t": _make_test_entry(test_duration_sec=1.5)})
+        assert "| 1.50s | - | - | - |" in result, "Expected dash placeholders for reports without phase durations"
+
     def test_summary_shows_correct_total_count(self) -> None:
         report = {
             "t1": _make_test_entry("test_1"),
@@ -90,3 +121,74 @@ class TestGenerateMdReport:
         assert "test_beta" in result, "Expected test_beta in report"
         assert "✅" in result, "Expected passed icon"
         assert "❌" in result, "Expected failed icon"
+
+    def test_no_slowest_fixtures_table_without_fixture_results(self) -> None:
+        result = generate_md_report(report={"t": _make_test_entry()})
+        assert "Slowest Fixtures" not in result, "Expected no slowest fixtures table"
+
+    def test_slowest_fixtures_table_sorted_by_total(self) -> None:
+        fixture_results = {
+            "fast": _make_fixture_entry(fixture_name="fast", total_sec=0.5),
+            "slow": _make_fixture_entry(fixture_name="slow", total_sec=3.0),
+        }
+        result = generate_md_report(report={"t": _make_test_entry()}, fixture_results=fixture_results)
+        assert "Slowest Fixtures" in result, "Expected slowest fixtures table"
+        assert result.index("`slow`") < result.index("`fast`"), "Expected the slowest fixture first"
+        assert "| `slow` | session | 1 | 9 | 3.00s |" in result, "Expected the fixture row"
+
+    def test_max_rows_lists_failures_then_slowest(self) -> None:
+        report = {
+            "t1": _make_test_entry("test_fast", test_duration_sec=0.1),
+            "t2": _make_test_entry("test_slow", test_duration_sec=5.0),
+            "t3": _make_test_entry("test_failed", test_status="failed", test_duration_sec=0.2),
+            "t4": _make_test_entry("test_medium", test_duration_sec=1.0),
+        }
+        result = generate_md_report(report=report, max_rows=2)
+        assert result.index("|3| `test_failed`") < result.index("|2| `test_slow`"), "Expected the failure first"
+        assert "test_fast" not in result and "test_medium" not in result, "Expected the table truncated to 2 rows"
+        assert "Showing 2 of 4 tests" in result and "Total: 4" in result, "Expected the summary of all tests"
+
+    def test_no_truncation_note_when_rows_fit(self) -> None:
+        result = generate_md_report(report={"t": _make_test_entry()}, max_rows=5)
+        assert "Showing" not in result, "Expected no truncation note"
+
+    def test_collapsed_per_file_and_per_class_summary(self) -> None:
+        report = {
+            "t1": _make_test_entry("test_1") | {"test_file_name": "test_b.py", "class_test_name": "TestB"},
+            "t2": _make_test_entry("test_2", test_status="failed") | {"test_file_name": "test_a.py"},
+            "t3": _make_test_entry("test_3") | {"test_file_name": "test_b.py"},
+        }
+        result = generate_md_report(report=report)
+        assert "<summary>📁 Per-file summary (2 files, slowest first)</summary>" in result, "Expected per-file summary"
+        assert result.index("| `test_b.py` | 2 | 2 | 0 | 0 | 2.00s | 1.00s |") < result.index(
+            "| `test_a.py` | 1 | 0 | 1 | 0 | 1.00s | 1.00s |"
+        ), f"Expected the slowest file first: {result}"
+        assert "| `test_b.py::TestB` | 1 | 1 | 0 | 0 |" in result, "Expected the per-class summary"
+
+    def test_given_aggregates_used(self) -> None:
+        aggregates = ResultAggregates()
+        aggregates.add_result("test_x", "test_x.py", None, "passed", 9.0)
+        result = generate_md_report(
+            report={"t": _make_test_entry() | {"test_file_name": "test_a.py"}}, aggregates=aggregates
+        )
+        assert "`test_x.py`" in result and "`test_a.py`" not in result, "Expected the given aggregates"
+
+    def test_test_data_used_without_serializing(self) -> None:
+        test_data = TestData(
+            test_file_name="test_a.py",
+            class_test_name=None,
+            test_name="test_foo",
+            pytest_test_name="test_foo",
+            test_full_name="test_a.py::test_foo",
+            test_full_path="tests/test_a.py::test_foo",
+            test_status=ExecutionStatus.FAILED,
+            test_duration_sec=2.5,
+            exception_message={"message": "boom"},
+        )
+        result = generate_md_report(report={"test_a.py::test_foo": test_data})
+        assert "|1| `test_a.py::test_foo` | ❌ failed | 2.50s |" in result, f"Expected the TestData row: {result}"
+        assert "`boom`" in result and "❌ Failed: 1" in result, "Expected the message and the failed count"
+
+    def test_iterable_of_results(self) -> None:
+        result = generate_md_report(report=iter([_make_test_entry("test_1"), _make_test_entry("test_2")]))
+        assert "Total: 2" in result and "test_2" in result, "Expected the results streamed from an iterable"
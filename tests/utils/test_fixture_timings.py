@@ -0,0 +1,67 @@
+from unittest.mock import MagicMock
+
+from pytest_plugins.utils.fixture_timings import FixtureTimings, percentile
+
+
+class TestPercentile:
+    def test_empty_values(self) -> None:
+        assert percentile(values=[], percent=50) is None, "Expected None without values"
+
+    def test_single_value(self) -> None:
+        assert percentile(values=[2.0], percent=95) == 2.0, "Expected the only value"
+
+    def test_nearest_rank(self) -> None:
+        values = [float(v) for v in range(100, 0, -1)]
+        assert percentile(values=values, percent=50) == 50.0, "Expected the median by nearest rank"
+        assert percentile(values=values, percent=95) == 95.0, "Expected the p95 by nearest rank"
+
+
+class TestFixtureTimings:
+    def test_setup_and_teardown_recorded(self) -> None:
+        fixture_timings = FixtureTimings()
+        fixturedef = MagicMock(argname="my_fixture", scope="module")
+        finalizers = []
+        fixturedef.addfinalizer.side_effect = finalizers.append
+
+        hook = fixture_timings.pytest_fixture_setup(fixturedef=fixturedef, request=MagicMock())
+        next(hook)
+        next(hook, None)
+        finalizers[0]()
+        fixture_timings.pytest_fixture_post_finalizer(fixturedef=fixturedef, request=MagicMock())
+
+        fixture = fixture_timings.get_fixture_results()["my_fixture"]
+        assert fixture.scope == "module", f"Expected the fixture scope, got {fixture}"
+        assert fixture.setup_count == 1, f"Expected one setup, got {fixture}"
+        assert fixture.teardown_count == 1, f"Expected one teardown, got {fixture}"
+
+    def test_cache_hits_are_uses_without_setup(self) -> None:
+        fixture_timings = FixtureTimings()
+        for _ in range(3):
+            fixture_timings.pytest_runtest_setup(item=MagicMock(fixturenames=["my_fixture", "request"]))
+        fixture_timings.merge(
+            data={
+                "scopes": {"my_fixture": "session"},
+                "uses": {},
+                "setup_durations": {"my_fixture": [1.0]},
+                "teardown_durations": {},
+            }
+        )
+        fixture = fixture_timings.get_fixture_results()["my_fixture"]
+        assert fixture.cache_hits == 2, f"Expected 2 cache hits, got {fixture}"
+        assert "request" not in fixture_timings.get_fixture_results(), "Expected only fixtures that were set up"
+
+    def test_merge_combines_worker_timings(self) -> None:
+        fixture_timings = FixtureTimings()
+        worker_data = {
+            "scopes": {"my_fixture": "function"},
+            "uses": {"my_fixture": 2},
+            "setup_durations": {"my_fixture": [1.0, 3.0]},
+            "teardown_durations": {"my_fixture": [0.5, 0.5]},
+        }
+        fixture_timings.merge(data=worker_data)
+        fixture_timings.merge(data=worker_data)
+        fixture = fixture_timings.get_fixture_results()["my_fixture"]
+        assert fixture.setup_count == 4, f"Expected the setups of both workers, got {fixture}"
+        assert fixture.setup_total_sec == 8.0, f"Expected the summed setup time, got {fixture}"
+        assert fixture.total_sec == 10.0, f"Expected setup + teardown total, got {fixture}"
+        assert fixture.cache_hits == 0, f"Expected no cache hits, got {fixture}"
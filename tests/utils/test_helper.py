@@ -1,8 +1,15 @@
 import json
 from pathlib import Path
 
-from pytest_plugins.models import ExecutionStatus
-from pytest_plugins.utils.helper import get_project_root, open_json, save_as_json, save_as_markdown
+from pytest_plugins.models import ExecutionData, ExecutionStatus
+from pytest_plugins.utils.helper import (
+    dataclass_to_dict,
+    get_project_root,
+    open_json,
+    save_as_json,
+    save_as_markdown,
+    serialize_data,
+)
 
 
 class TestGetProjectRoot:
@@ -73,6 +80,19 @@ class TestSaveAsJson:
         result = json.loads(output_file.read_text())
         assert result == {"second": True}, "Expected file to be overwritten"
 
+    def test_atomic_write_leaves_no_temp_file(self, tmp_path: Path) -> None:
+        output_file = tmp_path / "output.json"
+        save_as_json(path=output_file, data={"first": True}, atomic=True)
+        save_as_json(path=output_file, data={"second": True}, atomic=True)
+        assert json.loads(output_file.read_text()) == {"second": True}, "Expected file to be replaced"
+        assert [p.name for p in tmp_path.iterdir()] == ["output.json"], "Expected no leftover temp file"
+
+    def test_compressed_write_adds_suffix_and_round_trips(self, tmp_path: Path) -> None:
+        written = save_as_json(path=tmp_path / "data.json", data={"key": "value"}, compression="gzip", atomic=True)
+        assert written == tmp_path / "data.json.gz", f"Expected the .gz suffix, got {written}"
+        assert not (tmp_path / "data.json.gz.tmp").exists(), "Expected the temp file to be renamed"
+        assert open_json(written) == {"key": "value"}, "Expected open_json to read the compressed file"
+
 
 class TestSaveAsMarkdown:
     def test_creates_file_with_correct_content(self, tmp_path: Path) -> None:
@@ -92,3 +112,21 @@ class TestSaveAsMarkdown:
         save_as_markdown(path=output_file, data="")
         assert output_file.exists(), "Expected file to be created"
         assert output_file.read_text() == "", "Expected empty file content"
+
+    def test_writes_streamed_chunks(self, tmp_path: Path) -> None:
+        output_file = tmp_path / "report.md"
+        save_as_markdown(path=output_file, data=(chunk for chunk in ("# Title", "\n", "row")))
+        assert output_file.read_text() == "# Title\nrow", "Expected the chunks written in order"
+
+
+class TestSerializeData:
+    def test_slotted_dataclass_to_dict(self) -> None:
+        data = ExecutionData(execution_status=ExecutionStatus.PASSED, revision="rev")
+        result = dataclass_to_dict(data)
+        assert result["execution_status"] == ExecutionStatus.PASSED, "Expected the status field"
+        assert result["revision"] == "rev", "Expected the revision field"
+
+    def test_serializes_slotted_dataclass_in_json(self) -> None:
+        data = {"info": ExecutionData(execution_status=ExecutionStatus.PASSED, revision="rev")}
+        result = json.loads(json.dumps(data, default=serialize_data))
+        assert result["info"]["execution_status"] == "passed", f"Expected 'passed', got {result}"
@@ -0,0 +1,107 @@
+import gzip
+import json
+from pathlib import Path
+
+from pytest_plugins.models import ExecutionStatus, HistoryRecord
+from pytest_plugins.utils.history import (
+    DEFAULT_PREDICTED_DURATION_SEC,
+    FAILED_FIRST,
+    SLOWEST_FIRST,
+    history_sort_key,
+    load_failed_tests,
+    load_history_index,
+    mean_duration,
+    predict_durations,
+    resolve_history_path,
+)
+from pytest_plugins.utils.history_store import HISTORY_STORE_FILENAME, HistoryStore
+
+RESULTS = {
+    "test_fast": {"test_status": ExecutionStatus.PASSED, "test_duration_sec": 0.1},
+    "test_slow": {"test_status": ExecutionStatus.PASSED, "test_duration_sec": 5.0},
+    "test_broken": {"test_status": ExecutionStatus.FAILED, "test_duration_sec": 0.2},
+    "test_unfinished": {"test_status": ExecutionStatus.COLLECTED, "test_duration_sec": None},
+}
+
+
+class TestLoadHistoryIndex:
+    def test_indexes_duration_and_failure_by_full_name(self, tmp_path: Path) -> None:
+        path = tmp_path / "test_results.json"
+        path.write_text(json.dumps(RESULTS), encoding="utf-8")
+        index = load_history_index(path=path)
+        assert index["test_slow"] == HistoryRecord(duration_sec=5.0, failed=False), f"Unexpected: {index['test_slow']}"
+        assert index["test_broken"].failed, "Expected the failed test to be marked as failed"
+        assert index["test_unfinished"].duration_sec is None, "Expected no duration for an unfinished test"
+
+    def test_indexes_by_full_path_when_recorded(self, tmp_path: Path) -> None:
+        results = {
+            "test_foo": {"test_full_path": "test_a.py::test_foo", "test_status": "passed", "test_duration_sec": 2}
+        }
+        path = tmp_path / "test_results.json"
+        path.write_text(json.dumps(results), encoding="utf-8")
+        assert list(load_history_index(path=path)) == ["test_a.py::test_foo"], "Expected the index by test_full_path"
+
+    def test_reads_compressed_results_from_output_dir(self, tmp_path: Path) -> None:
+        with gzip.open(tmp_path / "test_results.json.gz", "wt", encoding="utf-8") as f:
+            json.dump(RESULTS, f)
+        path = resolve_history_path(path=tmp_path, results_filename="test_results.json")
+        assert path.name == "test_results.json.gz", f"Expected the compressed file, got {path}"
+        assert len(load_history_index(path=path)) == len(RESULTS), "Expected every test in the index"
+
+    def test_prefers_the_history_store_of_the_output_dir(self, tmp_path: Path) -> None:
+        (tmp_path / "test_results.json").write_text(json.dumps(RESULTS), encoding="utf-8")
+        with HistoryStore(path=tmp_path / HISTORY_STORE_FILENAME) as store:
+            store.update([("test_slow", ExecutionStatus.FAILED, 4.0)])
+        path = resolve_history_path(path=tmp_path, results_filename="test_results.json")
+        assert path.name == HISTORY_STORE_FILENAME, f"Expected the history store, got {path}"
+        assert load_history_index(path=path) == {
+            "test_slow": HistoryRecord(duration_sec=4.0, failed=True)
+        }, "Expected the index of the store"
+
+    def test_load_failed_tests_by_both_names(self, tmp_path: Path) -> None:
+        results = {
+            **RESULTS,
+            "test_x[{'x': 1}]": {"test_status": ExecutionStatus.FAILED_SKIPPED, "pytest_test_name": "test_x[1]"},
+        }
+        path = tmp_path / "test_results.json"
+        path.write_text(json.dumps(results), encoding="utf-8")
+        failed = load_failed_tests(path=path)
+        assert failed == {"test_broken", "test_x[{'x': 1}]", "test_x[1]"}, f"Unexpected failed tests: {failed}"
+
+    def test_load_failed_tests_from_history_store(self, tmp_path: Path) -> None:
+        path = tmp_path / HISTORY_STORE_FILENAME
+        with HistoryStore(path=path) as store:
+            store.update([("test_fixed", ExecutionStatus.FAILED, 1.0), ("test_broken", ExecutionStatus.PASSED, 1.0)])
+            store.update([("test_fixed", ExecutionStatus.PASSED, 1.0), ("test_broken", ExecutionStatus.FAILED, 1.0)])
+        assert load_failed_tests(path=path) == {"test_broken"}, "Expected only the tests whose last run failed"
+
+
+class TestHistorySortKey:
+    index = {
+        "test_fast": HistoryRecord(duration_sec=0.1),
+        "test_slow": HistoryRecord(duration_sec=5.0),
+        "test_broken": HistoryRecord(duration_sec=0.2, failed=True),
+    }
+
+    def test_slowest_first_with_new_tests_at_the_mean(self) -> None:
+        names = ["test_fast", "test_new", "test_broken", "test_slow"]
+        ordered = sorted(names, key=history_sort_key(index=self.index, mode=SLOWEST_FIRST))
+        assert ordered == ["test_slow", "test_new", "test_broken", "test_fast"], f"Unexpected order: {ordered}"
+
+    def test_failed_first(self) -> None:
+        names = ["test_fast", "test_new", "test_slow", "test_broken"]
+        ordered = sorted(names, key=history_sort_key(index=self.index, mode=FAILED_FIRST))
+        assert ordered == ["test_broken", "test_slow", "test_new", "test_fast"], f"Unexpected order: {ordered}"
+
+    def test_mean_duration_ignores_unknown_durations(self) -> None:
+        index = {"a": HistoryRecord(duration_sec=1.0), "b": HistoryRecord(duration_sec=3.0), "c": HistoryRecord()}
+        assert mean_duration(index) == 2.0, "Expected the mean of the recorded durations"
+        assert mean_duration({}) == 0.0, "Expected zero without history"
+
+    def test_predict_durations_fall_back_to_the_mean(self) -> None:
+        names = ["test_slow", "test_new"]
+        expected = [5.0, mean_duration(self.index)]
+        assert predict_durations(index=self.index, test_full_paths=names) == expected, "Expected the mean for new tests"
+        assert (
+            predict_durations(index={}, test_full_paths=names) == [DEFAULT_PREDICTED_DURATION_SEC] * 2
+        ), "Expected the default duration without history"
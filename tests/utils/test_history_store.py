@@ -0,0 +1,89 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from pytest_plugins.models import ExecutionStatus
+from pytest_plugins.utils.history_store import HistoryStore, is_history_store
+
+
+class TestHistoryStore:
+    def test_first_run_sets_the_average(self, tmp_path: Path) -> None:
+        with HistoryStore(path=tmp_path / "history.sqlite3") as store:
+            store.update([("test_foo", ExecutionStatus.PASSED, 2.0)])
+            entry = store.get("test_foo")
+        assert entry.run_count == 1 and entry.ewma_duration_sec == 2.0, f"Unexpected entry: {entry}"
+        assert entry.ewma_variance == 0.0 and entry.last_statuses == ["passed"], f"Unexpected entry: {entry}"
+
+    def test_ewma_and_variance(self, tmp_path: Path) -> None:
+        durations = [2.0, 4.0, 3.0, 10.0]
+        with HistoryStore(path=tmp_path / "history.sqlite3", alpha=0.5) as store:
+            for duration in durations:
+                store.update([("test_foo", ExecutionStatus.PASSED, duration)])
+            entry = store.get("test_foo")
+        mean, variance = durations[0], 0.0
+        for duration in durations[1:]:
+            diff = duration - mean
+            mean += 0.5 * diff
+            variance = 0.5 * (variance + 0.5 * diff * diff)
+        assert entry.ewma_duration_sec == pytest.approx(mean), f"Expected {mean}, got {entry.ewma_duration_sec}"
+        assert entry.ewma_variance == pytest.approx(variance), f"Expected {variance}, got {entry.ewma_variance}"
+        assert entry.run_count == 4, f"Expected 4 runs, got {entry.run_count}"
+
+    def test_skipped_runs_keep_the_average(self, tmp_path: Path) -> None:
+        with HistoryStore(path=tmp_path / "history.sqlite3") as store:
+            store.update([("test_foo", ExecutionStatus.FAILED, 2.0)])
+            store.update([("test_foo", ExecutionStatus.SKIPPED, 0.0)])
+            entry = store.get("test_foo")
+        assert entry.ewma_duration_sec == 2.0, f"Expected the skipped run not to count, got {entry.ewma_duration_sec}"
+        assert entry.last_statuses == ["failed", "skipped"], f"Unexpected statuses: {entry.last_statuses}"
+
+    def test_keeps_the_last_statuses(self, tmp_path: Path) -> None:
+        with HistoryStore(path=tmp_path / "history.sqlite3", statuses_kept=3) as store:
+            for status in ("failed", "passed", "xfailed", "failed-skipped"):
+                store.update([("test_foo", status, 1.0)])
+            entry = store.get("test_foo")
+        assert entry.last_statuses == ["passed", "xfailed", "failed-skipped"], f"Got {entry.last_statuses}"
+
+    def test_persists_and_indexes(self, tmp_path: Path) -> None:
+        path = tmp_path / "history.sqlite3"
+        with HistoryStore(path=path) as store:
+            store.update([("test_foo", ExecutionStatus.FAILED, 1.0), ("test_bar", ExecutionStatus.PASSED, 2.0)])
+            store.update([("test_baz", ExecutionStatus.COLLECTED, None)])  # not run, ignored
+        assert is_history_store(path), "Expected the store to be detected from its magic bytes"
+        with HistoryStore(path=path) as store:
+            index = store.load_index()
+            assert len(store) == 2, f"Expected 2 tests, got {len(store)}"
+            assert set(store.get_all()) == {"test_foo", "test_bar"}, "Expected every stored test"
+        assert index["test_foo"].failed and not index["test_bar"].failed, f"Unexpected index: {index}"
+        assert index["test_bar"].duration_sec == 2.0, f"Unexpected index: {index}"
+
+    def test_cached_pass_recorded_as_an_untimed_pass(self, tmp_path: Path) -> None:
+        with HistoryStore(path=tmp_path / "history.sqlite3") as store:
+            store.update([("test_a.py::test_foo", ExecutionStatus.PASSED, 2.0)])
+            store.update([("test_a.py::test_foo", ExecutionStatus.CACHED_PASS, 0.0)])
+            entry = store.get("test_a.py::test_foo")
+        assert entry.run_count == 2 and entry.last_statuses == ["passed", "passed"], f"Unexpected entry: {entry}"
+        assert entry.ewma_duration_sec == 2.0, f"Expected the cached pass not to count, got {entry.ewma_duration_sec}"
+
+    def test_same_named_tests_of_different_files_kept_apart(self, tmp_path: Path) -> None:
+        with HistoryStore(path=tmp_path / "history.sqlite3") as store:
+            store.update([("test_a.py::test_foo", ExecutionStatus.PASSED, 1.0), ("test_b.py::test_foo", "failed", 9.0)])
+            index = store.load_index()
+        assert index["test_a.py::test_foo"].duration_sec == 1.0, f"Unexpected index: {index}"
+        assert index["test_b.py::test_foo"].failed, f"Unexpected index: {index}"
+
+    def test_store_of_another_version_is_started_over(self, tmp_path: Path) -> None:
+        path = tmp_path / "history.sqlite3"
+        with sqlite3.connect(path) as connection:
+            connection.execute("CREATE TABLE test_history (test_full_name TEXT PRIMARY KEY)")
+            connection.execute("INSERT INTO test_history VALUES ('test_foo')")
+        connection.close()
+        with HistoryStore(path=path) as store:
+            store.update([("test_a.py::test_foo", ExecutionStatus.PASSED, 1.0)])
+            assert list(store.get_all()) == ["test_a.py::test_foo"], "Expected the rows keyed by name dropped"
+
+    def test_plain_file_is_not_a_store(self, tmp_path: Path) -> None:
+        path = tmp_path / "test_results.json"
+        path.write_text("{}", encoding="utf-8")
+        assert not is_history_store(path), "Expected a JSON file not to be a store"
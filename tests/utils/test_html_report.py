@@ -0,0 +1,57 @@
+import json
+import re
+
+from pytest_plugins.models import ExecutionStatus, TestData
+from pytest_plugins.utils.html_report import HTML_COLUMNS, iter_html_report
+
+
+def _embedded_data(page: str) -> dict:
+    match = re.search(r'<script id="better-report-data" type="application/json">(.*?)</script>', page, re.DOTALL)
+    assert match, "Expected the embedded results"
+    return json.loads(match.group(1))
+
+
+def _make_test_entry(test_full_name: str = "test_foo", **kwargs: object) -> dict:
+    return {
+        "test_full_name": test_full_name,
+        "test_file_name": "test_a.py",
+        "test_status": "passed",
+        "test_duration_sec": 1.23456789,
+        "exception_message": None,
+    } | kwargs
+
+
+class TestIterHtmlReport:
+    def test_rows_embedded_as_compact_json(self) -> None:
+        page = "".join(iter_html_report(report={"t1": _make_test_entry(), "t2": _make_test_entry("test_bar")}))
+        data = _embedded_data(page)
+        assert data["columns"] == list(HTML_COLUMNS), f"Unexpected columns: {data['columns']}"
+        assert [row[1] for row in data["rows"]] == ["test_foo", "test_bar"], "Expected a row per test in run order"
+        assert data["rows"][0][HTML_COLUMNS.index("duration")] == 1.2346, "Expected the duration rounded"
+
+    def test_test_data_and_markers(self) -> None:
+        test_data = TestData(
+            test_file_name="test_a.py",
+            class_test_name="TestA",
+            test_name="test_foo",
+            pytest_test_name="test_foo",
+            test_full_name="test_a.py::TestA::test_foo",
+            test_full_path="tests/test_a.py::TestA::test_foo",
+            test_status=ExecutionStatus.FAILED,
+            test_markers=["slow"],
+            exception_message={"message": "boom"},
+        )
+        [row] = _embedded_data("".join(iter_html_report(report=[test_data])))["rows"]
+        assert row[HTML_COLUMNS.index("status")] == "failed", f"Unexpected row: {row}"
+        assert row[HTML_COLUMNS.index("markers")] == ["slow"] and row[HTML_COLUMNS.index("message")] == "boom", row
+
+    def test_script_end_in_a_message_is_escaped(self) -> None:
+        entry = _make_test_entry(exception_message={"message": "</script><script>alert(1)</script>"})
+        page = "".join(iter_html_report(report=[entry]))
+        assert page.count("</script>") == 2, "Expected only the data and the page scripts to be closed"
+        assert _embedded_data(page)["rows"][0][-1] == "</script><script>alert(1)</script>", "Expected the message kept"
+
+    def test_title_escaped(self) -> None:
+        page = "".join(iter_html_report(report=[], title="<Report>"))
+        assert "<title>&lt;Report&gt;</title>" in page, "Expected the title HTML-escaped"
+        assert _embedded_data(page)["rows"] == [], "Expected no rows"
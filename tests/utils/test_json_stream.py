@@ -0,0 +1,37 @@
+import io
+import json
+
+import pytest
+
+from pytest_plugins.utils.json_stream import iter_json_object_items
+
+DATA = {
+    "test_a": {"test_status": "passed", "test_duration_sec": -3.5e-10, "tags": ["x", {"y": []}]},
+    "test_b": {"test_status": "failed", "message": 'quote " and brace } inside'},
+    "test_c": 12345,
+    "test_d": None,
+}
+
+
+class TestIterJsonObjectItems:
+    @pytest.mark.parametrize("indent", [None, 4])
+    @pytest.mark.parametrize("chunk_size", [1, 3, 16, 1 << 20])
+    def test_streams_all_items_for_any_chunk_size(self, indent: int | None, chunk_size: int) -> None:
+        text = json.dumps(DATA, indent=indent)
+        items = list(iter_json_object_items(io.StringIO(text), chunk_size=chunk_size))
+        assert dict(items) == DATA, f"Unexpected items with chunk size {chunk_size}: {items}"
+
+    def test_empty_object(self) -> None:
+        assert not list(iter_json_object_items(io.StringIO(" {\n} "))), "Expected no items"
+
+    def test_yields_lazily(self) -> None:
+        items = iter_json_object_items(io.StringIO('{"a": 1, "b": '), chunk_size=4)
+        assert next(items) == ("a", 1), "Expected the first item before the rest of the file is parsed"
+
+    def test_not_an_object_raises(self) -> None:
+        with pytest.raises(ValueError):
+            list(iter_json_object_items(io.StringIO("[1, 2]")))
+
+    def test_truncated_file_raises(self) -> None:
+        with pytest.raises(ValueError):
+            list(iter_json_object_items(io.StringIO('{"a": {"b": 1'), chunk_size=4))
@@ -0,0 +1,101 @@
+import json
+from pathlib import Path
+
+from pytest_plugins.utils.ndjson import NdjsonWriter, iter_ndjson
+
+
+class TestNdjsonWriter:
+    def test_writes_one_compact_line_per_record(self, tmp_path: Path) -> None:
+        writer = NdjsonWriter(path=tmp_path / "results.ndjson")
+        writer.write(key="a", record={"name": "a", "value": 1})
+        writer.write(key="b", record={"name": "b", "value": 2})
+        writer.close()
+        lines = (tmp_path / "results.ndjson").read_text().splitlines()
+        assert lines == ['{"name":"a","value":1}', '{"name":"b","value":2}'], f"Unexpected lines: {lines}"
+
+    def test_creates_nested_parent_dirs(self, tmp_path: Path) -> None:
+        path = tmp_path / "a" / "b" / "results.ndjson"
+        writer = NdjsonWriter(path=path)
+        writer.write(key="a", record={"status": "passed"})
+        writer.close()
+        assert path.exists(), "Expected file to be created inside nested dirs"
+
+    def test_opens_file_on_first_record(self, tmp_path: Path) -> None:
+        path = tmp_path / "results.ndjson"
+        path.write_text('{"status":"previous run"}\n')
+        writer = NdjsonWriter(path=path)
+        writer.finalize_to_json(path=tmp_path / "results.json")
+        assert path.read_text() == '{"status":"previous run"}\n', "Expected the file untouched without records"
+        writer = NdjsonWriter(path=path)
+        writer.write(key="a", record={"status": "passed"})
+        writer.close()
+        assert path.read_text() == '{"status":"passed"}\n', "Expected the file truncated by the first record"
+
+    def test_finalize_to_json_keys_records_by_name(self, tmp_path: Path) -> None:
+        writer = NdjsonWriter(path=tmp_path / "results.ndjson")
+        writer.write(key="a", record={"status": "passed"})
+        writer.write(key="b", record={"status": "failed"})
+        writer.finalize_to_json(path=tmp_path / "results.json")
+        result = json.loads((tmp_path / "results.json").read_text())
+        assert result == {"a": {"status": "passed"}, "b": {"status": "failed"}}, f"Unexpected result: {result}"
+
+    def test_finalize_to_json_keeps_latest_record_of_a_key(self, tmp_path: Path) -> None:
+        writer = NdjsonWriter(path=tmp_path / "results.ndjson")
+        writer.write(key="a", record={"status": "failed"})
+        writer.write(key="a", record={"status": "passed"})
+        writer.finalize_to_json(path=tmp_path / "results.json")
+        result = json.loads((tmp_path / "results.json").read_text())
+        assert result == {"a": {"status": "passed"}}, f"Expected the rerun record to win, got {result}"
+
+    def test_finalize_to_json_appends_pending_records(self, tmp_path: Path) -> None:
+        writer = NdjsonWriter(path=tmp_path / "results.ndjson")
+        writer.write(key="a", record={"status": "passed"})
+        writer.finalize_to_json(path=tmp_path / "results.json", pending={"b": {"status": "collected"}})
+        result = json.loads((tmp_path / "results.json").read_text())
+        assert result == {"a": {"status": "passed"}, "b": {"status": "collected"}}, f"Unexpected result: {result}"
+
+    def test_finalize_to_json_keeps_given_order(self, tmp_path: Path) -> None:
+        writer = NdjsonWriter(path=tmp_path / "results.ndjson")
+        writer.write(key="c", record={"status": "failed"})
+        writer.write(key="a", record={"status": "passed"})
+        writer.write(key="c", record={"status": "passed"})
+        writer.finalize_to_json(
+            path=tmp_path / "results.json", pending={"b": {"status": "collected"}}, order=["a", "b", "c"]
+        )
+        result = json.loads((tmp_path / "results.json").read_text())
+        assert list(result.items()) == [
+            ("a", {"status": "passed"}),
+            ("b", {"status": "collected"}),
+            ("c", {"status": "passed"}),
+        ], f"Expected the records in the given order: {result}"
+
+    def test_finalize_to_json_with_no_records_writes_empty_object(self, tmp_path: Path) -> None:
+        writer = NdjsonWriter(path=tmp_path / "results.ndjson")
+        writer.finalize_to_json(path=tmp_path / "results.json")
+        assert json.loads((tmp_path / "results.json").read_text()) == {}, "Expected an empty JSON object"
+
+    def test_iter_records_latest_lines_then_pending(self, tmp_path: Path) -> None:
+        writer = NdjsonWriter(path=tmp_path / "results.ndjson")
+        writer.write(key="a", record={"status": "failed"})
+        writer.write(key="b", record={"status": "passed"})
+        writer.write(key="a", record={"status": "passed"})
+        writer.close()
+        records = list(writer.iter_records(pending={"a": "stale", "c": {"status": "collected"}}))
+        assert records == [
+            {"status": "passed"},
+            {"status": "passed"},
+            {"status": "collected"},
+        ], f"Expected the latest record per key, then the pending ones: {records}"
+
+    def test_iter_records_in_given_order(self, tmp_path: Path) -> None:
+        writer = NdjsonWriter(path=tmp_path / "results.ndjson")
+        writer.write(key="b", record={"name": "b"})
+        records = list(writer.iter_records(pending={"a": {"name": "a"}}, order=["a", "b"]))
+        assert records == [{"name": "a"}, {"name": "b"}], f"Expected the records in the given order: {records}"
+
+
+class TestIterNdjson:
+    def test_yields_records_and_skips_blank_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "results.ndjson"
+        path.write_text('{"a": 1}\n\n{"b": 2}\n')
+        assert list(iter_ndjson(path)) == [{"a": 1}, {"b": 2}], "Expected both records, blank line skipped"
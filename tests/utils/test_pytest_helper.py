@@ -1,9 +1,13 @@
 from unittest.mock import MagicMock
 
+import pytest
+
 from pytest_plugins.utils.pytest_helper import (
+    build_test_identity,
     get_pytest_test_name,
     get_test_full_name,
     get_test_full_path,
+    get_test_identity,
     get_test_name_without_parameters,
     get_test_path_without_parameters,
 )
@@ -104,3 +108,29 @@ class TestGetTestFullPath:
         assert (
             get_test_full_path(item) == "tests/test_foo.py::TestClass::test_method"
         ), "Expected full class method path"
+
+
+class TestGetTestIdentity:
+    def test_identity_fields_for_parametrized_test(self) -> None:
+        item = make_item("tests/test_foo.py::TestClass::test_bar[1]", callspec_params={"x": 1})
+        item.stash = pytest.Stash()
+        identity = get_test_identity(item)
+        assert identity.test_name == "TestClass::test_bar", f"Unexpected test_name: {identity.test_name}"
+        assert identity.pytest_test_name == "TestClass::test_bar[1]", f"Unexpected name: {identity.pytest_test_name}"
+        assert identity.test_full_name == get_test_full_name(item), "Expected the same full name as the helper"
+        assert identity.test_full_path == get_test_full_path(item), "Expected the same full path as the helper"
+
+    def test_identity_computed_once_per_item(self) -> None:
+        item = make_item("tests/test_foo.py::test_bar")
+        item.stash = pytest.Stash()
+        first = get_test_identity(item)
+        item.nodeid = "tests/test_foo.py::test_other"
+        assert get_test_identity(item) is first, "Expected the identity cached in the item stash"
+
+    def test_build_identity_refreshes_after_node_id_change(self) -> None:
+        item = make_item("tests/test_foo.py::test_bar[1]", callspec_params={"x": 1})
+        item.stash = pytest.Stash()
+        get_test_identity(item)
+        item.nodeid = "tests/test_foo.py::test_bar['x': 1]"
+        build_test_identity(item)
+        assert get_test_identity(item).pytest_test_name == "test_bar['x': 1]", "Expected the refreshed pytest name"
@@ -0,0 +1,71 @@
+import sqlite3
+from pathlib import Path
+from types import SimpleNamespace
+
+from pytest_plugins.utils.result_cache import CacheKeyBuilder, ResultCache
+
+
+def _item(path: Path) -> SimpleNamespace:
+    return SimpleNamespace(path=path, _fixtureinfo=None)
+
+
+class TestResultCache:
+    def test_adds_passes_and_drops_failures(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache" / "result_cache.sqlite3"
+        with ResultCache(path=path) as cache:
+            cache.update(passed={"a": "test_a", "b": "test_b"}, failed=[], used=[])
+            cache.update(passed={}, failed=["b"], used=[])
+        with ResultCache(path=path) as cache:
+            assert cache.get_keys() == {"a"}, "Expected the failed test to be dropped"
+
+    def test_evicts_the_least_recently_used(self, tmp_path: Path) -> None:
+        with ResultCache(path=tmp_path / "result_cache.sqlite3", max_entries=2) as cache:
+            cache.update(passed={"a": "test_a", "b": "test_b"}, failed=[], used=[])
+            cache.update(passed={}, failed=[], used=["a"])
+            cache.update(passed={"c": "test_c"}, failed=[], used=[])
+            assert cache.get_keys() == {"a", "c"}, f"Expected the least recently used evicted, got {cache.get_keys()}"
+            assert len(cache) == 2, "Expected the cache bounded by max_entries"
+
+    def test_unreadable_store_starts_over(self, tmp_path: Path) -> None:
+        path = tmp_path / "result_cache.sqlite3"
+        path.write_bytes(b"not a database" * 100)
+        with ResultCache(path=path) as cache:
+            assert cache.get_keys() == set(), "Expected an empty cache"
+
+    def test_store_of_another_version_is_dropped(self, tmp_path: Path) -> None:
+        path = tmp_path / "result_cache.sqlite3"
+        with ResultCache(path=path) as cache:
+            cache.update(passed={"a": "test_a"}, failed=[], used=[])
+        with sqlite3.connect(path) as connection:
+            connection.execute("PRAGMA user_version = 0")
+        with ResultCache(path=path) as cache:
+            assert cache.get_keys() == set(), "Expected the entries of another version dropped"
+
+
+class TestCacheKeyBuilder:
+    def test_key_changes_with_the_test_file(self, tmp_path: Path) -> None:
+        test_file = tmp_path / "test_a.py"
+        test_file.write_text("def test_a(): pass\n", encoding="utf-8")
+        key = CacheKeyBuilder(rootpath=tmp_path, environment={}).key(item=_item(test_file), test_full_path="test_a")
+        same = CacheKeyBuilder(rootpath=tmp_path, environment={}).key(item=_item(test_file), test_full_path="test_a")
+        test_file.write_text("def test_a(): assert False\n", encoding="utf-8")
+        changed = CacheKeyBuilder(rootpath=tmp_path, environment={}).key(item=_item(test_file), test_full_path="test_a")
+        assert key == same, "Expected the same key for the same content"
+        assert key != changed, "Expected a new key after the test file changed"
+
+    def test_key_covers_conftests_and_environment(self, tmp_path: Path) -> None:
+        test_file = tmp_path / "sub" / "test_a.py"
+        test_file.parent.mkdir()
+        test_file.write_text("def test_a(): pass\n", encoding="utf-8")
+        conftest = tmp_path / "conftest.py"
+        conftest.write_text("", encoding="utf-8")
+
+        def _key(environment: dict) -> str:
+            return CacheKeyBuilder(rootpath=tmp_path, environment=environment).key(
+                item=_item(test_file), test_full_path="sub/test_a.py::test_a"
+            )
+
+        key = _key({"DB_URL": "a"})
+        assert key != _key({"DB_URL": "b"}), "Expected the environment in the key"
+        conftest.write_text("import os\n", encoding="utf-8")
+        assert key != _key({"DB_URL": "a"}), "Expected the conftest.py above the test in the key"
@@ -0,0 +1,86 @@
+import io
+import json
+from dataclasses import dataclass
+
+import pytest
+
+from pytest_plugins.models import ExecutionStatus
+from pytest_plugins.utils.helper import serialize_data
+from pytest_plugins.utils.serializer import (
+    RECORDS_BATCH_SIZE,
+    JsonSerializer,
+    OrjsonSerializer,
+    get_serializer,
+)
+
+
+@dataclass(slots=True)
+class _Record:
+    name: str
+    status: ExecutionStatus
+
+
+DATA = {"a": _Record(name="a", status=ExecutionStatus.PASSED), "b": {"nested": [1, 2]}}
+EXPECTED = {"a": {"name": "a", "status": "passed"}, "b": {"nested": [1, 2]}}
+
+
+class TestJsonSerializer:
+    def test_pretty_dump_matches_json_dumps_indent(self) -> None:
+        file = io.StringIO()
+        JsonSerializer(pretty=True, default=serialize_data).dump(data=DATA, file=file)
+        assert file.getvalue() == json.dumps(EXPECTED, indent=4), f"Unexpected output: {file.getvalue()}"
+
+    def test_compact_dump_has_no_whitespace(self) -> None:
+        file = io.StringIO()
+        JsonSerializer(pretty=False, default=serialize_data).dump(data=DATA, file=file)
+        assert file.getvalue() == json.dumps(EXPECTED, separators=(",", ":")), f"Unexpected: {file.getvalue()}"
+
+    def test_dump_across_record_batches_matches_json_dumps(self) -> None:
+        data = {f"test_{index}": {"index": index, "tags": ["a", "b"]} for index in range(RECORDS_BATCH_SIZE * 2 + 1)}
+        for pretty, expected in ((True, json.dumps(data, indent=4)), (False, json.dumps(data, separators=(",", ":")))):
+            file = io.StringIO()
+            JsonSerializer(pretty=pretty).dump(data=data, file=file)
+            assert file.getvalue() == expected, f"Unexpected output across batches (pretty={pretty})"
+
+    def test_dataclass_records_converted_across_batches(self) -> None:
+        data = {f"test_{index}": _Record(name=str(index), status=ExecutionStatus.PASSED) for index in range(1001)}
+        file = io.StringIO()
+        JsonSerializer(pretty=False, default=serialize_data).dump(data=data, file=file)
+        result = json.loads(file.getvalue())
+        assert len(result) == len(data), f"Expected every record, got {len(result)}"
+        assert result["test_1000"] == {"name": "1000", "status": "passed"}, f"Unexpected: {result['test_1000']}"
+
+    def test_dump_empty_dict(self) -> None:
+        file = io.StringIO()
+        JsonSerializer(pretty=True).dump(data={}, file=file)
+        assert file.getvalue() == "{}", f"Unexpected output: {file.getvalue()}"
+
+    def test_dumps_is_a_single_compact_line(self) -> None:
+        line = JsonSerializer(pretty=True, default=serialize_data).dumps(DATA["a"])
+        assert line == '{"name":"a","status":"passed"}', f"Unexpected line: {line}"
+
+
+class TestOrjsonSerializer:
+    def test_dump_round_trips(self) -> None:
+        pytest.importorskip("orjson")
+        for pretty in (True, False):
+            file = io.BytesIO()
+            OrjsonSerializer(pretty=pretty, default=serialize_data).dump(data=DATA, file=file)
+            assert json.loads(file.getvalue()) == EXPECTED, f"Unexpected output (pretty={pretty}): {file.getvalue()}"
+
+    def test_dataclasses_go_through_default(self) -> None:
+        pytest.importorskip("orjson")
+        serializer = OrjsonSerializer(default=lambda obj: serialize_data(obj) | {"extra": 1})
+        assert json.loads(serializer.dumps(DATA["a"]))["extra"] == 1, "Expected default to be called for dataclasses"
+
+
+class TestGetSerializer:
+    def test_json_backend(self) -> None:
+        assert isinstance(get_serializer(backend="json"), JsonSerializer), "Expected the stdlib serializer"
+
+    def test_stdlib_is_the_default(self) -> None:
+        assert isinstance(get_serializer(), JsonSerializer), "Expected the stdlib serializer by default"
+
+    def test_auto_backend_prefers_orjson(self) -> None:
+        pytest.importorskip("orjson")
+        assert isinstance(get_serializer(backend="auto"), OrjsonSerializer), "Expected orjson when installed"
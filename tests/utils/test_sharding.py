@@ -0,0 +1,24 @@
+from pytest_plugins.utils.sharding import lpt_partition, shard_totals
+
+
+class TestLptPartition:
+    def test_balances_predicted_durations(self) -> None:
+        durations = [1.0, 8.0, 2.0, 7.0, 3.0, 3.0]
+        assignments = lpt_partition(durations=durations, shard_count=2)
+        _, predicted = shard_totals(durations=durations, assignments=assignments, shard_count=2)
+        assert predicted == [12.0, 12.0], f"Expected equal shards, got {predicted}"
+
+    def test_equal_durations_split_by_count(self) -> None:
+        assignments = lpt_partition(durations=[1.0] * 10, shard_count=3)
+        counts, _ = shard_totals(durations=[1.0] * 10, assignments=assignments, shard_count=3)
+        assert sorted(counts) == [3, 3, 4], f"Expected the tests split by count, got {counts}"
+
+    def test_is_deterministic_with_ties(self) -> None:
+        durations = [2.0, 1.0, 2.0, 1.0, 2.0]
+        assert lpt_partition(durations, 2) == lpt_partition(list(durations), 2), "Expected the same plan every time"
+        assert lpt_partition(durations, 2)[0] == 0, "Expected the first of the ties in the first shard"
+
+    def test_more_shards_than_tests(self) -> None:
+        assignments = lpt_partition(durations=[1.0, 2.0], shard_count=4)
+        counts, _ = shard_totals(durations=[1.0, 2.0], assignments=assignments, shard_count=4)
+        assert counts == [1, 1, 0, 0], f"Expected empty shards, got {counts}"
@@ -0,0 +1,64 @@
+import numpy as np
+
+from pytest_plugins.utils.status_matrix import (
+    MISSING,
+    STATUS_CODES,
+    build_status_matrix,
+    encode_statuses,
+    get_flakiness,
+)
+
+
+def _run(label: str, statuses: dict[str, str]) -> tuple[str, list[str], np.ndarray]:
+    return label, *encode_statuses({name: {"test_status": status} for name, status in statuses.items()})
+
+
+class TestEncodeStatuses:
+    def test_statuses_become_int8_codes(self) -> None:
+        names, codes = encode_statuses({"a": {"test_status": "passed"}, "b": {"test_status": "failed"}})
+        assert names == ["a", "b"], f"Unexpected names: {names}"
+        assert codes.dtype == np.int8, f"Expected int8 codes, got {codes.dtype}"
+        assert codes.tolist() == [STATUS_CODES["passed"], STATUS_CODES["failed"]], f"Unexpected codes: {codes}"
+
+    def test_cached_pass_encoded_as_pass(self) -> None:
+        _, codes = encode_statuses({"a": {"test_status": "passed"}, "b": {"test_status": "cached-pass"}})
+        assert codes[0] == codes[1], f"Expected a cached pass encoded as a pass, got {codes}"
+
+
+class TestBuildStatusMatrix:
+    def test_tests_missing_from_a_run_are_marked_missing(self) -> None:
+        matrix = build_status_matrix([_run("r1", {"a": "passed"}), _run("r2", {"a": "failed", "b": "passed"})])
+        assert matrix.run_labels == ["r1", "r2"], f"Unexpected run labels: {matrix.run_labels}"
+        assert matrix.test_names == ["a", "b"], f"Unexpected test names: {matrix.test_names}"
+        assert matrix.codes.shape == (2, 2), f"Expected a tests x runs matrix, got {matrix.codes.shape}"
+        assert matrix.codes[1, 0] == MISSING, "Expected test b to be missing from the first run"
+
+    def test_no_runs(self) -> None:
+        matrix = build_status_matrix([])
+        assert matrix.codes.shape == (0, 0), f"Expected an empty matrix, got {matrix.codes.shape}"
+        assert not get_flakiness(matrix), "Expected no flakiness results"
+
+
+class TestGetFlakiness:
+    def test_flips_failure_rate_and_changed_runs(self) -> None:
+        matrix = build_status_matrix(
+            [
+                _run("r1", {"flaky": "passed", "stable": "passed"}),
+                _run("r2", {"flaky": "failed", "stable": "passed"}),
+                _run("r3", {"flaky": "passed", "stable": "passed"}),
+            ]
+        )
+        flaky, stable = get_flakiness(matrix)
+        assert (flaky.test_name, flaky.flips) == ("flaky", 2), f"Expected the flaky test first, got {flaky}"
+        assert flaky.changed_in_runs == [2, 3], f"Expected changes in runs #2 and #3, got {flaky}"
+        assert flaky.failure_rate == 1 / 3, f"Expected a 1/3 failure rate, got {flaky}"
+        assert (stable.flips, stable.changed_in_runs) == (0, []), f"Expected a stable test, got {stable}"
+
+    def test_missing_runs_are_skipped(self) -> None:
+        matrix = build_status_matrix(
+            [_run("r1", {"a": "failed"}), _run("r2", {}), _run("r3", {"a": "passed"}), _run("r4", {"a": "passed"})]
+        )
+        (result,) = get_flakiness(matrix)
+        assert result.flips == 1, f"Expected one flip across the missing run, got {result}"
+        assert result.changed_in_runs == [3], f"Expected the change in run #3, got {result}"
+        assert result.failure_rate == 1 / 3, f"Expected the rate over the runs that have the test, got {result}"